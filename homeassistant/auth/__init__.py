@@ -8,7 +8,11 @@ from typing import Any, Dict, List, Optional, Tuple, cast
 import jwt
 
 from homeassistant import data_entry_flow
-from homeassistant.auth.const import ACCESS_TOKEN_EXPIRATION
+from homeassistant.auth.const import (
+    ACCESS_TOKEN_CACHE_EXPIRATION,
+    ACCESS_TOKEN_CACHE_SIZE,
+    ACCESS_TOKEN_EXPIRATION,
+)
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.util import dt as dt_util
 
@@ -146,6 +150,10 @@ class AuthManager:
         self._providers = providers
         self._mfa_modules = mfa_modules
         self.login_flow = AuthManagerFlowManager(hass, self)
+        # Verified access tokens -> refresh token id and timestamp to verify again
+        self._verified_access_tokens: "OrderedDict[str, Tuple[str, float]]" = (
+            OrderedDict()
+        )
 
     @property
     def auth_providers(self) -> List[AuthProvider]:
@@ -453,7 +461,25 @@ class AuthManager:
     async def async_validate_access_token(
         self, token: str
     ) -> Optional[models.RefreshToken]:
-        """Return refresh token if an access token is valid."""
+        """Return refresh token if an access token is valid.
+
+        Verified access tokens are remembered for a short time so they don't
+        need to be decoded again. Their refresh token and user are checked on
+        every call.
+        """
+        cached = self._verified_access_tokens.get(token)
+
+        if cached is not None:
+            refresh_token_id, verify_at = cached
+
+            if dt_util.utcnow().timestamp() < verify_at:
+                refresh_token = await self.async_get_refresh_token(refresh_token_id)
+
+                if refresh_token is not None and refresh_token.user.is_active:
+                    return refresh_token
+
+            self._verified_access_tokens.pop(token, None)
+
         try:
             unverif_claims = jwt.decode(token, verify=False)
         except jwt.InvalidTokenError:
@@ -478,6 +504,19 @@ class AuthManager:
         if refresh_token is None or not refresh_token.user.is_active:
             return None
 
+        expires = unverif_claims.get("exp")
+
+        if isinstance(expires, (int, float)):
+            self._verified_access_tokens[token] = (
+                refresh_token.id,
+                min(
+                    expires,
+                    (dt_util.utcnow() + ACCESS_TOKEN_CACHE_EXPIRATION).timestamp(),
+                ),
+            )
+            if len(self._verified_access_tokens) > ACCESS_TOKEN_CACHE_SIZE:
+                self._verified_access_tokens.popitem(last=False)
+
         return refresh_token
 
     @callback
@@ -2,6 +2,9 @@
 from datetime import timedelta
 
 ACCESS_TOKEN_EXPIRATION = timedelta(minutes=30)
+# Verified access tokens are remembered at most this long
+ACCESS_TOKEN_CACHE_EXPIRATION = timedelta(minutes=5)
+ACCESS_TOKEN_CACHE_SIZE = 256
 MFA_SESSION_EXPIRATION = timedelta(minutes=5)
 
 GROUP_ID_ADMIN = "system-admin"
@@ -1,6 +1,6 @@
 """Permissions for Home Assistant."""
 import logging
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Dict, Optional, Tuple, cast
 
 import voluptuous as vol
 
@@ -13,6 +13,9 @@ from .util import test_all
 
 POLICY_SCHEMA = vol.Schema({vol.Optional(CAT_ENTITIES): ENTITY_POLICY_SCHEMA})
 
+# Number of entities to remember the checks of per permissions object
+ENTITY_MEMO_SIZE = 10000
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -45,7 +48,36 @@ class PolicyPermissions(AbstractPermissions):
     def __init__(self, policy: PolicyType, perm_lookup: PermissionLookup) -> None:
         """Initialize the permission class."""
         self._policy = policy
-        self._perm_lookup = perm_lookup
+        # Permissions are created without a lookup for policies that need none
+        self._perm_lookup: Optional[PermissionLookup] = perm_lookup
+        self._entity_memo: Dict[str, Dict[str, bool]] = {}
+        self._entity_memo_version: Optional[Tuple[int, int]] = None
+
+    def check_entity(self, entity_id: str, key: str) -> bool:
+        """Check if we can access entity.
+
+        Checks are remembered until the entity or device registry changes.
+        The registries are compared when checking, so a check never uses a
+        result from before a change that was not announced yet.
+        """
+        version = (
+            None if self._perm_lookup is None else self._perm_lookup.registry_version
+        )
+
+        if version != self._entity_memo_version or (
+            len(self._entity_memo) >= ENTITY_MEMO_SIZE
+            and entity_id not in self._entity_memo
+        ):
+            self._entity_memo = {}
+            self._entity_memo_version = version
+
+        allowed = self._entity_memo.setdefault(entity_id, {})
+        result = allowed.get(key)
+
+        if result is None:
+            result = allowed[key] = super().check_entity(entity_id, key)
+
+        return result
 
     def access_all_entities(self, key: str) -> bool:
         """Check if we have a certain access to all entities."""
@@ -53,7 +85,9 @@ class PolicyPermissions(AbstractPermissions):
 
     def _entity_func(self) -> Callable[[str, str], bool]:
         """Return a function that can test entity access."""
-        return compile_entities(self._policy.get(CAT_ENTITIES), self._perm_lookup)
+        return compile_entities(
+            self._policy.get(CAT_ENTITIES), cast(PermissionLookup, self._perm_lookup)
+        )
 
     def __eq__(self, other: Any) -> bool:
         """Equals check."""
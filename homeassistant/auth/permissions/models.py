@@ -1,5 +1,5 @@
 """Models for permissions."""
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Tuple
 
 import attr
 
@@ -15,3 +15,11 @@ class PermissionLookup:
 
     entity_registry = attr.ib(type="ent_reg.EntityRegistry")
     device_registry = attr.ib(type="dev_reg.DeviceRegistry")
+
+    @property
+    def registry_version(self) -> Tuple[int, int]:
+        """Return a version that changes whenever the registries change."""
+        return (
+            self.entity_registry.entities.version,
+            self.device_registry.devices.version,
+        )
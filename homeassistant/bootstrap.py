@@ -21,10 +21,13 @@ from homeassistant.const import (
     REQUIRED_NEXT_PYTHON_VER,
 )
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.json import JSONEncoder
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.setup import (
     DATA_SETUP,
     DATA_SETUP_STARTED,
+    async_finish_setup_timeline,
+    async_get_setup_timeline,
     async_set_domains_to_be_loaded,
     async_setup_component,
 )
@@ -44,6 +47,9 @@ DATA_LOGGING = "logging"
 
 LOG_SLOW_STARTUP_INTERVAL = 60
 
+SETUP_TIMELINE_STORAGE_KEY = "core.setup_timeline"
+SETUP_TIMELINE_STORAGE_VERSION = 1
+
 DEBUGGER_INTEGRATIONS = {"debugpy", "ptvsd"}
 CORE_INTEGRATIONS = ("homeassistant", "persistent_notification")
 LOGGING_INTEGRATIONS = {
@@ -517,3 +523,10 @@ async def _async_set_up_integrations(
     # Wrap up startup
     _LOGGER.debug("Waiting for startup to wrap up")
     await hass.async_block_till_done()
+
+    # Keep the setup timeline of this startup to find slow integrations
+    async_finish_setup_timeline(hass)
+    store = hass.helpers.storage.Store(
+        SETUP_TIMELINE_STORAGE_VERSION, SETUP_TIMELINE_STORAGE_KEY, encoder=JSONEncoder
+    )
+    await store.async_save(async_get_setup_timeline(hass))
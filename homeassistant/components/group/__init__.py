@@ -1,7 +1,7 @@
 """Provide the functionality to group entities."""
 import asyncio
 import logging
-from typing import Any, Iterable, List, Optional, cast
+from typing import Any, Dict, Iterable, List, Optional, Tuple, cast
 
 import voluptuous as vol
 
@@ -39,6 +39,7 @@ from homeassistant.loader import bind_hass
 # mypy: allow-untyped-calls, allow-untyped-defs, no-check-untyped-defs
 
 DOMAIN = "group"
+DATA_EXPANDED_GROUPS = "group_expanded"
 
 ENTITY_ID_FORMAT = DOMAIN + ".{}"
 
@@ -121,7 +122,7 @@ def expand_entity_ids(hass: HomeAssistantType, entity_ids: Iterable[Any]) -> Lis
 
     Async friendly.
     """
-    found_ids: List[str] = []
+    found_ids: Dict[str, None] = {}
     for entity_id in entity_ids:
         if not isinstance(entity_id, str) or entity_id in (
             ENTITY_MATCH_NONE,
@@ -136,25 +137,79 @@ def expand_entity_ids(hass: HomeAssistantType, entity_ids: Iterable[Any]) -> Lis
             domain, _ = ha.split_entity_id(entity_id)
 
             if domain == DOMAIN:
-                child_entities = get_entity_ids(hass, entity_id)
-                if entity_id in child_entities:
-                    child_entities = list(child_entities)
-                    child_entities.remove(entity_id)
-                found_ids.extend(
-                    ent_id
-                    for ent_id in expand_entity_ids(hass, child_entities)
-                    if ent_id not in found_ids
-                )
+                for ent_id in _get_expanded_group(hass, entity_id):
+                    found_ids.setdefault(ent_id)
 
             else:
-                if entity_id not in found_ids:
-                    found_ids.append(entity_id)
+                found_ids.setdefault(entity_id)
 
         except AttributeError:
             # Raised by split_entity_id if entity_id is not a string
             pass
 
-    return found_ids
+    return list(found_ids)
+
+
+def _get_expanded_group(hass: HomeAssistantType, entity_id: str) -> Tuple[str, ...]:
+    """Return the members of a group with the nested groups expanded.
+
+    Expanded groups are cached together with the member lists of the groups
+    that were expanded. The cache is used as long as none of these member
+    lists changed.
+    """
+    cache: Dict[str, Tuple[Dict[str, Any], Tuple[str, ...]]] = hass.data.setdefault(
+        DATA_EXPANDED_GROUPS, {}
+    )
+    cached = cache.get(entity_id)
+
+    if cached is not None and all(
+        _get_group_members(hass, group_id) is members
+        or _get_group_members(hass, group_id) == members
+        for group_id, members in cached[0].items()
+    ):
+        return cached[1]
+
+    members_by_group: Dict[str, Any] = {}
+    found_ids: Dict[str, None] = {}
+    _expand_group(hass, entity_id, members_by_group, found_ids)
+    expanded = tuple(found_ids)
+    cache[entity_id] = (members_by_group, expanded)
+    return expanded
+
+
+def _expand_group(
+    hass: HomeAssistantType,
+    entity_id: str,
+    members_by_group: Dict[str, Any],
+    found_ids: Dict[str, None],
+) -> None:
+    """Add the members of a group and its nested groups to the found ids."""
+    members = members_by_group[entity_id] = _get_group_members(hass, entity_id)
+
+    for member in members or ():
+        if not isinstance(member, str) or member in (
+            ENTITY_MATCH_NONE,
+            ENTITY_MATCH_ALL,
+        ):
+            continue
+
+        member = member.lower()
+
+        if ha.split_entity_id(member)[0] != DOMAIN:
+            found_ids.setdefault(member)
+        elif member not in members_by_group:
+            # Groups that contain themselves or are already expanded are skipped
+            _expand_group(hass, member, members_by_group, found_ids)
+
+
+def _get_group_members(hass: HomeAssistantType, entity_id: str) -> Any:
+    """Return the member list of a group as stored in its state."""
+    group = hass.states.get(entity_id)
+
+    if group is None:
+        return None
+
+    return group.attributes.get(ATTR_ENTITY_ID)
 
 
 @bind_hass
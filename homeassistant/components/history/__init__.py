@@ -1,8 +1,7 @@
 """Provide pre-made queries on top of the recorder component."""
 from collections import defaultdict
-from datetime import timedelta
+from datetime import datetime as dt, timedelta
 from itertools import groupby
-import json
 import logging
 import time
 from typing import Optional, cast
@@ -15,10 +14,17 @@ import voluptuous as vol
 from homeassistant.components import recorder
 from homeassistant.components.http import HomeAssistantView
 from homeassistant.components.recorder.models import (
+    StateAttributes,
     States,
+    decode_attributes,
     process_timestamp,
     process_timestamp_to_utc_isoformat,
 )
+from homeassistant.components.recorder.statistics import (
+    PERIOD_DAY,
+    PERIOD_HOUR,
+    statistics_during_period,
+)
 from homeassistant.components.recorder.util import execute, session_scope
 from homeassistant.const import (
     CONF_DOMAINS,
@@ -26,6 +32,8 @@ from homeassistant.const import (
     CONF_EXCLUDE,
     CONF_INCLUDE,
     HTTP_BAD_REQUEST,
+    STATE_UNAVAILABLE,
+    STATE_UNKNOWN,
 )
 from homeassistant.core import Context, State, split_entity_id
 import homeassistant.helpers.config_validation as cv
@@ -40,6 +48,9 @@ CONF_ORDER = "use_include_order"
 
 STATE_KEY = "state"
 LAST_CHANGED_KEY = "last_changed"
+MIN_KEY = "min"
+MAX_KEY = "max"
+MEAN_KEY = "mean"
 
 # Not reusing from entityfilter because history does not support glob filtering
 _FILTER_SCHEMA_INNER = vol.Schema(
@@ -62,6 +73,8 @@ _FILTER_SCHEMA = vol.Schema(
 
 CONFIG_SCHEMA = vol.Schema({DOMAIN: _FILTER_SCHEMA}, extra=vol.ALLOW_EXTRA)
 
+_POSITIVE_INT = vol.All(vol.Coerce(int), vol.Range(min=1))
+
 SIGNIFICANT_DOMAINS = (
     "climate",
     "device_tracker",
@@ -85,12 +98,23 @@ QUERY_STATES = [
     States.entity_id,
     States.state,
     States.attributes,
+    StateAttributes.shared_attrs,
     States.last_changed,
     States.last_updated,
 ]
 
 HISTORY_BAKERY = "history_bakery"
 
+# Number of rows fetched at once when streaming the history
+STREAM_BATCH_SIZE = 1000
+
+
+def _query_states(session):
+    """Query the states with their shared attributes."""
+    return session.query(*QUERY_STATES).outerjoin(
+        StateAttributes, States.attributes_id == StateAttributes.attributes_id
+    )
+
 
 def get_significant_states(hass, *args, **kwargs):
     """Wrap _get_significant_states with a sql session."""
@@ -108,6 +132,8 @@ def _get_significant_states(
     include_start_time_state=True,
     significant_changes_only=True,
     minimal_response=False,
+    bucket_size=None,
+    max_points=None,
 ):
     """
     Return states changes during UTC period start_time - end_time.
@@ -115,12 +141,70 @@ def _get_significant_states(
     Significant states are all states where there is a state change,
     as well as all states from certain domains (for instance
     thermostat so that we get current temperature in our graphs).
+
+    Numeric states are aggregated into buckets of bucket_size, or into
+    at most max_points buckets per entity, when either is given.
     """
     timer_start = time.perf_counter()
+    states = execute(
+        _significant_states_query(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            filters,
+            significant_changes_only,
+        )
+    )
+
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        elapsed = time.perf_counter() - timer_start
+        _LOGGER.debug("get_significant_states took %fs", elapsed)
+
+    return _sorted_states_to_json(
+        hass,
+        session,
+        states,
+        start_time,
+        entity_ids,
+        filters,
+        include_start_time_state,
+        minimal_response,
+        _aggregation_bucket_size(start_time, end_time, bucket_size, max_points),
+    )
 
-    baked_query = hass.data[HISTORY_BAKERY](
-        lambda session: session.query(*QUERY_STATES)
+
+def _aggregation_bucket_size(
+    start_time: dt,
+    end_time: Optional[dt],
+    bucket_size: Optional[timedelta] = None,
+    max_points: Optional[int] = None,
+) -> Optional[timedelta]:
+    """Return the size of the aggregation buckets, None to not aggregate."""
+    if max_points is None:
+        return bucket_size
+
+    points_bucket_size: timedelta = max(
+        ((end_time or dt_util.utcnow()) - start_time) / max_points,
+        timedelta(seconds=1),
     )
+    if bucket_size is None or points_bucket_size > bucket_size:
+        return points_bucket_size
+    return bucket_size
+
+
+def _significant_states_query(
+    hass,
+    session,
+    start_time,
+    end_time=None,
+    entity_ids=None,
+    filters=None,
+    significant_changes_only=True,
+):
+    """Build the query for the significant states, sorted by entity_id."""
+    baked_query = hass.data[HISTORY_BAKERY](_query_states)
 
     if significant_changes_only:
         baked_query += lambda q: q.filter(
@@ -141,34 +225,15 @@ def _get_significant_states(
 
     baked_query += lambda q: q.order_by(States.entity_id, States.last_updated)
 
-    states = execute(
-        baked_query(session).params(
-            start_time=start_time, end_time=end_time, entity_ids=entity_ids
-        )
-    )
-
-    if _LOGGER.isEnabledFor(logging.DEBUG):
-        elapsed = time.perf_counter() - timer_start
-        _LOGGER.debug("get_significant_states took %fs", elapsed)
-
-    return _sorted_states_to_json(
-        hass,
-        session,
-        states,
-        start_time,
-        entity_ids,
-        filters,
-        include_start_time_state,
-        minimal_response,
+    return baked_query(session).params(
+        start_time=start_time, end_time=end_time, entity_ids=entity_ids
     )
 
 
 def state_changes_during_period(hass, start_time, end_time=None, entity_id=None):
     """Return states changes during UTC period start_time - end_time."""
     with session_scope(hass=hass) as session:
-        baked_query = hass.data[HISTORY_BAKERY](
-            lambda session: session.query(*QUERY_STATES)
-        )
+        baked_query = hass.data[HISTORY_BAKERY](_query_states)
 
         baked_query += lambda q: q.filter(
             (States.last_changed == States.last_updated)
@@ -181,7 +246,9 @@ def state_changes_during_period(hass, start_time, end_time=None, entity_id=None)
             )
 
         if entity_id is not None:
-            baked_query += lambda q: q.filter_by(entity_id=bindparam("entity_id"))
+            baked_query += lambda q: q.filter(
+                States.entity_id == bindparam("entity_id")
+            )
             entity_id = entity_id.lower()
 
         baked_query += lambda q: q.order_by(States.entity_id, States.last_updated)
@@ -202,13 +269,13 @@ def get_last_state_changes(hass, number_of_states, entity_id):
     start_time = dt_util.utcnow()
 
     with session_scope(hass=hass) as session:
-        baked_query = hass.data[HISTORY_BAKERY](
-            lambda session: session.query(*QUERY_STATES)
-        )
+        baked_query = hass.data[HISTORY_BAKERY](_query_states)
         baked_query += lambda q: q.filter(States.last_changed == States.last_updated)
 
         if entity_id is not None:
-            baked_query += lambda q: q.filter_by(entity_id=bindparam("entity_id"))
+            baked_query += lambda q: q.filter(
+                States.entity_id == bindparam("entity_id")
+            )
             entity_id = entity_id.lower()
 
         baked_query += lambda q: q.order_by(
@@ -269,7 +336,7 @@ def _get_states_with_session(
     # We have more than one entity to look at (most commonly we want
     # all entities,) so we need to do a search on all states since the
     # last recorder run started.
-    query = session.query(*QUERY_STATES)
+    query = _query_states(session)
 
     most_recent_states_by_date = session.query(
         States.entity_id.label("max_entity_id"),
@@ -312,9 +379,7 @@ def _get_states_with_session(
 def _get_single_entity_states_with_session(hass, session, utc_point_in_time, entity_id):
     # Use an entirely different (and extremely fast) query if we only
     # have a single entity id
-    baked_query = hass.data[HISTORY_BAKERY](
-        lambda session: session.query(*QUERY_STATES)
-    )
+    baked_query = hass.data[HISTORY_BAKERY](_query_states)
     baked_query += lambda q: q.filter(
         States.last_updated < bindparam("utc_point_in_time"),
         States.entity_id == bindparam("entity_id"),
@@ -338,6 +403,7 @@ def _sorted_states_to_json(
     filters=None,
     include_start_time_state=True,
     minimal_response=False,
+    bucket_size=None,
 ):
     """Convert SQL results into JSON friendly data structure.
 
@@ -349,6 +415,9 @@ def _sorted_states_to_json(
     We also need to go back and create a synthetic zero data point for
     each list of states, otherwise our graphs won't start on the Y
     axis correctly.
+
+    When a bucket_size is given, numeric states are aggregated into one
+    data point per bucket.
     """
     result = defaultdict(list)
     # Set all entity IDs to empty lists in result set to maintain the order
@@ -357,75 +426,183 @@ def _sorted_states_to_json(
             result[ent_id] = []
 
     # Get the states at the start time
-    timer_start = time.perf_counter()
     if include_start_time_state:
-        run = recorder.run_information_from_instance(hass, start_time)
-        for state in _get_states_with_session(
-            hass, session, start_time, entity_ids, run=run, filters=filters
+        for state in _get_start_time_states(
+            hass, session, start_time, entity_ids, filters
         ):
-            state.last_changed = start_time
-            state.last_updated = start_time
             result[state.entity_id].append(state)
 
+    # Append all changes to it
+    for ent_id, group in groupby(states, lambda state: state.entity_id):
+        _append_entity_states(
+            result[ent_id], ent_id, group, minimal_response, start_time, bucket_size
+        )
+
+    # Filter out the empty lists if some states had 0 results.
+    return {key: val for key, val in result.items() if val}
+
+
+def _iter_sorted_states(
+    hass,
+    session,
+    states,
+    start_time,
+    entity_ids,
+    filters=None,
+    include_start_time_state=True,
+    minimal_response=False,
+    bucket_size=None,
+):
+    """Yield the list of states of each entity from sorted SQL results.
+
+    Produces the same lists as _sorted_states_to_json, one entity at a
+    time in the order of the results, so the results can be consumed
+    while they are being fetched. Entities that only have a state at
+    the start time come last.
+    """
+    start_time_states = {}
+    if include_start_time_state:
+        for state in _get_start_time_states(
+            hass, session, start_time, entity_ids, filters
+        ):
+            start_time_states[state.entity_id] = [state]
+
+    for ent_id, group in groupby(states, lambda state: state.entity_id):
+        ent_results = start_time_states.pop(ent_id, [])
+        _append_entity_states(
+            ent_results, ent_id, group, minimal_response, start_time, bucket_size
+        )
+        if ent_results:
+            yield ent_results
+
+    yield from start_time_states.values()
+
+
+def _get_start_time_states(hass, session, start_time, entity_ids, filters=None):
+    """Return the states at the start time as synthetic data points."""
+    timer_start = time.perf_counter()
+    run = recorder.run_information_from_instance(hass, start_time)
+    states = _get_states_with_session(
+        hass, session, start_time, entity_ids, run=run, filters=filters
+    )
+    for state in states:
+        state.last_changed = start_time
+        state.last_updated = start_time
+
     if _LOGGER.isEnabledFor(logging.DEBUG):
         elapsed = time.perf_counter() - timer_start
-        _LOGGER.debug("getting %d first datapoints took %fs", len(result), elapsed)
+        _LOGGER.debug("getting %d first datapoints took %fs", len(states), elapsed)
+
+    return states
+
+
+def _append_entity_states(
+    ent_results, ent_id, group, minimal_response, start_time=None, bucket_size=None
+):
+    """Append the sorted SQL results of one entity to its list of states."""
+    if bucket_size is not None:
+        group = list(group)
+        if _append_aggregated_states(ent_results, group, start_time, bucket_size):
+            return
+        group = iter(group)
+
+    domain = split_entity_id(ent_id)[0]
+    if not minimal_response or domain in NEED_ATTRIBUTE_DOMAINS:
+        if domain == SCRIPT_DOMAIN:
+            ent_results.extend(
+                [
+                    native_state
+                    for native_state in (LazyState(db_state) for db_state in group)
+                    if native_state.attributes.get(ATTR_CAN_CANCEL)
+                ]
+            )
+        else:
+            ent_results.extend(LazyState(db_state) for db_state in group)
+        return
 
     # Called in a tight loop so cache the function
     # here
     _process_timestamp_to_utc_isoformat = process_timestamp_to_utc_isoformat
 
-    # Append all changes to it
-    for ent_id, group in groupby(states, lambda state: state.entity_id):
-        domain = split_entity_id(ent_id)[0]
-        ent_results = result[ent_id]
-        if not minimal_response or domain in NEED_ATTRIBUTE_DOMAINS:
-            if domain == SCRIPT_DOMAIN:
-                ent_results.extend(
-                    [
-                        native_state
-                        for native_state in (LazyState(db_state) for db_state in group)
-                        if native_state.attributes.get(ATTR_CAN_CANCEL)
-                    ]
-                )
-            else:
-                ent_results.extend(LazyState(db_state) for db_state in group)
+    # With minimal response we only provide a native
+    # State for the first and last response. All the states
+    # in-between only provide the "state" and the
+    # "last_changed".
+    if not ent_results:
+        ent_results.append(LazyState(next(group)))
+
+    prev_state = ent_results[-1]
+    initial_state_count = len(ent_results)
+
+    for db_state in group:
+        # With minimal response we do not care about attribute
+        # changes so we can filter out duplicate states
+        if db_state.state == prev_state.state:
             continue
 
-        # With minimal response we only provide a native
-        # State for the first and last response. All the states
-        # in-between only provide the "state" and the
-        # "last_changed".
-        if not ent_results:
-            ent_results.append(LazyState(next(group)))
-
-        prev_state = ent_results[-1]
-        initial_state_count = len(ent_results)
-
-        for db_state in group:
-            # With minimal response we do not care about attribute
-            # changes so we can filter out duplicate states
-            if db_state.state == prev_state.state:
-                continue
-
-            ent_results.append(
-                {
-                    STATE_KEY: db_state.state,
-                    LAST_CHANGED_KEY: _process_timestamp_to_utc_isoformat(
-                        db_state.last_changed
-                    ),
-                }
-            )
-            prev_state = db_state
+        ent_results.append(
+            {
+                STATE_KEY: db_state.state,
+                LAST_CHANGED_KEY: _process_timestamp_to_utc_isoformat(
+                    db_state.last_changed
+                ),
+            }
+        )
+        prev_state = db_state
 
-        if prev_state and len(ent_results) != initial_state_count:
-            # There was at least one state change
-            # replace the last minimal state with
-            # a full state
-            ent_results[-1] = LazyState(prev_state)
+    if prev_state and len(ent_results) != initial_state_count:
+        # There was at least one state change
+        # replace the last minimal state with
+        # a full state
+        ent_results[-1] = LazyState(prev_state)
 
-    # Filter out the empty lists if some states had 0 results.
-    return {key: val for key, val in result.items() if val}
+
+def _append_aggregated_states(ent_results, db_states, start_time, bucket_size):
+    """Append one data point per bucket for the numeric states of one entity.
+
+    The first data point is a full state, the following ones provide the
+    "state" and the minimum, maximum and mean of the bucket, with the
+    start of the bucket as "last_changed". Unknown and unavailable states
+    are left out. Returns False without appending anything if the entity
+    has other states that are not numeric.
+    """
+    values = []
+    for db_state in db_states:
+        if db_state.state in (STATE_UNKNOWN, STATE_UNAVAILABLE):
+            continue
+        try:
+            values.append((db_state, float(db_state.state)))
+        except ValueError:
+            return False
+
+    if not values:
+        return False
+
+    if not ent_results:
+        ent_results.append(LazyState(values[0][0]))
+
+    start_timestamp = start_time.timestamp()
+    bucket_seconds = bucket_size.total_seconds()
+
+    def bucket_index(value):
+        """Return the index of the bucket of a value."""
+        last_updated = process_timestamp(value[0].last_updated).timestamp()
+        return int((last_updated - start_timestamp) // bucket_seconds)
+
+    for index, bucket in groupby(values, bucket_index):
+        bucket = list(bucket)
+        numbers = [number for _, number in bucket]
+        ent_results.append(
+            {
+                STATE_KEY: bucket[-1][0].state,
+                LAST_CHANGED_KEY: (start_time + index * bucket_size).isoformat(),
+                MIN_KEY: min(numbers),
+                MAX_KEY: max(numbers),
+                MEAN_KEY: sum(numbers) / len(numbers),
+            }
+        )
+
+    return True
 
 
 def get_state(hass, utc_point_in_time, entity_id, run=None):
@@ -445,6 +622,7 @@ async def async_setup(hass, config):
     use_include_order = conf.get(CONF_ORDER)
 
     hass.http.register_view(HistoryPeriodView(filters, use_include_order))
+    hass.http.register_view(HistoryStatisticsView())
     hass.components.frontend.async_register_built_in_panel(
         "history", "history", "hass:poll-box"
     )
@@ -466,7 +644,7 @@ class HistoryPeriodView(HomeAssistantView):
 
     async def get(
         self, request: web.Request, datetime: Optional[str] = None
-    ) -> web.Response:
+    ) -> web.StreamResponse:
         """Return history over a period of time."""
         datetime_ = None
         if datetime:
@@ -505,8 +683,37 @@ class HistoryPeriodView(HomeAssistantView):
 
         minimal_response = "minimal_response" in request.query
 
+        bucket_size = request.query.get("bucket_size")
+        max_points = request.query.get("max_points")
+        try:
+            if bucket_size is not None:
+                bucket_size = timedelta(seconds=_POSITIVE_INT(bucket_size))
+            if max_points is not None:
+                max_points = _POSITIVE_INT(max_points)
+        except vol.Invalid:
+            return self.json_message(
+                "Invalid bucket_size or max_points", HTTP_BAD_REQUEST
+            )
+        bucket_size = _aggregation_bucket_size(
+            start_time, end_time, bucket_size, max_points
+        )
+
         hass = request.app["hass"]
 
+        if not self.use_include_order:
+            return await self.json_stream(
+                request,
+                self._iter_significant_states,
+                hass,
+                start_time,
+                end_time,
+                entity_ids,
+                include_start_time_state,
+                significant_changes_only,
+                minimal_response,
+                bucket_size,
+            )
+
         return cast(
             web.Response,
             await hass.async_add_executor_job(
@@ -518,6 +725,7 @@ class HistoryPeriodView(HomeAssistantView):
                 include_start_time_state,
                 significant_changes_only,
                 minimal_response,
+                bucket_size,
             ),
         )
 
@@ -530,6 +738,7 @@ class HistoryPeriodView(HomeAssistantView):
         include_start_time_state,
         significant_changes_only,
         minimal_response,
+        bucket_size,
     ):
         """Fetch significant stats from the database as json."""
         timer_start = time.perf_counter()
@@ -545,6 +754,7 @@ class HistoryPeriodView(HomeAssistantView):
                 include_start_time_state,
                 significant_changes_only,
                 minimal_response,
+                bucket_size,
             )
 
         result = list(result.values())
@@ -567,6 +777,101 @@ class HistoryPeriodView(HomeAssistantView):
 
         return self.json(result)
 
+    def _iter_significant_states(
+        self,
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        bucket_size,
+    ):
+        """Yield the significant states of each entity from the database.
+
+        The states are fetched in batches and yielded entity by entity,
+        so memory use does not grow with the requested period.
+        """
+        timer_start = time.perf_counter()
+        state_count = 0
+
+        with session_scope(hass=hass) as session:
+            states = _significant_states_query(
+                hass,
+                session,
+                start_time,
+                end_time,
+                entity_ids,
+                self.filters,
+                significant_changes_only,
+            ).with_post_criteria(lambda q: q.yield_per(STREAM_BATCH_SIZE))
+
+            for ent_results in _iter_sorted_states(
+                hass,
+                session,
+                states,
+                start_time,
+                entity_ids,
+                self.filters,
+                include_start_time_state,
+                minimal_response,
+                bucket_size,
+            ):
+                state_count += len(ent_results)
+                yield ent_results
+
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            elapsed = time.perf_counter() - timer_start
+            _LOGGER.debug("Streamed %d states in %fs", state_count, elapsed)
+
+
+class HistoryStatisticsView(HomeAssistantView):
+    """Handle long-term statistics requests."""
+
+    url = "/api/history/statistics"
+    name = "api:history:view-statistics"
+    extra_urls = ["/api/history/statistics/{datetime}"]
+
+    async def get(
+        self, request: web.Request, datetime: Optional[str] = None
+    ) -> web.Response:
+        """Return the hourly or daily statistics over a period of time."""
+        if datetime:
+            start_time = dt_util.parse_datetime(datetime)
+
+            if start_time is None:
+                return self.json_message("Invalid datetime", HTTP_BAD_REQUEST)
+
+            start_time = dt_util.as_utc(start_time)
+        else:
+            start_time = dt_util.utcnow() - timedelta(days=1)
+
+        end_time = request.query.get("end_time")
+        if end_time:
+            end_time = dt_util.parse_datetime(end_time)
+            if end_time is None:
+                return self.json_message("Invalid end_time", HTTP_BAD_REQUEST)
+            end_time = dt_util.as_utc(end_time)
+        else:
+            end_time = None
+
+        entity_ids = request.query.get("filter_entity_id")
+        if entity_ids:
+            entity_ids = entity_ids.lower().split(",")
+        else:
+            entity_ids = None
+
+        period = request.query.get("period", PERIOD_HOUR)
+        if period not in (PERIOD_HOUR, PERIOD_DAY):
+            return self.json_message("Invalid period", HTTP_BAD_REQUEST)
+
+        hass = request.app["hass"]
+        statistics = await hass.async_add_executor_job(
+            statistics_during_period, hass, start_time, end_time, entity_ids, period
+        )
+        return self.json(statistics)
+
 
 def sqlalchemy_filter_from_include_exclude_conf(conf):
     """Build a sql filter from config."""
@@ -591,6 +896,8 @@ class Filters:
         self.excluded_domains = []
         self.included_entities = []
         self.included_domains = []
+        self._entity_filter_key = None
+        self._entity_filter = None
 
     def apply(self, query, entity_ids=None):
         """Apply the include/exclude filter on domains and entities on query.
@@ -637,6 +944,22 @@ class Filters:
             baked_query += lambda q: q.filter(self.entity_filter())
 
     def entity_filter(self):
+        """Return the entity filter query.
+
+        The query is generated once and reused until the filters change.
+        """
+        key = (
+            tuple(self.excluded_entities),
+            tuple(self.excluded_domains),
+            tuple(self.included_entities),
+            tuple(self.included_domains),
+        )
+        if key != self._entity_filter_key:
+            self._entity_filter = self._generate_entity_filter()
+            self._entity_filter_key = key
+        return self._entity_filter
+
+    def _generate_entity_filter(self):
         """Generate the entity filter query."""
         entity_filter = None
         # filter if only excluded domain is configured
@@ -707,7 +1030,9 @@ class LazyState(State):
         """State attributes."""
         if not self._attributes:
             try:
-                self._attributes = json.loads(self._row.attributes)
+                self._attributes = decode_attributes(
+                    self._row.shared_attrs or self._row.attributes
+                )
             except ValueError:
                 # When json.loads fails
                 _LOGGER.exception("Error converting row to state: %s", self)
@@ -777,7 +1102,7 @@ class LazyState(State):
         return {
             "entity_id": self.entity_id,
             "state": self.state,
-            "attributes": self._attributes or self.attributes,
+            "attributes": dict(self._attributes or self.attributes),
             "last_changed": last_changed_isoformat,
             "last_updated": last_updated_isoformat,
         }
@@ -2,7 +2,7 @@
 import asyncio
 import json
 import logging
-from typing import Any, Callable, List, Optional
+from typing import Any, Callable, Iterable, List, Optional
 
 from aiohttp import web
 from aiohttp.typedefs import LooseHeaders
@@ -22,6 +22,9 @@ from .const import KEY_AUTHENTICATED, KEY_HASS, KEY_REAL_IP
 
 _LOGGER = logging.getLogger(__name__)
 
+# Size of the json chunks written out when streaming a response
+STREAM_CHUNK_SIZE = 65536
+
 
 class HomeAssistantView:
     """Base view for all views."""
@@ -62,6 +65,68 @@ class HomeAssistantView:
         response.enable_compression()
         return response
 
+    @staticmethod
+    async def json_stream(
+        request: web.Request, target: Callable[..., Iterable[Any]], *args: Any
+    ) -> web.StreamResponse:
+        """Return a JSON list streamed from the items yielded by target.
+
+        target is iterated in the executor and the items are written out in
+        chunks, so memory use does not grow with the number of items. The
+        response is only started with the first chunk, an error before that
+        still results in an error status. An error after that aborts the
+        connection, so the truncated list can not be taken for a complete one.
+        """
+        hass = request.app[KEY_HASS]
+        response = web.StreamResponse()
+        response.content_type = CONTENT_TYPE_JSON
+        response.enable_compression()
+
+        async def async_write(data: bytes) -> None:
+            """Write data to the response, starting it if needed."""
+            if not response.prepared:
+                await response.prepare(request)
+            await response.write(data)
+
+        def write_items() -> None:
+            """Encode the items and write them out from the event loop."""
+            chunk = ["["]
+            chunk_size = 0
+            first = True
+
+            def write_chunk() -> None:
+                """Write the buffered json to the response."""
+                asyncio.run_coroutine_threadsafe(
+                    async_write("".join(chunk).encode("UTF-8")), hass.loop
+                ).result()
+                chunk.clear()
+
+            for item in target(*args):
+                if not first:
+                    chunk.append(",")
+                first = False
+                encoded = json.dumps(
+                    item, sort_keys=True, cls=JSONEncoder, allow_nan=False
+                )
+                chunk.append(encoded)
+                chunk_size += len(encoded)
+                if chunk_size >= STREAM_CHUNK_SIZE:
+                    write_chunk()
+                    chunk_size = 0
+
+            chunk.append("]")
+            write_chunk()
+
+        try:
+            await hass.async_add_executor_job(write_items)
+        except Exception:
+            if response.prepared and request.transport is not None:
+                request.transport.abort()
+            raise
+
+        await response.write_eof()
+        return response
+
     def json_message(
         self,
         message: str,
@@ -13,7 +13,9 @@ from homeassistant.components.history import sqlalchemy_filter_from_include_excl
 from homeassistant.components.http import HomeAssistantView
 from homeassistant.components.recorder.models import (
     Events,
+    StateAttributes,
     States,
+    decode_attributes,
     process_timestamp,
     process_timestamp_to_utc_isoformat,
 )
@@ -61,6 +63,9 @@ GROUP_BY_MINUTES = 15
 EMPTY_JSON_OBJECT = "{}"
 UNIT_OF_MEASUREMENT_JSON = '"unit_of_measurement":'
 
+# Number of entries of a page when only a cursor is given
+DEFAULT_PAGE_SIZE = 100
+
 CONFIG_SCHEMA = vol.Schema(
     {DOMAIN: INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA}, extra=vol.ALLOW_EXTRA
 )
@@ -186,6 +191,23 @@ class LogbookView(HomeAssistantView):
 
         entity_id = request.query.get("entity")
 
+        limit = request.query.get("limit")
+        cursor = request.query.get("cursor")
+        paginate = limit is not None or cursor is not None
+        if limit is None:
+            limit = DEFAULT_PAGE_SIZE
+        else:
+            try:
+                limit = int(limit)
+            except ValueError:
+                limit = 0
+            if limit < 1:
+                return self.json_message("Invalid limit", HTTP_BAD_REQUEST)
+        if cursor is not None:
+            cursor = _parse_cursor(cursor)
+            if cursor is None:
+                return self.json_message("Invalid cursor", HTTP_BAD_REQUEST)
+
         end_time = request.query.get("end_time")
         if end_time is None:
             start_day = dt_util.as_utc(datetime) - timedelta(days=period - 1)
@@ -198,22 +220,52 @@ class LogbookView(HomeAssistantView):
 
         hass = request.app["hass"]
 
-        def json_events():
-            """Fetch events and generate JSON."""
-            return self.json(
-                _get_events(
+        if paginate:
+            entries, next_cursor = await hass.async_add_executor_job(
+                _get_events_page,
+                hass,
+                start_day,
+                end_day,
+                entity_id,
+                self.filters,
+                self.entities_filter,
+                limit,
+                cursor,
+            )
+            headers = None
+            if next_cursor is not None:
+                next_url = request.rel_url.update_query(cursor=next_cursor)
+                headers = {"Link": f'<{next_url}>; rel="next"'}
+            return self.json(entries, headers=headers)
+
+        return await self.json_stream(
+            request, self._iter_events, hass, start_day, end_day, entity_id
+        )
+
+    def _iter_events(self, hass, start_day, end_day, entity_id):
+        """Yield the logbook entries of a period of time.
+
+        The events are fetched while the entries are yielded, so memory
+        use does not grow with the requested period.
+        """
+        with session_scope(hass=hass) as session:
+            # When all data is schema v8 or later, prev_states can be removed
+            prev_states = {}
+            yield from humanify(
+                hass,
+                _yield_events(
                     hass,
-                    self.config,
+                    session,
                     start_day,
                     end_day,
                     entity_id,
                     self.filters,
                     self.entities_filter,
-                )
+                ),
+                EntityAttributeCache(hass),
+                prev_states,
             )
 
-        return await hass.async_add_job(json_events)
-
 
 def humanify(hass, events, entity_attr_cache, prev_states=None):
     """Generate a converted list of events into Entry objects.
@@ -222,13 +274,17 @@ def humanify(hass, events, entity_attr_cache, prev_states=None):
     - if 2+ sensor updates in GROUP_BY_MINUTES, show last
     - if Home Assistant stop and start happen in same minute call it restarted
     """
+    for _, entry in _humanify(hass, events, entity_attr_cache, prev_states):
+        yield entry
+
+
+def _humanify(hass, events, entity_attr_cache, prev_states=None):
+    """Generate the entries of humanify along with the event of each entry."""
     if prev_states is None:
         prev_states = {}
 
     # Group events in batches of GROUP_BY_MINUTES
-    for _, g_events in groupby(
-        events, lambda event: event.time_fired_minute // GROUP_BY_MINUTES
-    ):
+    for _, g_events in groupby(events, _group_by_minutes):
 
         events_batch = list(g_events)
 
@@ -266,7 +322,7 @@ def humanify(hass, events, entity_attr_cache, prev_states=None):
                 data["when"] = event.time_fired_isoformat
                 data["domain"] = domain
                 data["context_user_id"] = event.context_user_id
-                yield data
+                yield event, data
 
             if event.event_type == EVENT_STATE_CHANGED:
                 entity_id = event.entity_id
@@ -289,7 +345,7 @@ def humanify(hass, events, entity_attr_cache, prev_states=None):
                     entity_id, ATTR_FRIENDLY_NAME, event
                 ) or split_entity_id(entity_id)[1].replace("_", " ")
 
-                yield {
+                yield event, {
                     "when": event.time_fired_isoformat,
                     "name": name,
                     "message": _entry_message_from_event(
@@ -304,7 +360,7 @@ def humanify(hass, events, entity_attr_cache, prev_states=None):
                 if start_stop_events.get(event.time_fired_minute) == 2:
                     continue
 
-                yield {
+                yield event, {
                     "when": event.time_fired_isoformat,
                     "name": "Home Assistant",
                     "message": "started",
@@ -318,7 +374,7 @@ def humanify(hass, events, entity_attr_cache, prev_states=None):
                 else:
                     action = "stopped"
 
-                yield {
+                yield event, {
                     "when": event.time_fired_isoformat,
                     "name": "Home Assistant",
                     "message": action,
@@ -336,7 +392,7 @@ def humanify(hass, events, entity_attr_cache, prev_states=None):
                     except IndexError:
                         pass
 
-                yield {
+                yield event, {
                     "when": event.time_fired_isoformat,
                     "name": event_data.get(ATTR_NAME),
                     "message": event_data.get(ATTR_MESSAGE),
@@ -345,102 +401,207 @@ def humanify(hass, events, entity_attr_cache, prev_states=None):
                 }
 
 
+def _group_by_minutes(event):
+    """Return the key of the batch of GROUP_BY_MINUTES of an event."""
+    return event.time_fired_minute // GROUP_BY_MINUTES
+
+
+def _parse_cursor(cursor):
+    """Return the time fired and id of the event a cursor points to."""
+    time_fired, _, event_id = cursor.rpartition(",")
+    time_fired = dt_util.parse_datetime(time_fired)
+    if time_fired is None or not event_id.isdigit():
+        return None
+    return dt_util.as_utc(time_fired), int(event_id)
+
+
 def _get_events(
     hass, config, start_day, end_day, entity_id=None, filters=None, entities_filter=None
 ):
     """Get events for a period of time."""
-    entity_attr_cache = EntityAttributeCache(hass)
+    with session_scope(hass=hass) as session:
+        # When all data is schema v8 or later, prev_states can be removed
+        prev_states = {}
+        return list(
+            humanify(
+                hass,
+                _yield_events(
+                    hass,
+                    session,
+                    start_day,
+                    end_day,
+                    entity_id,
+                    filters,
+                    entities_filter,
+                ),
+                EntityAttributeCache(hass),
+                prev_states,
+            )
+        )
 
-    def yield_events(query):
-        """Yield Events that are not filtered away."""
-        for row in query.yield_per(1000):
-            event = LazyEventPartialState(row)
-            if _keep_event(hass, event, entities_filter):
-                yield event
+
+def _get_events_page(
+    hass,
+    start_day,
+    end_day,
+    entity_id=None,
+    filters=None,
+    entities_filter=None,
+    limit=DEFAULT_PAGE_SIZE,
+    cursor=None,
+):
+    """Get a page of the events for a period of time.
+
+    Sensor updates are grouped by batches of GROUP_BY_MINUTES the same as
+    without pages, a page is cut between two events once it holds limit
+    entries. Returns the entries and the cursor of the next page, None
+    when there are no more entries.
+    """
+    entries = []
 
     with session_scope(hass=hass) as session:
-        if entity_id is not None:
-            entity_ids = [entity_id.lower()]
-            entities_filter = generate_filter([], entity_ids, [], [])
-            apply_sql_entities_filter = False
-        else:
-            entity_ids = None
-            apply_sql_entities_filter = True
-
-        old_state = aliased(States, name="old_state")
-
-        query = (
-            session.query(
-                Events.event_type,
-                Events.event_data,
-                Events.time_fired,
-                Events.context_user_id,
-                States.state,
-                States.entity_id,
-                States.domain,
-                States.attributes,
+        events = _yield_events(
+            hass,
+            session,
+            start_day,
+            end_day,
+            entity_id,
+            filters,
+            entities_filter,
+            cursor,
+        )
+        last_event = None
+        for event, entry in _humanify(hass, events, EntityAttributeCache(hass), {}):
+            if len(entries) >= limit and event is not last_event:
+                return entries, f"{event.time_fired_isoformat},{event.event_id}"
+            entries.append(entry)
+            last_event = event
+
+    return entries, None
+
+
+def _yield_events(
+    hass,
+    session,
+    start_day,
+    end_day,
+    entity_id=None,
+    filters=None,
+    entities_filter=None,
+    cursor=None,
+):
+    """Yield the events of a period of time that are not filtered away.
+
+    The events are sorted by time fired and id, cursor is the time fired
+    and id of the first event to yield.
+    """
+    if entity_id is not None:
+        entity_ids = [entity_id.lower()]
+        entities_filter = generate_filter([], entity_ids, [], [])
+        apply_sql_entities_filter = False
+    else:
+        entity_ids = None
+        apply_sql_entities_filter = True
+
+    old_state = aliased(States, name="old_state")
+
+    query = (
+        session.query(
+            Events.event_id,
+            Events.event_type,
+            Events.event_data,
+            Events.time_fired,
+            Events.context_user_id,
+            States.state,
+            States.entity_id,
+            States.domain,
+            States.attributes,
+            StateAttributes.shared_attrs,
+        )
+        .order_by(Events.time_fired, Events.event_id)
+        .outerjoin(States, (Events.event_id == States.event_id))
+        .outerjoin(
+            StateAttributes, (States.attributes_id == StateAttributes.attributes_id),
+        )
+        .outerjoin(old_state, (States.old_state_id == old_state.state_id))
+        # The below filter, removes state change events that do not have
+        # and old_state, new_state, or the old and
+        # new state are the same for v8 schema or later.
+        #
+        # If the events/states were stored before v8 schema, we relay on the
+        # prev_states dict to remove them.
+        #
+        # When all data is schema v8 or later, the check for EMPTY_JSON_OBJECT
+        # can be removed.
+        .filter(
+            (Events.event_type != EVENT_STATE_CHANGED)
+            | (Events.event_data != EMPTY_JSON_OBJECT)
+            | (
+                (States.state_id.isnot(None))
+                & (old_state.state_id.isnot(None))
+                & (States.state.isnot(None))
+                & (States.state != old_state.state)
             )
-            .order_by(Events.time_fired)
-            .outerjoin(States, (Events.event_id == States.event_id))
-            .outerjoin(old_state, (States.old_state_id == old_state.state_id))
-            # The below filter, removes state change events that do not have
-            # and old_state, new_state, or the old and
-            # new state are the same for v8 schema or later.
-            #
-            # If the events/states were stored before v8 schema, we relay on the
-            # prev_states dict to remove them.
-            #
-            # When all data is schema v8 or later, the check for EMPTY_JSON_OBJECT
-            # can be removed.
-            .filter(
-                (Events.event_type != EVENT_STATE_CHANGED)
-                | (Events.event_data != EMPTY_JSON_OBJECT)
-                | (
-                    (States.state_id.isnot(None))
-                    & (old_state.state_id.isnot(None))
-                    & (States.state.isnot(None))
-                    & (States.state != old_state.state)
+        )
+        #
+        # Prefilter out continuous domains that have
+        # ATTR_UNIT_OF_MEASUREMENT as its much faster in sql.
+        #
+        # Rows recorded before schema v12 have no has_unit flag; their
+        # attributes are in either the states or the state_attributes
+        # table. When all data is schema v12 or later, the check of the
+        # attributes can be removed.
+        #
+        .filter(
+            (Events.event_type != EVENT_STATE_CHANGED)
+            | sqlalchemy.not_(States.domain.in_(CONTINUOUS_DOMAINS))
+            | (States.has_unit == sqlalchemy.false())
+            | (
+                States.has_unit.is_(None)
+                & sqlalchemy.not_(
+                    sqlalchemy.func.coalesce(
+                        StateAttributes.shared_attrs, States.attributes
+                    ).contains(UNIT_OF_MEASUREMENT_JSON)
                 )
             )
-            #
-            # Prefilter out continuous domains that have
-            # ATTR_UNIT_OF_MEASUREMENT as its much faster in sql.
-            #
-            .filter(
-                (Events.event_type != EVENT_STATE_CHANGED)
-                | sqlalchemy.not_(States.domain.in_(CONTINUOUS_DOMAINS))
-                | sqlalchemy.not_(States.attributes.contains(UNIT_OF_MEASUREMENT_JSON))
-            )
-            .filter(
-                Events.event_type.in_(ALL_EVENT_TYPES + list(hass.data.get(DOMAIN, {})))
-            )
-            .filter((Events.time_fired > start_day) & (Events.time_fired < end_day))
         )
+        .filter(
+            Events.event_type.in_(ALL_EVENT_TYPES + list(hass.data.get(DOMAIN, {})))
+        )
+        .filter((Events.time_fired > start_day) & (Events.time_fired < end_day))
+    )
 
-        if entity_ids:
-            query = query.filter(
-                (
-                    (States.last_updated == States.last_changed)
-                    & States.entity_id.in_(entity_ids)
-                )
-                | (States.state_id.is_(None))
+    if entity_ids:
+        query = query.filter(
+            (
+                (States.last_updated == States.last_changed)
+                & States.entity_id.in_(entity_ids)
             )
-        else:
+            | (States.state_id.is_(None))
+        )
+    else:
+        query = query.filter(
+            (States.last_updated == States.last_changed) | (States.state_id.is_(None))
+        )
+
+    if apply_sql_entities_filter and filters:
+        entity_filter = filters.entity_filter()
+        if entity_filter is not None:
             query = query.filter(
-                (States.last_updated == States.last_changed)
-                | (States.state_id.is_(None))
+                entity_filter | (Events.event_type != EVENT_STATE_CHANGED)
             )
 
-        if apply_sql_entities_filter and filters:
-            entity_filter = filters.entity_filter()
-            if entity_filter is not None:
-                query = query.filter(
-                    entity_filter | (Events.event_type != EVENT_STATE_CHANGED)
-                )
+    if cursor is not None:
+        time_fired, event_id = cursor
+        query = query.filter(
+            (Events.time_fired > time_fired)
+            | ((Events.time_fired == time_fired) & (Events.event_id >= event_id))
+        )
 
-        # When all data is schema v8 or later, prev_states can be removed
-        prev_states = {}
-        return list(humanify(hass, yield_events(query), entity_attr_cache, prev_states))
+    for row in query.yield_per(1000):
+        event = LazyEventPartialState(row)
+        if _keep_event(hass, event, entities_filter):
+            yield event
 
 
 def _keep_event(hass, event, entities_filter):
@@ -586,6 +747,11 @@ class LazyEventPartialState:
         self.state = self._row.state
         self.domain = self._row.domain
 
+    @property
+    def event_id(self):
+        """Id of the event in the database."""
+        return self._row.event_id
+
     @property
     def context_user_id(self):
         """Context user id of event."""
@@ -595,13 +761,11 @@ class LazyEventPartialState:
     def attributes(self):
         """State attributes."""
         if not self._attributes:
-            if (
-                self._row.attributes is None
-                or self._row.attributes == EMPTY_JSON_OBJECT
-            ):
+            attributes = self._row.shared_attrs or self._row.attributes
+            if attributes is None or attributes == EMPTY_JSON_OBJECT:
                 self._attributes = {}
             else:
-                self._attributes = json.loads(self._row.attributes)
+                self._attributes = decode_attributes(attributes)
         return self._attributes
 
     @property
@@ -8,7 +8,7 @@ import logging
 from operator import attrgetter
 import os
 import ssl
-from typing import Any, Callable, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Union
 
 import attr
 import certifi
@@ -625,12 +625,16 @@ class MQTT:
         """Initialize Home Assistant MQTT client."""
         # We don't import on the top because some integrations
         # should be able to optionally rely on MQTT.
-        import paho.mqtt.client as mqtt  # pylint: disable=import-outside-toplevel
+        # pylint: disable=import-outside-toplevel
+        import paho.mqtt.client as mqtt
+        from paho.mqtt.matcher import MQTTMatcher
 
         self.hass = hass
         self.config_entry = config_entry
         self.conf = conf
         self.subscriptions: List[Subscription] = []
+        # Topic filter trie, each node holds the subscriptions for that filter
+        self._matcher = MQTTMatcher()
         self.connected = False
         self._mqttc: mqtt.Client = None
         self._paho_lock = asyncio.Lock()
@@ -791,6 +795,10 @@ class MQTT:
 
         subscription = Subscription(topic, msg_callback, qos, encoding)
         self.subscriptions.append(subscription)
+        try:
+            self._matcher[topic].append(subscription)
+        except KeyError:
+            self._matcher[topic] = [subscription]
 
         # Only subscribe if currently connected.
         if self.connected:
@@ -803,9 +811,12 @@ class MQTT:
                 raise HomeAssistantError("Can't remove subscription twice")
             self.subscriptions.remove(subscription)
 
-            if any(other.topic == topic for other in self.subscriptions):
+            topic_subscriptions = self._matcher[topic]
+            topic_subscriptions.remove(subscription)
+            if topic_subscriptions:
                 # Other subscriptions on topic remaining - don't unsubscribe.
                 return
+            del self._matcher[topic]
 
             # Only unsubscribe if currently connected.
             if self.connected:
@@ -898,12 +909,23 @@ class MQTT:
         )
         timestamp = dt_util.utcnow()
 
-        for subscription in self.subscriptions:
-            if not _match_topic(subscription.topic, msg.topic):
-                continue
+        # Copy the matches as callbacks may unsubscribe while we iterate
+        subscriptions = [
+            subscription
+            for topic_subscriptions in self._matcher.iter_match(msg.topic)
+            for subscription in topic_subscriptions
+        ]
+        # Decode the payload only once per encoding
+        payloads: Dict[Optional[str], Optional[SubscribePayloadType]] = {
+            None: msg.payload
+        }
 
-            payload: SubscribePayloadType = msg.payload
-            if subscription.encoding is not None:
+        for subscription in subscriptions:
+            if subscription.encoding in payloads:
+                payload = payloads[subscription.encoding]
+                if payload is None:
+                    continue
+            else:
                 try:
                     payload = msg.payload.decode(subscription.encoding)
                 except (AttributeError, UnicodeDecodeError):
@@ -914,7 +936,9 @@ class MQTT:
                         subscription.encoding,
                         subscription.callback,
                     )
+                    payloads[subscription.encoding] = None
                     continue
+                payloads[subscription.encoding] = payload
 
             self.hass.async_run_job(
                 subscription.callback,
@@ -951,20 +975,6 @@ def _raise_on_error(result_code: int) -> None:
         )
 
 
-def _match_topic(subscription: str, topic: str) -> bool:
-    """Test if topic matches subscription."""
-    # pylint: disable=import-outside-toplevel
-    from paho.mqtt.matcher import MQTTMatcher
-
-    matcher = MQTTMatcher()
-    matcher[subscription] = True
-    try:
-        next(matcher.iter_match(topic))
-        return True
-    except StopIteration:
-        return False
-
-
 class MqttAttributes(Entity):
     """Mixin used for platforms that support JSON attributes."""
 
@@ -1,6 +1,6 @@
 """Support for recording details."""
 import asyncio
-from collections import namedtuple
+from collections import OrderedDict, namedtuple
 import concurrent.futures
 from datetime import datetime
 import logging
@@ -34,9 +34,9 @@ from homeassistant.helpers.entityfilter import (
 from homeassistant.helpers.typing import ConfigType
 import homeassistant.util.dt as dt_util
 
-from . import migration, purge
+from . import migration, purge, statistics
 from .const import DATA_INSTANCE
-from .models import Base, Events, RecorderRuns, States
+from .models import Base, Events, RecorderRuns, StateAttributes, States
 from .util import session_scope
 
 _LOGGER = logging.getLogger(__name__)
@@ -58,6 +58,9 @@ SERVICE_PURGE_SCHEMA = vol.Schema(
 DEFAULT_URL = "sqlite:///{hass_config_path}"
 DEFAULT_DB_FILE = "home-assistant_v2.db"
 DEFAULT_DB_MAX_RETRIES = 10
+
+# Number of attribute sets whose id is kept in memory when writing states
+STATE_ATTRIBUTES_ID_CACHE_SIZE = 2048
 DEFAULT_DB_RETRY_WAIT = 3
 KEEPALIVE_TIME = 30
 
@@ -190,6 +193,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
 
 
 PurgeTask = namedtuple("PurgeTask", ["keep_days", "repack"])
+StatisticsTask = namedtuple("StatisticsTask", [])
 
 
 class Recorder(threading.Thread):
@@ -228,11 +232,25 @@ class Recorder(threading.Thread):
 
         self._timechanges_seen = 0
         self._keepalive_count = 0
-        self._old_state_ids = {}
+        self._old_states = {}
+        self._pending_expunge = []
+        self._pending_events = 0
+        self._pending_state_attributes = {}
+        self._state_attributes_ids = OrderedDict()
         self.event_session = None
         self.get_session = None
         self._completed_database_setup = False
 
+        # Statistics about the write pipeline, used to tune commit_interval
+        self.last_batch_size = 0
+        self.last_commit_duration: Optional[float] = None
+        self.total_commits = 0
+
+    @property
+    def queue_depth(self) -> int:
+        """Return the number of items waiting to be processed."""
+        return self.queue.qsize()
+
     @callback
     def async_initialize(self):
         """Initialize the recorder."""
@@ -332,6 +350,18 @@ class Recorder(threading.Thread):
                 async_purge, hour=4, minute=12, second=0
             )
 
+        @callback
+        def async_compile_statistics(now):
+            """Trigger compiling the statistics of the past hour."""
+            self.queue.put(StatisticsTask())
+
+        # Compile statistics shortly after every hour, and catch up on
+        # the hours that passed while we were not running
+        self.hass.helpers.event.track_time_change(
+            async_compile_statistics, minute=0, second=10
+        )
+        self.queue.put(StatisticsTask())
+
         self.event_session = self.get_session()
         # Use a session for the event read loop
         # with a commit every time the event time
@@ -344,11 +374,23 @@ class Recorder(threading.Thread):
                 self.queue.task_done()
                 return
             if isinstance(event, PurgeTask):
+                # Write the pending states first so the attributes
+                # they reference are not purged as unused
+                self._commit_event_session_or_retry()
                 # Schedule a new purge task if this one didn't finish
                 if not purge.purge_old_data(self, event.keep_days, event.repack):
                     self.queue.put(PurgeTask(event.keep_days, event.repack))
                 self.queue.task_done()
                 continue
+            if isinstance(event, StatisticsTask):
+                # Write the pending states first, the statistics are
+                # compiled in the same scoped session
+                self._commit_event_session_or_retry()
+                # Schedule a new statistics task if there are more hours left
+                if not statistics.compile_statistics(self):
+                    self.queue.put(StatisticsTask())
+                self.queue.task_done()
+                continue
             if event.event_type == EVENT_TIME_CHANGED:
                 self.queue.task_done()
                 self._keepalive_count += 1
@@ -371,12 +413,16 @@ class Recorder(threading.Thread):
                     self.queue.task_done()
                     continue
 
+            dbevent = None
             try:
-                dbevent = Events.from_event(event)
                 if event.event_type == EVENT_STATE_CHANGED:
-                    dbevent.event_data = "{}"
+                    # The state is stored in the states table so there
+                    # is no need to serialize it into the event as well
+                    dbevent = Events.from_event(event, event_data="{}")
+                else:
+                    dbevent = Events.from_event(event)
                 self.event_session.add(dbevent)
-                self.event_session.flush()
+                self._pending_events += 1
             except (TypeError, ValueError):
                 _LOGGER.warning("Event is not JSON serializable: %s", event)
             except Exception as err:  # pylint: disable=broad-except
@@ -386,17 +432,22 @@ class Recorder(threading.Thread):
             if dbevent and event.event_type == EVENT_STATE_CHANGED:
                 try:
                     dbstate = States.from_event(event)
+                    self._set_state_attributes(
+                        dbstate, StateAttributes.shared_attrs_from_event(event)
+                    )
                     has_new_state = event.data.get("new_state")
-                    dbstate.old_state_id = self._old_state_ids.get(dbstate.entity_id)
+                    # The previous state may not have been flushed yet, link
+                    # the objects so the ids are resolved when the batch is
+                    # written instead of flushing on every state change.
+                    if dbstate.entity_id in self._old_states:
+                        dbstate.old_state = self._old_states.pop(dbstate.entity_id)
                     if not has_new_state:
                         dbstate.state = None
-                    dbstate.event_id = dbevent.event_id
+                    dbstate.event = dbevent
                     self.event_session.add(dbstate)
-                    self.event_session.flush()
                     if has_new_state:
-                        self._old_state_ids[dbstate.entity_id] = dbstate.state_id
-                    elif dbstate.entity_id in self._old_state_ids:
-                        del self._old_state_ids[dbstate.entity_id]
+                        self._old_states[dbstate.entity_id] = dbstate
+                        self._pending_expunge.append(dbstate)
                 except (TypeError, ValueError):
                     _LOGGER.warning(
                         "State is not JSON serializable: %s",
@@ -413,6 +464,49 @@ class Recorder(threading.Thread):
 
             self.queue.task_done()
 
+    def _set_state_attributes(self, dbstate, shared_attrs):
+        """Link a state to the stored attributes, adding them if they are new."""
+        attributes_id = self._state_attributes_ids.get(shared_attrs)
+        if attributes_id is not None:
+            self._state_attributes_ids.move_to_end(shared_attrs)
+            dbstate.attributes_id = attributes_id
+            return
+
+        dbattributes = self._pending_state_attributes.get(shared_attrs)
+        if dbattributes is not None:
+            dbstate.state_attributes = dbattributes
+            return
+
+        attributes_hash = StateAttributes.hash_shared_attrs(shared_attrs)
+        # Do not flush the pending states to look up the attributes
+        with self.event_session.no_autoflush:
+            attributes_id = (
+                self.event_session.query(StateAttributes.attributes_id)
+                .filter(
+                    (StateAttributes.hash == attributes_hash)
+                    & (StateAttributes.shared_attrs == shared_attrs)
+                )
+                .scalar()
+            )
+        if attributes_id is not None:
+            self._cache_state_attributes_id(shared_attrs, attributes_id)
+            dbstate.attributes_id = attributes_id
+            return
+
+        dbattributes = StateAttributes(hash=attributes_hash, shared_attrs=shared_attrs)
+        self._pending_state_attributes[shared_attrs] = dbattributes
+        dbstate.state_attributes = dbattributes
+
+    def _cache_state_attributes_id(self, shared_attrs, attributes_id):
+        """Remember the id of stored attributes."""
+        self._state_attributes_ids[shared_attrs] = attributes_id
+        if len(self._state_attributes_ids) > STATE_ATTRIBUTES_ID_CACHE_SIZE:
+            self._state_attributes_ids.popitem(last=False)
+
+    def clear_state_attributes_cache(self):
+        """Forget the ids of the stored attributes after they were purged."""
+        self._state_attributes_ids.clear()
+
     def _send_keep_alive(self):
         try:
             _LOGGER.debug("Sending keepalive")
@@ -463,6 +557,13 @@ class Recorder(threading.Thread):
         self._reopen_event_session()
 
     def _reopen_event_session(self):
+        # Pending states are discarded with the rollback
+        # so they can no longer be referenced as old states
+        self._old_states = {}
+        self._pending_expunge = []
+        self._pending_events = 0
+        self._pending_state_attributes = {}
+
         try:
             self.event_session.rollback()
         except Exception as err:  # pylint: disable=broad-except
@@ -482,13 +583,47 @@ class Recorder(threading.Thread):
             _LOGGER.exception("Error while creating new event session: %s", err)
 
     def _commit_event_session(self):
+        start = time.perf_counter()
+        attributes_ids = {}
         try:
+            if self._pending_expunge:
+                self.event_session.flush()
+                for dbstate in self._pending_expunge:
+                    # Expunge the state so it is not expired
+                    # until we use it later for dbstate.old_state
+                    if dbstate in self.event_session:
+                        self.event_session.expunge(dbstate)
+                self._pending_expunge = []
+            if self._pending_state_attributes:
+                self.event_session.flush()
+                # Read the new ids before the commit expires them
+                attributes_ids = {
+                    shared_attrs: dbattributes.attributes_id
+                    for shared_attrs, dbattributes in (
+                        self._pending_state_attributes.items()
+                    )
+                }
+                self._pending_state_attributes = {}
             self.event_session.commit()
         except Exception as err:
             _LOGGER.error("Error executing query: %s", err)
             self.event_session.rollback()
             raise
 
+        for shared_attrs, attributes_id in attributes_ids.items():
+            self._cache_state_attributes_id(shared_attrs, attributes_id)
+
+        self.last_commit_duration = time.perf_counter() - start
+        self.last_batch_size = self._pending_events
+        self._pending_events = 0
+        self.total_commits += 1
+        if self.last_batch_size:
+            _LOGGER.debug(
+                "Committed %d events in %fs",
+                self.last_batch_size,
+                self.last_commit_duration,
+            )
+
     @callback
     def event_listener(self, event):
         """Listen for new events and put them in the process queue."""
@@ -6,7 +6,14 @@ from sqlalchemy import Table, text
 from sqlalchemy.engine import reflection
 from sqlalchemy.exc import InternalError, OperationalError, SQLAlchemyError
 
-from .models import SCHEMA_VERSION, Base, SchemaChanges
+from .models import (
+    SCHEMA_VERSION,
+    Base,
+    SchemaChanges,
+    StateAttributes,
+    Statistics,
+    StatisticsRuns,
+)
 from .util import session_scope
 
 _LOGGER = logging.getLogger(__name__)
@@ -289,6 +296,16 @@ def _apply_update(engine, new_version, old_version):
         _drop_index(engine, "states", "ix_states_entity_id")
         _create_index(engine, "events", "ix_events_event_type_time_fired")
         _drop_index(engine, "events", "ix_events_event_type")
+    elif new_version == 10:
+        Base.metadata.create_all(
+            engine, tables=[Statistics.__table__, StatisticsRuns.__table__]
+        )
+    elif new_version == 11:
+        Base.metadata.create_all(engine, tables=[StateAttributes.__table__])
+        _add_columns(engine, "states", ["attributes_id INTEGER"])
+        _create_index(engine, "states", "ix_states_attributes_id")
+    elif new_version == 12:
+        _add_columns(engine, "states", ["has_unit BOOLEAN"])
     else:
         raise ValueError(f"No schema migration defined for version {new_version}")
 
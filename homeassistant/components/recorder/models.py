@@ -1,11 +1,16 @@
 """Models for SQLAlchemy."""
+from functools import lru_cache
 import json
 import logging
+from types import MappingProxyType
+from zlib import crc32
 
 from sqlalchemy import (
+    BigInteger,
     Boolean,
     Column,
     DateTime,
+    Float,
     ForeignKey,
     Index,
     Integer,
@@ -14,8 +19,10 @@ from sqlalchemy import (
     distinct,
 )
 from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.orm import relationship
 from sqlalchemy.orm.session import Session
 
+from homeassistant.const import ATTR_UNIT_OF_MEASUREMENT
 from homeassistant.core import Context, Event, EventOrigin, State, split_entity_id
 from homeassistant.helpers.json import JSONEncoder
 import homeassistant.util.dt as dt_util
@@ -24,12 +31,15 @@ import homeassistant.util.dt as dt_util
 # pylint: disable=invalid-name
 Base = declarative_base()
 
-SCHEMA_VERSION = 9
+SCHEMA_VERSION = 12
 
 _LOGGER = logging.getLogger(__name__)
 
 DB_TIMEZONE = "+00:00"
 
+# Number of decoded attribute sets kept in memory for the readers
+ATTRIBUTES_CACHE_SIZE = 2048
+
 
 class Events(Base):  # type: ignore
     """Event history data."""
@@ -52,11 +62,11 @@ class Events(Base):  # type: ignore
     )
 
     @staticmethod
-    def from_event(event):
+    def from_event(event, event_data=None):
         """Create an event database object from a native event."""
         return Events(
             event_type=event.event_type,
-            event_data=json.dumps(event.data, cls=JSONEncoder),
+            event_data=event_data or json.dumps(event.data, cls=JSONEncoder),
             origin=str(event.origin),
             time_fired=event.time_fired,
             context_id=event.context.id,
@@ -93,12 +103,28 @@ class States(Base):  # type: ignore
     domain = Column(String(64))
     entity_id = Column(String(255))
     state = Column(String(255))
+    # Only set on rows recorded before the attributes were deduplicated
     attributes = Column(Text)
     event_id = Column(Integer, ForeignKey("events.event_id"), index=True)
     last_changed = Column(DateTime(timezone=True), default=dt_util.utcnow)
     last_updated = Column(DateTime(timezone=True), default=dt_util.utcnow, index=True)
     created = Column(DateTime(timezone=True), default=dt_util.utcnow)
     old_state_id = Column(Integer)
+    # Used to leave out the continuous sensors in the logbook without
+    # looking at the attributes, not set on rows recorded before
+    has_unit = Column(Boolean)
+    attributes_id = Column(
+        Integer, ForeignKey("state_attributes.attributes_id"), index=True
+    )
+    event = relationship("Events", uselist=False)
+    state_attributes = relationship("StateAttributes", uselist=False)
+    old_state = relationship(
+        "States",
+        primaryjoin="States.old_state_id == States.state_id",
+        foreign_keys=[old_state_id],
+        remote_side=[state_id],
+        uselist=False,
+    )
 
     __table_args__ = (
         # Used for fetching the state of entities at a specific time
@@ -118,13 +144,13 @@ class States(Base):  # type: ignore
         if state is None:
             dbstate.state = ""
             dbstate.domain = split_entity_id(entity_id)[0]
-            dbstate.attributes = "{}"
+            dbstate.has_unit = False
             dbstate.last_changed = event.time_fired
             dbstate.last_updated = event.time_fired
         else:
             dbstate.domain = state.domain
             dbstate.state = state.state
-            dbstate.attributes = json.dumps(dict(state.attributes), cls=JSONEncoder)
+            dbstate.has_unit = ATTR_UNIT_OF_MEASUREMENT in state.attributes
             dbstate.last_changed = state.last_changed
             dbstate.last_updated = state.last_updated
 
@@ -132,11 +158,15 @@ class States(Base):  # type: ignore
 
     def to_native(self, validate_entity_id=True):
         """Convert to an HA state object."""
+        if self.state_attributes is not None:
+            attributes = self.state_attributes.shared_attrs
+        else:
+            attributes = self.attributes
         try:
             return State(
                 self.entity_id,
                 self.state,
-                json.loads(self.attributes),
+                json.loads(attributes),
                 process_timestamp(self.last_changed),
                 process_timestamp(self.last_updated),
                 # Join the events table on event_id to get the context instead
@@ -150,6 +180,35 @@ class States(Base):  # type: ignore
             return None
 
 
+class StateAttributes(Base):  # type: ignore
+    """State attributes shared by the states with the same attributes."""
+
+    __tablename__ = "state_attributes"
+    attributes_id = Column(Integer, primary_key=True)
+    hash = Column(BigInteger, index=True)
+    shared_attrs = Column(Text)
+
+    @staticmethod
+    def shared_attrs_from_event(event):
+        """Return the JSON attributes of the new state of a state_changed event."""
+        state = event.data.get("new_state")
+        # State got deleted
+        if state is None:
+            return "{}"
+        return json.dumps(dict(state.attributes), cls=JSONEncoder)
+
+    @staticmethod
+    def hash_shared_attrs(shared_attrs):
+        """Return the hash used to look up a set of attributes."""
+        return crc32(shared_attrs.encode("utf-8"))
+
+
+@lru_cache(maxsize=ATTRIBUTES_CACHE_SIZE)
+def decode_attributes(attributes):
+    """Decode JSON attributes into a read-only mapping shared between callers."""
+    return MappingProxyType(json.loads(attributes))
+
+
 class RecorderRuns(Base):  # type: ignore
     """Representation of recorder run."""
 
@@ -197,6 +256,36 @@ class SchemaChanges(Base):  # type: ignore
     changed = Column(DateTime(timezone=True), default=dt_util.utcnow)
 
 
+class Statistics(Base):  # type: ignore
+    """Long-term statistics of a numeric entity over an hour or a day."""
+
+    __tablename__ = "statistics"
+    id = Column(Integer, primary_key=True)
+    entity_id = Column(String(255))
+    period = Column(String(16))
+    start = Column(DateTime(timezone=True))
+    min = Column(Float)
+    max = Column(Float)
+    mean = Column(Float)
+    sum = Column(Float)
+    count = Column(Integer)
+    created = Column(DateTime(timezone=True), default=dt_util.utcnow)
+
+    __table_args__ = (
+        # Used for fetching the statistics of entities over a period
+        Index("ix_statistics_entity_id_period_start", "entity_id", "period", "start"),
+    )
+
+
+class StatisticsRuns(Base):  # type: ignore
+    """Representation of the hours for which statistics were compiled."""
+
+    __tablename__ = "statistics_runs"
+    run_id = Column(Integer, primary_key=True)
+    start = Column(DateTime(timezone=True))
+    created = Column(DateTime(timezone=True), default=dt_util.utcnow)
+
+
 def process_timestamp(ts):
     """Process a timestamp into datetime object."""
     if ts is None:
@@ -3,11 +3,13 @@ from datetime import timedelta
 import logging
 import time
 
+from sqlalchemy import exists
 from sqlalchemy.exc import OperationalError, SQLAlchemyError
+from sqlalchemy.orm import joinedload
 
 import homeassistant.util.dt as dt_util
 
-from .models import Events, RecorderRuns, States
+from .models import Events, RecorderRuns, StateAttributes, States
 from .util import execute, session_scope
 
 _LOGGER = logging.getLogger(__name__)
@@ -26,7 +28,12 @@ def purge_old_data(instance, purge_days: int, repack: bool) -> bool:
             # Purge a max of 1 hour, based on the oldest states or events record
             batch_purge_before = purge_before
 
-            query = session.query(States).order_by(States.last_updated.asc()).limit(1)
+            query = (
+                session.query(States)
+                .options(joinedload(States.state_attributes))
+                .order_by(States.last_updated.asc())
+                .limit(1)
+            )
             states = execute(query, to_native=True, validate_entity_ids=False)
             if states:
                 batch_purge_before = min(
@@ -70,6 +77,20 @@ def purge_old_data(instance, purge_days: int, repack: bool) -> bool:
             )
             _LOGGER.debug("Deleted %s recorder_runs", deleted_rows)
 
+            # Remove the attributes no state references anymore
+            deleted_rows = (
+                session.query(StateAttributes)
+                .filter(
+                    ~exists().where(
+                        States.attributes_id == StateAttributes.attributes_id
+                    )
+                )
+                .delete(synchronize_session=False)
+            )
+            _LOGGER.debug("Deleted %s state_attributes", deleted_rows)
+            if deleted_rows:
+                instance.clear_state_attributes_cache()
+
         if repack:
             # Execute sqlite or postgresql vacuum command to free up space on disk
             if instance.engine.driver in ("pysqlite", "postgresql"):
@@ -78,7 +99,9 @@ def purge_old_data(instance, purge_days: int, repack: bool) -> bool:
             # Optimize mysql / mariadb tables to free up space on disk
             elif instance.engine.driver in ("mysqldb", "pymysql"):
                 _LOGGER.debug("Optimizing SQL DB to free space")
-                instance.engine.execute("OPTIMIZE TABLE states, events, recorder_runs")
+                instance.engine.execute(
+                    "OPTIMIZE TABLE states, state_attributes, events, recorder_runs"
+                )
 
     except OperationalError as err:
         # Retry when one of the following MySQL errors occurred:
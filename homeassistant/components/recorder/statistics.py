@@ -0,0 +1,182 @@
+"""Long-term statistics rolled up from the recorded states."""
+from datetime import timedelta
+from itertools import groupby
+import logging
+
+from sqlalchemy import func
+from sqlalchemy.exc import SQLAlchemyError
+
+from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN
+import homeassistant.util.dt as dt_util
+
+from .models import States, Statistics, StatisticsRuns, process_timestamp
+from .util import execute, session_scope
+
+_LOGGER = logging.getLogger(__name__)
+
+PERIOD_HOUR = "hour"
+PERIOD_DAY = "day"
+
+HOUR = timedelta(hours=1)
+DAY = timedelta(days=1)
+
+QUERY_STATISTICS = [
+    Statistics.entity_id,
+    Statistics.start,
+    Statistics.min,
+    Statistics.max,
+    Statistics.mean,
+    Statistics.sum,
+]
+
+
+def compile_statistics(instance) -> bool:
+    """Compile the statistics of the oldest hour not compiled yet.
+
+    Hourly statistics are compiled from the states, daily statistics from
+    the hourly statistics once the last hour of a UTC day is compiled.
+    Returns False when there are more full hours left to compile.
+    """
+    end = dt_util.utcnow().replace(minute=0, second=0, microsecond=0)
+
+    try:
+        with session_scope(session=instance.get_session()) as session:
+            last_run = session.query(func.max(StatisticsRuns.start)).scalar()
+            if last_run is not None:
+                start = process_timestamp(last_run) + HOUR
+            else:
+                first_state = session.query(func.min(States.last_updated)).scalar()
+                if first_state is None:
+                    return True
+                start = process_timestamp(first_state).replace(
+                    minute=0, second=0, microsecond=0
+                )
+
+            if start >= end:
+                return True
+
+            _LOGGER.debug("Compiling statistics for %s", start)
+            _compile_hourly_statistics(session, start)
+            if (start + HOUR).hour == 0:
+                _compile_daily_statistics(session, start.replace(hour=0))
+            session.add(StatisticsRuns(start=start))
+
+    except SQLAlchemyError as err:
+        _LOGGER.warning("Error compiling statistics: %s", err)
+        return True
+
+    return start + HOUR >= end
+
+
+def _compile_hourly_statistics(session, start):
+    """Add the statistics of the numeric entities during an hour."""
+    query = (
+        session.query(States.entity_id, States.state)
+        .filter((States.last_updated >= start) & (States.last_updated < start + HOUR))
+        .order_by(States.entity_id)
+    )
+
+    for entity_id, rows in groupby(execute(query), lambda row: row.entity_id):
+        values = _numeric_values(rows)
+        if not values:
+            continue
+
+        total = sum(values)
+        session.add(
+            Statistics(
+                entity_id=entity_id,
+                period=PERIOD_HOUR,
+                start=start,
+                min=min(values),
+                max=max(values),
+                mean=total / len(values),
+                sum=total,
+                count=len(values),
+            )
+        )
+
+
+def _compile_daily_statistics(session, start):
+    """Add the statistics of the entities during a day from the hourly ones."""
+    query = (
+        session.query(
+            Statistics.entity_id,
+            func.min(Statistics.min),
+            func.max(Statistics.max),
+            func.sum(Statistics.sum),
+            func.sum(Statistics.count),
+        )
+        .filter(
+            (Statistics.period == PERIOD_HOUR)
+            & (Statistics.start >= start)
+            & (Statistics.start < start + DAY)
+        )
+        .group_by(Statistics.entity_id)
+    )
+
+    for entity_id, min_value, max_value, total, count in execute(query):
+        session.add(
+            Statistics(
+                entity_id=entity_id,
+                period=PERIOD_DAY,
+                start=start,
+                min=min_value,
+                max=max_value,
+                mean=total / count,
+                sum=total,
+                count=count,
+            )
+        )
+
+
+def _numeric_values(rows):
+    """Return the numeric values of the states of an entity.
+
+    Unknown and unavailable states are left out. Returns None if the
+    entity has other states that are not numeric.
+    """
+    values = []
+    for row in rows:
+        if row.state in (STATE_UNKNOWN, STATE_UNAVAILABLE):
+            continue
+        try:
+            values.append(float(row.state))
+        except (TypeError, ValueError):
+            return None
+    return values
+
+
+def statistics_during_period(
+    hass, start_time, end_time=None, entity_ids=None, period=PERIOD_HOUR
+):
+    """Return the statistics of the entities during UTC period start_time - end_time.
+
+    The statistics are returned as {'entity_id': [list of statistics]}
+    sorted by start.
+    """
+    with session_scope(hass=hass) as session:
+        query = session.query(*QUERY_STATISTICS).filter(
+            (Statistics.period == period) & (Statistics.start >= start_time)
+        )
+
+        if end_time is not None:
+            query = query.filter(Statistics.start < end_time)
+
+        if entity_ids is not None:
+            query = query.filter(Statistics.entity_id.in_(entity_ids))
+
+        query = query.order_by(Statistics.entity_id, Statistics.start)
+
+        return {
+            entity_id: [
+                {
+                    "start": process_timestamp(row.start),
+                    "min": row.min,
+                    "max": row.max,
+                    "mean": row.mean,
+                    "sum": row.sum,
+                }
+                for row in rows
+            ]
+            for entity_id, rows in groupby(execute(query), lambda row: row.entity_id)
+        }
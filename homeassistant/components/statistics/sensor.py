@@ -1,11 +1,11 @@
 """Support for statistics for sensor values."""
+import bisect
 from collections import deque
 import logging
-import statistics
 
 import voluptuous as vol
 
-from homeassistant.components.recorder.models import States
+from homeassistant.components.recorder.models import States, process_timestamp
 from homeassistant.components.recorder.util import execute, session_scope
 from homeassistant.components.sensor import PLATFORM_SCHEMA
 from homeassistant.const import (
@@ -47,6 +47,8 @@ DEFAULT_SIZE = 20
 DEFAULT_PRECISION = 2
 ICON = "mdi:calculator"
 
+DATA_STATES_LOADER = "statistics_states_loader"
+
 PLATFORM_SCHEMA = PLATFORM_SCHEMA.extend(
     {
         vol.Required(CONF_ENTITY_ID): cv.entity_id,
@@ -89,6 +91,7 @@ class StatisticsSensor(Entity):
         self._unit_of_measurement = None
         self.states = deque(maxlen=self._sampling_size)
         self.ages = deque(maxlen=self._sampling_size)
+        self._accumulator = SampleAccumulator()
 
         self.count = 0
         self.mean = self.median = self.stdev = self.variance = None
@@ -107,7 +110,7 @@ class StatisticsSensor(Entity):
                 ATTR_UNIT_OF_MEASUREMENT
             )
 
-            self._add_state_to_queue(new_state)
+            self._add_state_to_queue(new_state.state, new_state.last_updated)
 
             self.async_schedule_update_ha_state(True)
 
@@ -128,24 +131,32 @@ class StatisticsSensor(Entity):
             EVENT_HOMEASSISTANT_START, async_stats_sensor_startup
         )
 
-    def _add_state_to_queue(self, new_state):
+    def _add_state_to_queue(self, state, last_updated):
         """Add the state to the queue."""
-        if new_state.state in [STATE_UNKNOWN, STATE_UNAVAILABLE]:
+        if state in [STATE_UNKNOWN, STATE_UNAVAILABLE]:
             return
 
-        try:
-            if self.is_binary:
-                self.states.append(new_state.state)
-            else:
-                self.states.append(float(new_state.state))
+        if self.is_binary:
+            self.states.append(state)
+            self.ages.append(last_updated)
+            return
 
-            self.ages.append(new_state.last_updated)
+        try:
+            value = float(state)
         except ValueError:
             _LOGGER.error(
                 "%s: parsing error, expected number and received %s",
                 self.entity_id,
-                new_state.state,
+                state,
             )
+            return
+
+        if len(self.states) == self.states.maxlen:
+            # The oldest sample is dropped by the deque
+            self._accumulator.remove(self.states[0])
+        self.states.append(value)
+        self.ages.append(last_updated)
+        self._accumulator.add(value)
 
     @property
     def name(self):
@@ -212,7 +223,9 @@ class StatisticsSensor(Entity):
                 (now - self.ages[0]),
             )
             self.ages.popleft()
-            self.states.popleft()
+            value = self.states.popleft()
+            if not self.is_binary:
+                self._accumulator.remove(value)
 
     def _next_to_purge_timestamp(self):
         """Find the timestamp when the next purge would occur."""
@@ -232,24 +245,25 @@ class StatisticsSensor(Entity):
         self.count = len(self.states)
 
         if not self.is_binary:
-            try:  # require only one data point
-                self.mean = round(statistics.mean(self.states), self._precision)
-                self.median = round(statistics.median(self.states), self._precision)
-            except statistics.StatisticsError as err:
-                _LOGGER.debug("%s: %s", self.entity_id, err)
+            accumulator = self._accumulator
+            if accumulator.count:  # require only one data point
+                self.mean = round(accumulator.mean, self._precision)
+                self.median = round(accumulator.median, self._precision)
+            else:
+                _LOGGER.debug("%s: no data points", self.entity_id)
                 self.mean = self.median = STATE_UNKNOWN
 
-            try:  # require at least two data points
-                self.stdev = round(statistics.stdev(self.states), self._precision)
-                self.variance = round(statistics.variance(self.states), self._precision)
-            except statistics.StatisticsError as err:
-                _LOGGER.debug("%s: %s", self.entity_id, err)
+            if accumulator.count > 1:  # require at least two data points
+                self.stdev = round(accumulator.stdev, self._precision)
+                self.variance = round(accumulator.variance, self._precision)
+            else:
+                _LOGGER.debug("%s: less than two data points", self.entity_id)
                 self.stdev = self.variance = STATE_UNKNOWN
 
             if self.states:
-                self.total = round(sum(self.states), self._precision)
-                self.min = round(min(self.states), self._precision)
-                self.max = round(max(self.states), self._precision)
+                self.total = round(accumulator.total, self._precision)
+                self.min = round(accumulator.min, self._precision)
+                self.max = round(accumulator.max, self._precision)
 
                 self.min_age = self.ages[0]
                 self.max_age = self.ages[-1]
@@ -297,42 +311,162 @@ class StatisticsSensor(Entity):
             )
 
     async def _async_initialize_from_database(self):
-        """Initialize the list of states from the database.
+        """Initialize the list of states from the database."""
+        _LOGGER.debug("%s: initializing values from the database", self.entity_id)
 
-        The query will get the list of states in DESCENDING order so that we
-        can limit the result to self._sample_size. Afterwards reverse the
-        list so that we get it in the right order again.
+        loader = self.hass.data.get(DATA_STATES_LOADER)
+        if loader is None:
+            loader = self.hass.data[DATA_STATES_LOADER] = StatesLoader(self.hass)
 
-        If MaxAge is provided then query will restrict to entries younger then
-        current datetime - MaxAge.
+        states = await loader.async_load(
+            self._entity_id.lower(), self._sampling_size, self._max_age
+        )
+        for state, last_updated in states:
+            self._add_state_to_queue(state, last_updated)
+
+        self.async_schedule_update_ha_state(True)
+
+        _LOGGER.debug("%s: initializing from database completed", self.entity_id)
+
+
+class StatesLoader:
+    """Load the recorded states of the statistics sensors in batches.
+
+    The sensors ask for their states when Home Assistant starts. All
+    requests made before the batch runs are loaded in one executor job
+    sharing a single database session.
+    """
+
+    def __init__(self, hass):
+        """Initialize the states loader."""
+        self.hass = hass
+        self._requests = []
+
+    async def async_load(self, entity_id, sampling_size, max_age):
+        """Return the last (state, last_updated) of an entity, oldest first.
+
+        At most sampling_size states are returned, limited to the states
+        not older than max_age if it is given.
         """
+        future = self.hass.loop.create_future()
+        if not self._requests:
+            self.hass.async_create_task(self._async_load_batch())
+        self._requests.append((entity_id, sampling_size, max_age, future))
+        return await future
+
+    async def _async_load_batch(self):
+        """Load the states of all pending requests."""
+        requests, self._requests = self._requests, []
+        try:
+            results = await self.hass.async_add_executor_job(
+                self._load, [request[:3] for request in requests]
+            )
+        except Exception as err:  # pylint: disable=broad-except
+            for *_, future in requests:
+                future.set_exception(err)
+            return
 
-        _LOGGER.debug("%s: initializing values from the database", self.entity_id)
+        for (*_, future), states in zip(requests, results):
+            future.set_result(states)
+
+    def _load(self, requests):
+        """Query the states of the requests from the database.
+
+        Only the state and last_updated columns are fetched. The query
+        gets the states in DESCENDING order so that we can limit the
+        result to the sampling size, the list is reversed afterwards.
+        """
+        now = dt_util.utcnow()
+        results = []
 
         with session_scope(hass=self.hass) as session:
-            query = session.query(States).filter(
-                States.entity_id == self._entity_id.lower()
-            )
+            for entity_id, sampling_size, max_age in requests:
+                query = session.query(States.state, States.last_updated).filter(
+                    States.entity_id == entity_id
+                )
 
-            if self._max_age is not None:
-                records_older_then = dt_util.utcnow() - self._max_age
-                _LOGGER.debug(
-                    "%s: retrieve records not older then %s",
-                    self.entity_id,
-                    records_older_then,
+                if max_age is not None:
+                    records_older_then = now - max_age
+                    _LOGGER.debug(
+                        "%s: retrieve records not older then %s",
+                        entity_id,
+                        records_older_then,
+                    )
+                    query = query.filter(States.last_updated >= records_older_then)
+
+                query = query.order_by(States.last_updated.desc()).limit(sampling_size)
+                results.append(
+                    [
+                        (state, process_timestamp(last_updated))
+                        for state, last_updated in reversed(execute(query))
+                    ]
                 )
-                query = query.filter(States.last_updated >= records_older_then)
-            else:
-                _LOGGER.debug("%s: retrieving all records", self.entity_id)
 
-            query = query.order_by(States.last_updated.desc()).limit(
-                self._sampling_size
-            )
-            states = execute(query, to_native=True, validate_entity_ids=False)
+        return results
 
-        for state in reversed(states):
-            self._add_state_to_queue(state)
 
-        self.async_schedule_update_ha_state(True)
+class SampleAccumulator:
+    """Running statistics over a sliding window of numeric samples.
 
-        _LOGGER.debug("%s: initializing from database completed", self.entity_id)
+    Samples are added and removed in O(1) for the mean, variance and
+    total, using Welford's algorithm. A sorted copy of the samples
+    provides the minimum, maximum and median.
+    """
+
+    def __init__(self):
+        """Initialize the accumulator."""
+        self.count = 0
+        self.mean = 0.0
+        self.total = 0.0
+        self._m2 = 0.0
+        self._sorted = []
+
+    def add(self, value):
+        """Add a sample."""
+        self.count += 1
+        self.total += value
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        bisect.insort(self._sorted, value)
+
+    def remove(self, value):
+        """Remove a sample that was added before."""
+        del self._sorted[bisect.bisect_left(self._sorted, value)]
+        self.count -= 1
+        if not self.count:
+            self.mean = self.total = self._m2 = 0.0
+            return
+
+        self.total -= value
+        delta = value - self.mean
+        self.mean -= delta / self.count
+        self._m2 = max(self._m2 - delta * (value - self.mean), 0.0)
+
+    @property
+    def min(self):
+        """Return the smallest sample."""
+        return self._sorted[0]
+
+    @property
+    def max(self):
+        """Return the largest sample."""
+        return self._sorted[-1]
+
+    @property
+    def median(self):
+        """Return the median of the samples."""
+        middle = self.count // 2
+        if self.count % 2:
+            return self._sorted[middle]
+        return (self._sorted[middle - 1] + self._sorted[middle]) / 2
+
+    @property
+    def variance(self):
+        """Return the sample variance, needs at least two samples."""
+        return self._m2 / (self.count - 1)
+
+    @property
+    def stdev(self):
+        """Return the sample standard deviation, needs at least two samples."""
+        return self.variance ** 0.5
@@ -4,6 +4,11 @@ from itertools import chain
 import logging
 
 from homeassistant.const import MATCH_ALL
+from homeassistant.core import callback
+from homeassistant.helpers.event import (
+    async_track_state_change,
+    async_track_template_result,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -57,3 +62,39 @@ def extract_entities(
         entity_ids = manual_entity_ids
 
     return entity_ids
+
+
+@callback
+def async_track_templates(
+    hass, manual_entity_ids, templates, action, attribute_templates=None
+):
+    """Call action when a state the templates depend on changes.
+
+    Manually configured entity ids are tracked as they are. Otherwise every
+    template is tracked by the states its last render accessed, templates
+    that do not depend on any state are not tracked.
+    """
+    if attribute_templates is None:
+        attribute_templates = {}
+
+    @callback
+    def state_changed(*_):
+        """Handle the state changes of the tracked entities."""
+        action()
+
+    if manual_entity_ids is not None:
+        return async_track_state_change(hass, manual_entity_ids, state_changed)
+
+    removes = [
+        async_track_template_result(hass, template, state_changed)
+        for template in chain(templates.values(), attribute_templates.values())
+        if template is not None
+    ]
+
+    @callback
+    def remove():
+        """Remove the listeners of all templates."""
+        for remove_listener in removes:
+            remove_listener()
+
+    return remove
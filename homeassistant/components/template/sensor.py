@@ -20,15 +20,13 @@ from homeassistant.const import (
     CONF_SENSORS,
     CONF_VALUE_TEMPLATE,
     EVENT_HOMEASSISTANT_START,
-    MATCH_ALL,
 )
 from homeassistant.core import callback
 from homeassistant.exceptions import TemplateError
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity import Entity, async_generate_entity_id
-from homeassistant.helpers.event import async_track_state_change
 
-from . import extract_entities, initialise_templates
+from . import async_track_templates, initialise_templates
 from .const import CONF_AVAILABILITY_TEMPLATE
 
 CONF_ATTRIBUTE_TEMPLATES = "attribute_templates"
@@ -81,13 +79,6 @@ async def async_setup_platform(hass, config, async_add_entities, discovery_info=
         }
 
         initialise_templates(hass, templates, attribute_templates)
-        entity_ids = extract_entities(
-            device,
-            "sensor",
-            device_config.get(ATTR_ENTITY_ID),
-            templates,
-            attribute_templates,
-        )
 
         sensors.append(
             SensorTemplate(
@@ -100,7 +91,8 @@ async def async_setup_platform(hass, config, async_add_entities, discovery_info=
                 icon_template,
                 entity_picture_template,
                 availability_template,
-                entity_ids,
+                device_config.get(ATTR_ENTITY_ID),
+                templates,
                 device_class,
                 attribute_templates,
             )
@@ -126,6 +118,7 @@ class SensorTemplate(Entity):
         entity_picture_template,
         availability_template,
         entity_ids,
+        templates,
         device_class,
         attribute_templates,
     ):
@@ -145,6 +138,7 @@ class SensorTemplate(Entity):
         self._icon = None
         self._entity_picture = None
         self._entities = entity_ids
+        self._templates = templates
         self._device_class = device_class
         self._available = True
         self._attribute_templates = attribute_templates
@@ -154,18 +148,22 @@ class SensorTemplate(Entity):
         """Register callbacks."""
 
         @callback
-        def template_sensor_state_listener(entity, old_state, new_state):
+        def template_sensor_state_listener():
             """Handle device state changes."""
             self.async_schedule_update_ha_state(True)
 
         @callback
         def template_sensor_startup(event):
             """Update template on startup."""
-            if self._entities != MATCH_ALL:
-                # Track state change only for valid templates
-                async_track_state_change(
-                    self.hass, self._entities, template_sensor_state_listener
+            self.async_on_remove(
+                async_track_templates(
+                    self.hass,
+                    self._entities,
+                    self._templates,
+                    template_sensor_state_listener,
+                    self._attribute_templates,
                 )
+            )
 
             self.async_schedule_update_ha_state(True)
 
@@ -11,6 +11,7 @@ from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.event import async_track_state_change
 from homeassistant.helpers.service import async_get_all_descriptions
 from homeassistant.loader import IntegrationNotFound, async_get_integration
+from homeassistant.setup import async_get_setup_timeline
 
 from . import const, decorators, messages
 
@@ -30,6 +31,7 @@ def async_register_commands(hass, async_reg):
     async_reg(hass, handle_render_template)
     async_reg(hass, handle_manifest_list)
     async_reg(hass, handle_manifest_get)
+    async_reg(hass, handle_setup_timeline)
 
 
 def pong_message(iden):
@@ -55,6 +57,16 @@ def handle_subscribe_events(hass, connection, msg):
     if event_type not in SUBSCRIBE_WHITELIST and not connection.user.is_admin:
         raise Unauthorized
 
+    @callback
+    def send_event(event):
+        """Send an event, serialized once for all connections."""
+        try:
+            message = messages.cached_event_message(hass, msg["id"], event)
+        except (ValueError, TypeError):
+            # Let the writer report the unserializable data
+            message = messages.event_message(msg["id"], event.as_dict())
+        connection.send_message(message)
+
     if event_type == EVENT_STATE_CHANGED:
 
         @callback
@@ -65,7 +77,7 @@ def handle_subscribe_events(hass, connection, msg):
             ):
                 return
 
-            connection.send_message(messages.event_message(msg["id"], event))
+            send_event(event)
 
     else:
 
@@ -75,7 +87,7 @@ def handle_subscribe_events(hass, connection, msg):
             if event.event_type == EVENT_TIME_CHANGED:
                 return
 
-            connection.send_message(messages.event_message(msg["id"], event.as_dict()))
+            send_event(event)
 
     connection.subscriptions[msg["id"]] = hass.bus.async_listen(
         event_type, forward_events
@@ -219,6 +231,14 @@ async def handle_manifest_get(hass, connection, msg):
         connection.send_error(msg["id"], const.ERR_NOT_FOUND, "Integration not found")
 
 
+@callback
+@decorators.require_admin
+@decorators.websocket_command({vol.Required("type"): "setup/timeline"})
+def handle_setup_timeline(hass, connection, msg):
+    """Handle setup timeline command."""
+    connection.send_result(msg["id"], async_get_setup_timeline(hass))
+
+
 @callback
 @decorators.websocket_command({vol.Required("type"): "ping"})
 def handle_ping(hass, connection, msg):
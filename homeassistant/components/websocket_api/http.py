@@ -60,6 +60,15 @@ class WebSocketHandler:
         self._writer_task = None
         self._logger = logging.getLogger("{}.connection.{}".format(__name__, id(self)))
         self._peak_checker_unsub = None
+        self.messages_sent = 0
+        self.bytes_sent = 0
+
+    async def _send_str(self, message: str) -> None:
+        """Send a serialized message and keep track of the volume."""
+        assert self.wsock is not None
+        await self.wsock.send_str(message)
+        self.messages_sent += 1
+        self.bytes_sent += len(message)
 
     async def _writer(self):
         """Write outgoing messages."""
@@ -73,7 +82,7 @@ class WebSocketHandler:
                 self._logger.debug("Sending %s", message)
 
                 if isinstance(message, str):
-                    await self.wsock.send_str(message)
+                    await self._send_str(message)
                     continue
 
                 try:
@@ -92,7 +101,7 @@ class WebSocketHandler:
                     )
                     continue
 
-                await self.wsock.send_str(dumped)
+                await self._send_str(dumped)
 
         # Clean up the peaker checker when we shut down the writer
         if self._peak_checker_unsub:
@@ -250,6 +259,10 @@ class WebSocketHandler:
 
             await wsock.close()
 
+            self._logger.debug(
+                "Sent %d messages (%d bytes)", self.messages_sent, self.bytes_sent
+            )
+
             if disconnect_warn is None:
                 self._logger.debug("Disconnected")
             else:
@@ -1,7 +1,10 @@
 """Message templates for websocket commands."""
+from collections import OrderedDict
+from typing import Tuple
 
 import voluptuous as vol
 
+from homeassistant.core import Event, HomeAssistant
 from homeassistant.helpers import config_validation as cv
 
 from . import const
@@ -14,6 +17,13 @@ MINIMAL_MESSAGE_SCHEMA = vol.Schema(
     extra=vol.ALLOW_EXTRA,
 )
 
+# Number of serialized events to keep around for other connections
+EVENT_MESSAGE_CACHE_SIZE = 128
+
+# Serialized events keyed by the id of the event. The event is stored
+# with its serialization so the id can not be reused while cached.
+DATA_EVENT_MESSAGE_CACHE = "websocket_api_event_message_cache"
+
 # Base schema to extend by message handlers
 BASE_COMMAND_MESSAGE_SCHEMA = vol.Schema({vol.Required("id"): cv.positive_int})
 
@@ -36,3 +46,23 @@ def error_message(iden, code, message):
 def event_message(iden, event):
     """Return an event message."""
     return {"id": iden, "type": "event", "event": event}
+
+
+def cached_event_message(hass: HomeAssistant, iden: int, event: Event) -> str:
+    """Return an event message serialized to JSON.
+
+    Many connections receive the same events, so the event is only
+    serialized once and each connection splices in its own id.
+    """
+    cache: "OrderedDict[int, Tuple[Event, str]]" = hass.data.setdefault(
+        DATA_EVENT_MESSAGE_CACHE, OrderedDict()
+    )
+    cached = cache.get(id(event))
+
+    if cached is None or cached[0] is not event:
+        body = const.JSON_DUMP({"type": "event", "event": event})
+        cached = cache[id(event)] = (event, body)
+        if len(cache) > EVENT_MESSAGE_CACHE_SIZE:
+            cache.popitem(last=False)
+
+    return f'{{"id":{iden},{cached[1][1:]}'
@@ -27,6 +27,7 @@ from typing import (
     Mapping,
     Optional,
     Set,
+    Tuple,
     TypeVar,
     Union,
     cast,
@@ -534,7 +535,9 @@ class EventBus:
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
-        self._listeners: Dict[str, List[Callable]] = {}
+        self._listeners: Dict[
+            str, List[Tuple[Callable, Optional[Callable[[Event], bool]]]]
+        ] = {}
         self._hass = hass
 
     @callback
@@ -578,19 +581,24 @@ class EventBus:
 
         # EVENT_HOMEASSISTANT_CLOSE should go only to his listeners
         match_all_listeners = self._listeners.get(MATCH_ALL)
-        if match_all_listeners is not None and event_type != EVENT_HOMEASSISTANT_CLOSE:
-            listeners = match_all_listeners + listeners
+        if match_all_listeners is None or event_type == EVENT_HOMEASSISTANT_CLOSE:
+            match_all_listeners = []
 
         event = Event(event_type, event_data, origin, None, context)
 
         if event_type != EVENT_TIME_CHANGED:
             _LOGGER.debug("Bus:Handling %s", event)
 
-        if not listeners:
-            return
-
-        for func in listeners:
-            self._hass.async_add_job(func, event)
+        for listeners_list in (match_all_listeners, listeners):
+            for func, event_filter in listeners_list:
+                if event_filter is not None:
+                    try:
+                        if not event_filter(event):
+                            continue
+                    except Exception:  # pylint: disable=broad-except
+                        _LOGGER.exception("Error in event filter")
+                        continue
+                self._hass.async_add_job(func, event)
 
     def listen(self, event_type: str, listener: Callable) -> CALLBACK_TYPE:
         """Listen for all events or events of a specific type.
@@ -609,22 +617,33 @@ class EventBus:
         return remove_listener
 
     @callback
-    def async_listen(self, event_type: str, listener: Callable) -> CALLBACK_TYPE:
+    def async_listen(
+        self,
+        event_type: str,
+        listener: Callable,
+        event_filter: Optional[Callable[[Event], bool]] = None,
+    ) -> CALLBACK_TYPE:
         """Listen for all events or events of a specific type.
 
         To listen to all events specify the constant ``MATCH_ALL``
         as event_type.
 
+        An optional event_filter, which must be a callback, is run
+        when the event is fired and the listener is only scheduled
+        if it returns True. Use it to route events with a dict lookup
+        instead of waking up listeners that will return right away.
+
         This method must be run in the event loop.
         """
+        filterable_listener = (listener, event_filter)
         if event_type in self._listeners:
-            self._listeners[event_type].append(listener)
+            self._listeners[event_type].append(filterable_listener)
         else:
-            self._listeners[event_type] = [listener]
+            self._listeners[event_type] = [filterable_listener]
 
         def remove_listener() -> None:
             """Remove the listener."""
-            self._async_remove_listener(event_type, listener)
+            self._async_remove_listener(event_type, filterable_listener)
 
         return remove_listener
 
@@ -669,19 +688,23 @@ class EventBus:
             # multiple times as well.
             # This will make sure the second time it does nothing.
             setattr(onetime_listener, "run", True)
-            self._async_remove_listener(event_type, onetime_listener)
+            self._async_remove_listener(event_type, (onetime_listener, None))
             self._hass.async_run_job(listener, event)
 
         return self.async_listen(event_type, onetime_listener)
 
     @callback
-    def _async_remove_listener(self, event_type: str, listener: Callable) -> None:
+    def _async_remove_listener(
+        self,
+        event_type: str,
+        filterable_listener: Tuple[Callable, Optional[Callable[[Event], bool]]],
+    ) -> None:
         """Remove a listener of a specific event_type.
 
         This method must be run in the event loop.
         """
         try:
-            self._listeners[event_type].remove(listener)
+            self._listeners[event_type].remove(filterable_listener)
 
             # delete event_type list if empty
             if not self._listeners[event_type]:
@@ -689,7 +712,9 @@ class EventBus:
         except (KeyError, ValueError):
             # KeyError is key event_type listener did not exist
             # ValueError if listener did not exist within event_type
-            _LOGGER.warning("Unable to remove unknown listener %s", listener)
+            _LOGGER.warning(
+                "Unable to remove unknown listener %s", filterable_listener[0]
+            )
 
 
 class State:
@@ -1,7 +1,18 @@
 """Provide a way to connect entities belonging to one device."""
-from collections import OrderedDict
 import logging
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+    cast,
+)
 import uuid
 
 import attr
@@ -10,6 +21,7 @@ from homeassistant.const import EVENT_HOMEASSISTANT_STARTED
 from homeassistant.core import Event, callback
 
 from .debounce import Debouncer
+from .registry import IndexedRegistryItems
 from .singleton import singleton
 from .typing import HomeAssistantType
 
@@ -97,16 +109,49 @@ def format_mac(mac: str) -> str:
     return mac
 
 
+class DeviceRegistryItems(IndexedRegistryItems):
+    """Container for device registry entries, maps device id -> entry.
+
+    Device ids are indexed by identifier, connection, config entry id and, for
+    devices that are not deleted, area id.
+    """
+
+    def _index_keys(
+        self, entry: Union[DeviceEntry, DeletedDeviceEntry]
+    ) -> Dict[str, Iterable[Hashable]]:
+        """Return the keys to index an entry under for each index."""
+        area_id = getattr(entry, "area_id", None)
+        return {
+            "identifiers": entry.identifiers,
+            "connections": entry.connections,
+            "config_entries": entry.config_entries,
+            "area_id": [area_id] if area_id else [],
+        }
+
+    def get_device(
+        self, identifiers: set, connections: set
+    ) -> Optional[Union[DeviceEntry, DeletedDeviceEntry]]:
+        """Return a device with one of the identifiers or connections."""
+        for name, keys in (("identifiers", identifiers), ("connections", connections)):
+            for key in keys:
+                device = self.get_entry(name, key)
+                if device is not None:
+                    return cast(Union[DeviceEntry, DeletedDeviceEntry], device)
+        return None
+
+
 class DeviceRegistry:
     """Class to hold a registry of devices."""
 
-    devices: Dict[str, DeviceEntry]
-    deleted_devices: Dict[str, DeletedDeviceEntry]
+    devices: DeviceRegistryItems
+    deleted_devices: DeviceRegistryItems
 
     def __init__(self, hass: HomeAssistantType) -> None:
         """Initialize the device registry."""
         self.hass = hass
-        self._store = hass.helpers.storage.Store(STORAGE_VERSION, STORAGE_KEY)
+        self._store = hass.helpers.storage.Store(
+            STORAGE_VERSION, STORAGE_KEY, compact=True
+        )
 
     @callback
     def async_get(self, device_id: str) -> Optional[DeviceEntry]:
@@ -118,24 +163,19 @@ class DeviceRegistry:
         self, identifiers: set, connections: set
     ) -> Optional[DeviceEntry]:
         """Check if device is registered."""
-        for device in self.devices.values():
-            if any(iden in device.identifiers for iden in identifiers) or any(
-                conn in device.connections for conn in connections
-            ):
-                return device
-        return None
+        return cast(
+            Optional[DeviceEntry], self.devices.get_device(identifiers, connections)
+        )
 
     @callback
     def _async_get_deleted_device(
         self, identifiers: set, connections: set
     ) -> Optional[DeletedDeviceEntry]:
         """Check if device has previously been registered."""
-        for device in self.deleted_devices.values():
-            if any(iden in device.identifiers for iden in identifiers) or any(
-                conn in device.connections for conn in connections
-            ):
-                return device
-        return None
+        return cast(
+            Optional[DeletedDeviceEntry],
+            self.deleted_devices.get_device(identifiers, connections),
+        )
 
     @callback
     def async_get_or_create(
@@ -339,8 +379,8 @@ class DeviceRegistry:
 
         data = await self._store.async_load()
 
-        devices = OrderedDict()
-        deleted_devices = OrderedDict()
+        devices = DeviceRegistryItems()
+        deleted_devices = DeviceRegistryItems()
 
         if data is not None:
             for device in data["devices"]:
@@ -418,12 +458,12 @@ class DeviceRegistry:
     @callback
     def async_clear_config_entry(self, config_entry_id: str) -> None:
         """Clear config entry from registry entries."""
-        for device in list(self.devices.values()):
+        for device in async_entries_for_config_entry(self, config_entry_id):
             self._async_update_device(device.id, remove_config_entry_id=config_entry_id)
-        for deleted_device in list(self.deleted_devices.values()):
+        for deleted_device in self.deleted_devices.get_entries(
+            "config_entries", config_entry_id
+        ):
             config_entries = deleted_device.config_entries
-            if config_entry_id not in config_entries:
-                continue
             if config_entries == {config_entry_id}:
                 # Permanently remove the device from the device registry.
                 del self.deleted_devices[deleted_device.id]
@@ -437,9 +477,8 @@ class DeviceRegistry:
     @callback
     def async_clear_area_id(self, area_id: str) -> None:
         """Clear area id from registry entries."""
-        for dev_id, device in self.devices.items():
-            if area_id == device.area_id:
-                self._async_update_device(dev_id, area_id=None)
+        for device in async_entries_for_area(self, area_id):
+            self._async_update_device(device.id, area_id=None)
 
 
 @singleton(DATA_REGISTRY)
@@ -453,7 +492,7 @@ async def async_get_registry(hass: HomeAssistantType) -> DeviceRegistry:
 @callback
 def async_entries_for_area(registry: DeviceRegistry, area_id: str) -> List[DeviceEntry]:
     """Return entries that match an area."""
-    return [device for device in registry.devices.values() if device.area_id == area_id]
+    return cast(List[DeviceEntry], registry.devices.get_entries("area_id", area_id))
 
 
 @callback
@@ -461,11 +500,10 @@ def async_entries_for_config_entry(
     registry: DeviceRegistry, config_entry_id: str
 ) -> List[DeviceEntry]:
     """Return entries that match a config entry."""
-    return [
-        device
-        for device in registry.devices.values()
-        if config_entry_id in device.config_entries
-    ]
+    return cast(
+        List[DeviceEntry],
+        registry.devices.get_entries("config_entries", config_entry_id),
+    )
 
 
 @callback
@@ -5,7 +5,7 @@ from datetime import datetime, timedelta
 import functools as ft
 import logging
 from timeit import default_timer as timer
-from typing import Any, Awaitable, Dict, Iterable, List, Optional, Union
+from typing import Any, Awaitable, Dict, Iterable, List, Optional, Tuple, Union
 
 from homeassistant.config import DATA_CUSTOMIZE
 from homeassistant.const import (
@@ -24,7 +24,7 @@ from homeassistant.const import (
     TEMP_CELSIUS,
     TEMP_FAHRENHEIT,
 )
-from homeassistant.core import CALLBACK_TYPE, Context, HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, Context, HomeAssistant, State, callback
 from homeassistant.exceptions import NoEntitySpecifiedError
 from homeassistant.helpers.entity_platform import EntityPlatform
 from homeassistant.helpers.entity_registry import (
@@ -117,6 +117,10 @@ class Entity(ABC):
     _context: Optional[Context] = None
     _context_set: Optional[datetime] = None
 
+    # Values the last written state was built from
+    _state_memo: Optional[Tuple] = None
+    _written_state: Optional[State] = None
+
     @property
     def should_poll(self) -> bool:
         """Return True if entity has to be polled for state.
@@ -305,46 +309,32 @@ class Entity(ABC):
 
         start = timer()
 
-        attr = self.capability_attributes
-        attr = dict(attr) if attr else {}
-
-        if not self.available:
-            state = STATE_UNAVAILABLE
-        else:
+        capability_attr = self.capability_attributes
+        available = self.available
+        if available:
             sstate = self.state
             state = STATE_UNKNOWN if sstate is None else str(sstate)
-            attr.update(self.state_attributes or {})
-            attr.update(self.device_state_attributes or {})
-
-        unit_of_measurement = self.unit_of_measurement
-        if unit_of_measurement is not None:
-            attr[ATTR_UNIT_OF_MEASUREMENT] = unit_of_measurement
+            state_attr = self.state_attributes
+            device_state_attr = self.device_state_attributes
+        else:
+            state = STATE_UNAVAILABLE
+            state_attr = device_state_attr = None
 
         entry = self.registry_entry
         # pylint: disable=consider-using-ternary
-        name = (entry and entry.name) or self.name
-        if name is not None:
-            attr[ATTR_FRIENDLY_NAME] = name
-
-        icon = (entry and entry.icon) or self.icon
-        if icon is not None:
-            attr[ATTR_ICON] = icon
-
-        entity_picture = self.entity_picture
-        if entity_picture is not None:
-            attr[ATTR_ENTITY_PICTURE] = entity_picture
-
-        assumed_state = self.assumed_state
-        if assumed_state:
-            attr[ATTR_ASSUMED_STATE] = assumed_state
-
-        supported_features = self.supported_features
-        if supported_features is not None:
-            attr[ATTR_SUPPORTED_FEATURES] = supported_features
-
-        device_class = self.device_class
-        if device_class is not None:
-            attr[ATTR_DEVICE_CLASS] = str(device_class)
+        memo = (
+            state,
+            capability_attr,
+            state_attr,
+            device_state_attr,
+            self.unit_of_measurement,
+            (entry and entry.name) or self.name,
+            (entry and entry.icon) or self.icon,
+            self.entity_picture,
+            self.assumed_state,
+            self.supported_features,
+            self.device_class,
+        )
 
         end = timer()
 
@@ -371,15 +361,65 @@ class Entity(ABC):
                 extra,
             )
 
-        # Overwrite properties that have been set in the config file.
         assert self.hass is not None
-        if DATA_CUSTOMIZE in self.hass.data:
-            attr.update(self.hass.data[DATA_CUSTOMIZE].get(self.entity_id))
+        customize = self.hass.data.get(DATA_CUSTOMIZE)
+        units = self.hass.config.units
+
+        if (
+            not self.force_update
+            and self._written_state is not None
+            and self._state_memo == (memo, customize, units)
+            and self.hass.states.get(self.entity_id) is self._written_state
+        ):
+            # Nothing changed since the last write, skip building the state
+            if self.platform is not None:
+                self.platform.suppressed_state_writes += 1
+            return
+
+        (
+            unit_of_measurement,
+            name,
+            icon,
+            entity_picture,
+            assumed_state,
+            supported_features,
+            device_class,
+        ) = memo[4:]
+
+        attr = dict(capability_attr) if capability_attr else {}
+
+        if available:
+            attr.update(state_attr or {})
+            attr.update(device_state_attr or {})
+
+        if unit_of_measurement is not None:
+            attr[ATTR_UNIT_OF_MEASUREMENT] = unit_of_measurement
+
+        if name is not None:
+            attr[ATTR_FRIENDLY_NAME] = name
+
+        if icon is not None:
+            attr[ATTR_ICON] = icon
+
+        if entity_picture is not None:
+            attr[ATTR_ENTITY_PICTURE] = entity_picture
+
+        if assumed_state:
+            attr[ATTR_ASSUMED_STATE] = assumed_state
+
+        if supported_features is not None:
+            attr[ATTR_SUPPORTED_FEATURES] = supported_features
+
+        if device_class is not None:
+            attr[ATTR_DEVICE_CLASS] = str(device_class)
+
+        # Overwrite properties that have been set in the config file.
+        if customize is not None:
+            attr.update(customize.get(self.entity_id))
 
         # Convert temperature if we detect one
         try:
             unit_of_measure = attr.get(ATTR_UNIT_OF_MEASUREMENT)
-            units = self.hass.config.units
             if (
                 unit_of_measure in (TEMP_CELSIUS, TEMP_FAHRENHEIT)
                 and unit_of_measure != units.temperature_unit
@@ -403,6 +443,16 @@ class Entity(ABC):
             self.entity_id, state, attr, self.force_update, self._context
         )
 
+        # Copy the attribute dicts so changes made to them in place are seen
+        self._state_memo = (
+            tuple(dict(value) if isinstance(value, dict) else value for value in memo),
+            customize,
+            units,
+        )
+        self._written_state = self.hass.states.get(self.entity_id)
+        if self.platform is not None:
+            self.platform.emitted_state_writes += 1
+
     def schedule_update_ha_state(self, force_refresh: bool = False) -> None:
         """Schedule an update ha state change task.
 
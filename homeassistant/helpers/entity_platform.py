@@ -4,13 +4,14 @@ from contextvars import ContextVar
 from datetime import datetime, timedelta
 from logging import Logger
 from types import ModuleType
-from typing import TYPE_CHECKING, Dict, Iterable, List, Optional
+from typing import TYPE_CHECKING, Awaitable, Callable, Dict, Iterable, List, Optional
 
 from homeassistant.const import DEVICE_DEFAULT_NAME
 from homeassistant.core import CALLBACK_TYPE, callback, split_entity_id, valid_entity_id
 from homeassistant.exceptions import HomeAssistantError, PlatformNotReady
 from homeassistant.helpers import config_validation as cv, service
 from homeassistant.helpers.typing import HomeAssistantType
+from homeassistant.setup import async_track_setup_time
 from homeassistant.util.async_ import run_callback_threadsafe
 
 from .entity_registry import DISABLED_INTEGRATION
@@ -41,6 +42,7 @@ class EntityPlatform:
         platform: Optional[ModuleType],
         scan_interval: timedelta,
         entity_namespace: Optional[str],
+        component_entities: Optional[Dict[str, "Entity"]] = None,
     ):
         """Initialize the entity platform."""
         self.hass = hass
@@ -52,6 +54,10 @@ class EntityPlatform:
         self.entity_namespace = entity_namespace
         self.config_entry = None
         self.entities: Dict[str, Entity] = {}  # pylint: disable=used-before-assignment
+        # Entities of all platforms of the entity component by entity id
+        self.component_entities = component_entities
+        # Service handlers that are called once with all entities targeted
+        self.batch_service_handlers: Dict[str, Callable[..., Awaitable]] = {}
         self._tasks: List[asyncio.Future] = []
         # Method to cancel the state change listener
         self._async_unsub_polling: Optional[CALLBACK_TYPE] = None
@@ -60,6 +66,9 @@ class EntityPlatform:
         self._process_updates: Optional[asyncio.Lock] = None
 
         self.parallel_updates: Optional[asyncio.Semaphore] = None
+        # Number of state writes skipped or done by the entities, for profiling
+        self.suppressed_state_writes = 0
+        self.emitted_state_writes = 0
 
         # Platform is None for the EntityComponent "catch-all" EntityPlatform
         # which powers entity_component.add_entities
@@ -174,17 +183,18 @@ class EntityPlatform:
         )
 
         try:
-            task = async_create_setup_task()
+            with async_track_setup_time(hass, full_name, "platform"):
+                task = async_create_setup_task()
 
-            await asyncio.wait_for(asyncio.shield(task), SLOW_SETUP_MAX_WAIT)
+                await asyncio.wait_for(asyncio.shield(task), SLOW_SETUP_MAX_WAIT)
 
-            # Block till all entities are done
-            if self._tasks:
-                pending = [task for task in self._tasks if not task.done()]
-                self._tasks.clear()
+                # Block till all entities are done
+                if self._tasks:
+                    pending = [task for task in self._tasks if not task.done()]
+                    self._tasks.clear()
 
-                if pending:
-                    await asyncio.gather(*pending)
+                    if pending:
+                        await asyncio.gather(*pending)
 
             hass.config.components.add(full_name)
             return True
@@ -444,7 +454,19 @@ class EntityPlatform:
 
         entity_id = entity.entity_id
         self.entities[entity_id] = entity
-        entity.async_on_remove(lambda: self.entities.pop(entity_id))
+        if self.component_entities is not None:
+            self.component_entities[entity_id] = entity
+
+        def remove_entity_cb() -> None:
+            """Remove entity from the entities of the platform and component."""
+            self.entities.pop(entity_id)
+            if (
+                self.component_entities is not None
+                and self.component_entities.get(entity_id) is entity
+            ):
+                self.component_entities.pop(entity_id)
+
+        entity.async_on_remove(remove_entity_cb)
 
         await entity.async_internal_added_to_hass()
         await entity.async_added_to_hass()
@@ -531,6 +553,18 @@ class EntityPlatform:
             self.platform_name, name, handle_service, schema
         )
 
+    @callback
+    def async_register_batch_service_handler(
+        self, func: str, handler: Callable[..., Awaitable]
+    ) -> None:
+        """Register a handler for an entity service method of the entities.
+
+        Entity service calls that call the method `func` on entities of this
+        platform call the handler once with the list of the entities and the
+        service data instead of calling the method on every entity.
+        """
+        self.batch_service_handlers[func] = handler
+
     async def _update_entity_states(self, now: datetime) -> None:
         """Update the states of all the polling entities.
 
@@ -7,13 +7,13 @@ The Entity Registry will persist itself 10 seconds after a new entity is
 registered. Registering a new entity while a timer is in progress resets the
 timer.
 """
-from collections import OrderedDict
 import logging
 from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
     Dict,
+    Hashable,
     Iterable,
     List,
     Optional,
@@ -37,6 +37,7 @@ from homeassistant.helpers.device_registry import EVENT_DEVICE_REGISTRY_UPDATED
 from homeassistant.util import slugify
 from homeassistant.util.yaml import load_yaml
 
+from .registry import IndexedRegistryItems
 from .singleton import singleton
 from .typing import HomeAssistantType
 
@@ -118,14 +119,34 @@ class RegistryEntry:
         return self.disabled_by is not None
 
 
+class EntityRegistryItems(IndexedRegistryItems):
+    """Container for entity registry entries, maps entity_id -> entry.
+
+    Entity ids are indexed by (domain, platform, unique_id), device id and
+    config entry id.
+    """
+
+    def _index_keys(self, entry: RegistryEntry) -> Dict[str, Iterable[Hashable]]:
+        """Return the keys to index an entry under for each index."""
+        return {
+            "unique_id": [(entry.domain, entry.platform, entry.unique_id)],
+            "device_id": [entry.device_id] if entry.device_id else [],
+            "config_entry_id": (
+                [entry.config_entry_id] if entry.config_entry_id else []
+            ),
+        }
+
+
 class EntityRegistry:
     """Class to hold a registry of entities."""
 
     def __init__(self, hass: HomeAssistantType):
         """Initialize the registry."""
         self.hass = hass
-        self.entities: Dict[str, RegistryEntry]
-        self._store = hass.helpers.storage.Store(STORAGE_VERSION, STORAGE_KEY)
+        self.entities: EntityRegistryItems
+        self._store = hass.helpers.storage.Store(
+            STORAGE_VERSION, STORAGE_KEY, compact=True
+        )
         self.hass.bus.async_listen(
             EVENT_DEVICE_REGISTRY_UPDATED, self.async_device_removed
         )
@@ -161,14 +182,8 @@ class EntityRegistry:
         self, domain: str, platform: str, unique_id: str
     ) -> Optional[str]:
         """Check if an entity_id is currently registered."""
-        for entity in self.entities.values():
-            if (
-                entity.domain == domain
-                and entity.platform == platform
-                and entity.unique_id == unique_id
-            ):
-                return entity.entity_id
-        return None
+        entity = self.entities.get_entry("unique_id", (domain, platform, unique_id))
+        return entity.entity_id if entity else None
 
     @callback
     def async_generate_entity_id(
@@ -381,15 +396,8 @@ class EntityRegistry:
             entity_id = changes["entity_id"] = new_entity_id
 
         if new_unique_id is not _UNDEF:
-            conflict = next(
-                (
-                    entity
-                    for entity in self.entities.values()
-                    if entity.unique_id == new_unique_id
-                    and entity.domain == old.domain
-                    and entity.platform == old.platform
-                ),
-                None,
+            conflict = self.entities.get_entry(
+                "unique_id", (old.domain, old.platform, new_unique_id)
             )
             if conflict:
                 raise ValueError(
@@ -424,7 +432,7 @@ class EntityRegistry:
             old_conf_load_func=load_yaml,
             old_conf_migrate_func=_async_migrate,
         )
-        entities: Dict[str, RegistryEntry] = OrderedDict()
+        entities = EntityRegistryItems()
 
         if data is not None:
             for entity in data["entities"]:
@@ -488,12 +496,8 @@ class EntityRegistry:
     @callback
     def async_clear_config_entry(self, config_entry: str) -> None:
         """Clear config entry from registry entries."""
-        for entity_id in [
-            entity_id
-            for entity_id, entry in self.entities.items()
-            if config_entry == entry.config_entry_id
-        ]:
-            self.async_remove(entity_id)
+        for entry in async_entries_for_config_entry(self, config_entry):
+            self.async_remove(entry.entity_id)
 
 
 @singleton(DATA_REGISTRY)
@@ -509,9 +513,9 @@ def async_entries_for_device(
     registry: EntityRegistry, device_id: str
 ) -> List[RegistryEntry]:
     """Return entries that match a device."""
-    return [
-        entry for entry in registry.entities.values() if entry.device_id == device_id
-    ]
+    return cast(
+        List[RegistryEntry], registry.entities.get_entries("device_id", device_id)
+    )
 
 
 @callback
@@ -519,11 +523,10 @@ def async_entries_for_config_entry(
     registry: EntityRegistry, config_entry_id: str
 ) -> List[RegistryEntry]:
     """Return entries that match a config entry."""
-    return [
-        entry
-        for entry in registry.entities.values()
-        if entry.config_entry_id == config_entry_id
-    ]
+    return cast(
+        List[RegistryEntry],
+        registry.entities.get_entries("config_entry_id", config_entry_id),
+    )
 
 
 async def _async_migrate(entities: Dict[str, Any]) -> Dict[str, List[Dict[str, Any]]]:
@@ -604,10 +607,7 @@ async def async_migrate_entries(
     """Migrator of unique IDs."""
     ent_reg = await async_get_registry(hass)
 
-    for entry in ent_reg.entities.values():
-        if entry.config_entry_id != config_entry_id:
-            continue
-
+    for entry in async_entries_for_config_entry(ent_reg, config_entry_id):
         updates = entry_callback(entry)
 
         if updates is not None:
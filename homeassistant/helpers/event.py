@@ -1,9 +1,20 @@
 """Helpers for listening to events."""
+import asyncio
 from datetime import datetime, timedelta
 import functools as ft
 import logging
 import time
-from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Union
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Optional,
+    Set,
+    Union,
+)
 
 import attr
 
@@ -17,8 +28,9 @@ from homeassistant.const import (
     SUN_EVENT_SUNSET,
 )
 from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, State, callback
+from homeassistant.exceptions import TemplateError
 from homeassistant.helpers.sun import get_astral_event_next
-from homeassistant.helpers.template import Template
+from homeassistant.helpers.template import RenderInfo, Template
 from homeassistant.loader import bind_hass
 from homeassistant.util import dt as dt_util
 from homeassistant.util.async_ import run_callback_threadsafe
@@ -26,6 +38,15 @@ from homeassistant.util.async_ import run_callback_threadsafe
 TRACK_STATE_CHANGE_CALLBACKS = "track_state_change_callbacks"
 TRACK_STATE_CHANGE_LISTENER = "track_state_change_listener"
 
+_TEMPLATE_TRACK_ENTITIES = "entities"
+_TEMPLATE_TRACK_FILTERED = "filtered"
+
+TRACK_TIME_PATTERN_CLOCK = "track_time_pattern_clock"
+
+# Drift in seconds between the wall clock and the loop clock from one
+# time changed event to the next that is handled as the clock jumping.
+CLOCK_JUMP_TOLERANCE = 0.5
+
 _LOGGER = logging.getLogger(__name__)
 
 # PyLint does not like the use of threaded_listener_factory
@@ -153,6 +174,11 @@ def async_track_state_change_event(
 
     if TRACK_STATE_CHANGE_LISTENER not in hass.data:
 
+        @callback
+        def _async_state_change_filter(event: Event) -> bool:
+            """Filter state changes by entity_id."""
+            return event.data.get("entity_id") in entity_callbacks
+
         @callback
         def _async_state_change_dispatcher(event: Event) -> None:
             """Dispatch state changes by entity_id."""
@@ -161,7 +187,7 @@ def async_track_state_change_event(
             if entity_id not in entity_callbacks:
                 return
 
-            for action in entity_callbacks[entity_id]:
+            for action in entity_callbacks[entity_id][:]:
                 try:
                     hass.async_run_job(action, event)
                 except Exception:  # pylint: disable=broad-except
@@ -170,7 +196,9 @@ def async_track_state_change_event(
                     )
 
         hass.data[TRACK_STATE_CHANGE_LISTENER] = hass.bus.async_listen(
-            EVENT_STATE_CHANGED, _async_state_change_dispatcher
+            EVENT_STATE_CHANGED,
+            _async_state_change_dispatcher,
+            event_filter=_async_state_change_filter,
         )
 
     entity_ids = [entity_id.lower() for entity_id in entity_ids]
@@ -215,32 +243,146 @@ def async_track_template(
     variables: Optional[Dict[str, Any]] = None,
 ) -> CALLBACK_TYPE:
     """Add a listener that track state changes with template condition."""
-    from . import condition  # pylint: disable=import-outside-toplevel
-
     # Local variable to keep track of if the action has already been triggered
     already_triggered = False
 
     @callback
-    def template_condition_listener(entity_id: str, from_s: State, to_s: State) -> None:
+    def template_condition_listener(
+        event: Event,
+        last_result: Union[str, TemplateError, None],
+        result: Union[str, TemplateError],
+    ) -> None:
         """Check if condition is correct and run action."""
         nonlocal already_triggered
-        template_result = condition.async_template(hass, template, variables)
+
+        if isinstance(result, TemplateError):
+            _LOGGER.error("Error during template condition: %s", result)
+            template_result = False
+        else:
+            template_result = result.lower() == "true"
 
         # Check to see if template returns true
         if template_result and not already_triggered:
             already_triggered = True
-            hass.async_run_job(action, entity_id, from_s, to_s)
+            hass.async_run_job(
+                action,
+                event.data.get("entity_id"),
+                event.data.get("old_state"),
+                event.data.get("new_state"),
+            )
         elif not template_result:
             already_triggered = False
 
-    return async_track_state_change(
-        hass, template.extract_entities(variables), template_condition_listener
+    return async_track_template_result(
+        hass, template, template_condition_listener, variables
     )
 
 
 track_template = threaded_listener_factory(async_track_template)
 
 
+@callback
+@bind_hass
+def async_track_template_result(
+    hass: HomeAssistant,
+    template: Template,
+    action: Callable[
+        [Event, Union[str, TemplateError, None], Union[str, TemplateError]], None
+    ],
+    variables: Optional[Dict[str, Any]] = None,
+) -> CALLBACK_TYPE:
+    """Add a listener that renders a template on the state changes it depends on.
+
+    The listeners are armed from the states the last render accessed, so the
+    template only re-renders when one of its entities changes, or an entity
+    of a domain it iterated over is added or removed. Templates that fail to
+    render or do not access any state re-render on every state change, static
+    templates are not tracked.
+
+    The action is called with the state changed event, the previous result
+    and the new result of the template after every re-render. Failed renders
+    pass the TemplateError as result.
+    """
+    info = template.async_render_to_info(variables)
+    last_result: Union[str, TemplateError, None] = None
+    track_mode: Optional[str] = None
+    tracked_entities: FrozenSet[str] = frozenset()
+    remove_listener: Optional[CALLBACK_TYPE] = None
+
+    def _render_result(render_info: RenderInfo) -> Union[str, TemplateError]:
+        """Return the result of a render or the error it raised."""
+        try:
+            return render_info.result
+        except TemplateError as err:
+            return err
+
+    @callback
+    def _event_filter(event: Event) -> bool:
+        """Filter the state changes the last render depends on."""
+        entity_id: str = event.data["entity_id"]
+        if event.data.get("old_state") is None or event.data.get("new_state") is None:
+            return info.filter_lifecycle(entity_id)
+        return info.filter(entity_id)
+
+    @callback
+    def _refresh(event: Event) -> None:
+        """Re-render the template and re-arm the listeners."""
+        nonlocal info, last_result
+
+        info = template.async_render_to_info(variables)
+        previous_result, last_result = last_result, _render_result(info)
+        _arm_listeners()
+
+        hass.async_run_job(action, event, previous_result, last_result)
+
+    @callback
+    def _arm_listeners() -> None:
+        """Listen to the state changes the last render depends on."""
+        nonlocal track_mode, tracked_entities, remove_listener
+
+        if isinstance(last_result, TemplateError) or not (
+            info.all_states or info.domains or info.entities
+        ):
+            mode = MATCH_ALL
+        elif info.all_states or info.domains:
+            mode = _TEMPLATE_TRACK_FILTERED
+        else:
+            mode = _TEMPLATE_TRACK_ENTITIES
+
+        if mode == track_mode and (
+            mode != _TEMPLATE_TRACK_ENTITIES or info.entities == tracked_entities
+        ):
+            return
+
+        if remove_listener is not None:
+            remove_listener()
+
+        track_mode = mode
+        tracked_entities = info.entities
+        if mode == MATCH_ALL:
+            remove_listener = hass.bus.async_listen(EVENT_STATE_CHANGED, _refresh)
+        elif mode == _TEMPLATE_TRACK_FILTERED:
+            remove_listener = hass.bus.async_listen(
+                EVENT_STATE_CHANGED, _refresh, event_filter=_event_filter
+            )
+        else:
+            remove_listener = async_track_state_change_event(
+                hass, info.entities, _refresh
+            )
+
+    last_result = _render_result(info)
+    if not template.is_static:
+        _arm_listeners()
+
+    @callback
+    def remove() -> None:
+        """Remove the listeners of the template."""
+        if remove_listener is not None:
+            remove_listener()
+
+    return remove
+
+
 @callback
 @bind_hass
 def async_track_same_state(
@@ -484,6 +626,91 @@ def async_track_sunset(
 track_sunset = threaded_listener_factory(async_track_sunset)
 
 
+@attr.s
+class _TimePatternClock:
+    """Map wall clock times on the loop clock for time pattern listeners.
+
+    Timers run on the monotonic loop clock, so the wall clock jumping would
+    leave them waiting for the wrong time. The offset between both clocks is
+    followed on every time changed event and all listeners are checked
+    against the new time when it jumps.
+
+    The offset is taken when the event is fired, where the time of the event
+    and the loop clock are read at the same instant. Handling the event late
+    on a busy loop is therefore not mistaken for a clock jump.
+    """
+
+    hass = attr.ib(type=HomeAssistant)
+    offset: float = attr.ib()
+    listeners: Set[Callable[[datetime], None]] = attr.ib(factory=set)
+    _unsub_time_changed: Optional[CALLBACK_TYPE] = attr.ib(default=None)
+
+    @callback
+    def async_now(self) -> datetime:
+        """Return the current wall clock time."""
+        return dt_util.utc_from_timestamp(self.hass.loop.time() + self.offset)
+
+    @callback
+    def async_call_at(
+        self, point_in_time: datetime, action: Callable[[], None]
+    ) -> asyncio.TimerHandle:
+        """Call action when the wall clock reaches point_in_time."""
+        return self.hass.loop.call_at(point_in_time.timestamp() - self.offset, action)
+
+    @callback
+    def async_add_listener(self, listener: Callable[[datetime], None]) -> CALLBACK_TYPE:
+        """Add a listener that is called with the new time on clock jumps."""
+        if self._unsub_time_changed is None:
+            self._unsub_time_changed = self.hass.bus.async_listen(
+                EVENT_TIME_CHANGED, self._async_time_changed, self._async_clock_jumped
+            )
+
+        self.listeners.add(listener)
+
+        @callback
+        def remove_listener() -> None:
+            """Remove the clock jump listener."""
+            self.listeners.discard(listener)
+
+            if not self.listeners and self._unsub_time_changed is not None:
+                self._unsub_time_changed()
+                self._unsub_time_changed = None
+
+        return remove_listener
+
+    @callback
+    def _async_clock_jumped(self, event: Event) -> bool:
+        """Follow the wall clock and return if it jumped."""
+        offset: float = event.data[ATTR_NOW].timestamp() - self.hass.loop.time()
+        jumped = abs(offset - self.offset) > CLOCK_JUMP_TOLERANCE
+        self.offset = offset
+        return jumped
+
+    @callback
+    def _async_time_changed(self, event: Event) -> None:
+        """Notify the listeners of the new time after the clock jumped."""
+        now = event.data[ATTR_NOW]
+
+        for listener in list(self.listeners):
+            try:
+                listener(now)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Error while processing time pattern at %s", now)
+
+
+@callback
+def _async_get_time_pattern_clock(hass: HomeAssistant) -> _TimePatternClock:
+    """Return the clock shared by the time pattern listeners."""
+    clock: Optional[_TimePatternClock] = hass.data.get(TRACK_TIME_PATTERN_CLOCK)
+
+    if clock is None:
+        clock = hass.data[TRACK_TIME_PATTERN_CLOCK] = _TimePatternClock(
+            hass, dt_util.utcnow().timestamp() - hass.loop.time()
+        )
+
+    return clock
+
+
 @callback
 @bind_hass
 def async_track_utc_time_change(
@@ -510,7 +737,11 @@ def async_track_utc_time_change(
     matching_minutes = dt_util.parse_time_expression(minute, 0, 59)
     matching_hours = dt_util.parse_time_expression(hour, 0, 23)
 
-    next_time = None
+    clock = _async_get_time_pattern_clock(hass)
+    # Make sure rolling back the clock doesn't prevent the timer from
+    # triggering.
+    last_now = clock.async_now()
+    next_time = last_now
 
     def calculate_next(now: datetime) -> None:
         """Calculate and set the next time the trigger should fire."""
@@ -521,31 +752,49 @@ def async_track_utc_time_change(
             localized_now, matching_seconds, matching_minutes, matching_hours
         )
 
-    # Make sure rolling back the clock doesn't prevent the timer from
-    # triggering.
-    last_now: Optional[datetime] = None
+    calculate_next(last_now + timedelta(seconds=1))
+    timer: Optional[asyncio.TimerHandle] = None
 
     @callback
-    def pattern_time_change_listener(event: Event) -> None:
-        """Listen for matching time_changed events."""
-        nonlocal next_time, last_now
-
-        now = event.data[ATTR_NOW]
+    def pattern_time_change_listener(now: datetime) -> None:
+        """Run the action if the next time passed and re-arm the timer."""
+        nonlocal last_now, timer
 
-        if last_now is None or now < last_now:
-            # Time rolled back or next time not yet calculated
+        if now < last_now:
+            # Time rolled back
             calculate_next(now)
 
         last_now = now
+        fire = next_time <= now
 
-        if next_time <= now:
-            hass.async_run_job(action, dt_util.as_local(now) if local else now)
+        if fire:
             calculate_next(now + timedelta(seconds=1))
 
-    # We can't use async_track_point_in_utc_time here because it would
-    # break in the case that the system time abruptly jumps backwards.
-    # Our custom last_now logic takes care of resolving that scenario.
-    return hass.bus.async_listen(EVENT_TIME_CHANGED, pattern_time_change_listener)
+        # Re-arm before running the action so a failing action does not
+        # stop the schedule.
+        if timer is not None:
+            timer.cancel()
+        timer = clock.async_call_at(next_time, pattern_timer_fired)
+
+        if fire:
+            hass.async_run_job(action, dt_util.as_local(now) if local else now)
+
+    @callback
+    def pattern_timer_fired() -> None:
+        """Check the pattern when the timer for the next time elapsed."""
+        pattern_time_change_listener(clock.async_now())
+
+    timer = clock.async_call_at(next_time, pattern_timer_fired)
+    remove_clock_listener = clock.async_add_listener(pattern_time_change_listener)
+
+    @callback
+    def unsub_pattern_time_change_listener() -> None:
+        """Cancel the time listener."""
+        assert timer is not None
+        timer.cancel()
+        remove_clock_listener()
+
+    return unsub_pattern_time_change_listener
 
 
 track_utc_time_change = threaded_listener_factory(async_track_utc_time_change)
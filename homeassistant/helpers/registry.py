@@ -0,0 +1,83 @@
+"""Provide a container for registry entries that keeps indexes of the entries."""
+from collections import UserDict
+from itertools import count
+from typing import Any, Dict, Hashable, Iterable, List, Optional
+
+# Versions are unique over all containers, so a replaced container never
+# reports the version of the one it replaced
+_VERSIONS = count(1)
+
+
+class IndexedRegistryItems(UserDict):
+    """Container that maps the ids of registry entries to the entries.
+
+    Besides the entries by id, indexes of the ids by values of the entries are
+    maintained when entries are added, replaced or removed. Subclasses return
+    the keys an entry is indexed under for each index from `_index_keys`.
+
+    The version changes whenever an entry is added, replaced or removed, so
+    data derived from the entries can be checked for changes when it is used.
+    """
+
+    def __init__(self, entries: Optional[Dict[str, Any]] = None) -> None:
+        """Initialize the container."""
+        self._indexes: Dict[str, Dict[Hashable, Dict[str, None]]] = {}
+        self.version = next(_VERSIONS)
+        super().__init__(entries)
+
+    def _index_keys(self, entry: Any) -> Dict[str, Iterable[Hashable]]:
+        """Return the keys to index an entry under for each index."""
+        raise NotImplementedError
+
+    def __setitem__(self, key: str, entry: Any) -> None:
+        """Add or replace an entry and update the indexes."""
+        old = self.data.get(key)
+        self.data[key] = entry
+        self.version = next(_VERSIONS)
+        old_keys = {} if old is None else self._index_keys(old)
+        new_keys = self._index_keys(entry)
+        for name in old_keys.keys() | new_keys.keys():
+            self._reindex(name, key, old_keys.get(name, ()), new_keys.get(name, ()))
+
+    def __delitem__(self, key: str) -> None:
+        """Remove an entry from the container and the indexes."""
+        entry = self.data.pop(key)
+        self.version = next(_VERSIONS)
+        for name, keys in self._index_keys(entry).items():
+            self._reindex(name, key, keys, ())
+
+    def _reindex(
+        self,
+        name: str,
+        key: str,
+        old_keys: Iterable[Hashable],
+        new_keys: Iterable[Hashable],
+    ) -> None:
+        """Move an id in an index from the old keys to the new keys.
+
+        Ids indexed under keys that did not change keep their position.
+        """
+        index = self._indexes.setdefault(name, {})
+        old_keys = set(old_keys)
+        new_keys = set(new_keys)
+
+        for index_key in old_keys - new_keys:
+            ids = index[index_key]
+            del ids[key]
+            if not ids:
+                del index[index_key]
+
+        for index_key in new_keys - old_keys:
+            index.setdefault(index_key, {})[key] = None
+
+    def get_entries(self, name: str, index_key: Hashable) -> List[Any]:
+        """Return the entries indexed under a key in the order they were indexed."""
+        return [
+            self.data[key] for key in self._indexes.get(name, {}).get(index_key, ())
+        ]
+
+    def get_entry(self, name: str, index_key: Hashable) -> Optional[Any]:
+        """Return the first entry indexed under a key."""
+        for key in self._indexes.get(name, {}).get(index_key, ()):
+            return self.data[key]
+        return None
@@ -17,7 +17,7 @@ from homeassistant.helpers import entity_registry
 from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.json import JSONEncoder
-from homeassistant.helpers.storage import Store
+from homeassistant.helpers.storage import Journal, Store
 import homeassistant.util.dt as dt_util
 
 DATA_RESTORE_STATE_TASK = "restore_state_task"
@@ -26,10 +26,14 @@ _LOGGER = logging.getLogger(__name__)
 
 STORAGE_KEY = "core.restore_state"
 STORAGE_VERSION = 1
+JOURNAL_KEY = "core.restore_state_journal"
 
 # How long between periodically saving the current states to disk
 STATE_DUMP_INTERVAL = timedelta(minutes=15)
 
+# How long between rewriting all states instead of only the changed ones
+STATE_COMPACT_INTERVAL = timedelta(days=1)
+
 # How long should a saved state be preserved if the entity no longer exists
 STATE_EXPIRATION = timedelta(days=7)
 
@@ -72,11 +76,19 @@ class RestoreStateData:
                 data = cls(hass)
 
                 try:
-                    stored_states = await data.store.async_load()
+                    stored_states = cast(
+                        Optional[List[Dict]], await data.store.async_load()
+                    )
                 except HomeAssistantError as exc:
                     _LOGGER.error("Error loading last states", exc_info=exc)
                     stored_states = None
 
+                try:
+                    journal = await data.journal.async_load()
+                except HomeAssistantError as exc:
+                    _LOGGER.error("Error loading last state changes", exc_info=exc)
+                    journal = []
+
                 if stored_states is None:
                     _LOGGER.debug("Not creating cache - no saved states found")
                     data.last_states = {}
@@ -86,8 +98,18 @@ class RestoreStateData:
                         for item in stored_states
                         if valid_entity_id(item["state"]["entity_id"])
                     }
+                    data.async_replay_journal(stored_states, journal)
                     _LOGGER.debug("Created cache with %s", list(data.last_states))
 
+                # Keep numbering the dumps after the records that were saved
+                data._sequence = max(
+                    (
+                        item.get("sequence", 0)
+                        for item in (stored_states or []) + journal
+                    ),
+                    default=0,
+                )
+
                 if hass.state == CoreState.running:
                     data.async_setup_dump()
                 else:
@@ -107,10 +129,43 @@ class RestoreStateData:
         """Initialize the restore state data class."""
         self.hass: HomeAssistant = hass
         self.store: Store = Store(
-            hass, STORAGE_VERSION, STORAGE_KEY, encoder=JSONEncoder
+            hass, STORAGE_VERSION, STORAGE_KEY, encoder=JSONEncoder, compact=True
         )
+        self.journal: Journal = Journal(hass, JOURNAL_KEY, encoder=JSONEncoder)
         self.last_states: Dict[str, StoredState] = {}
         self.entity_ids: Set[str] = set()
+        # The states as saved by the last dump, None if they have to be compacted
+        self._dumped_states: Optional[Dict[str, State]] = None
+        # The number of the last dump, saved with each record of the dump
+        self._sequence = 0
+        self._journal_size = 0
+        self._last_compacted: Optional[datetime] = None
+        self._dump_lock = asyncio.Lock()
+
+    @callback
+    def async_replay_journal(
+        self, stored_states: List[Dict], journal: List[Dict]
+    ) -> None:
+        """Apply the state changes saved after the states were compacted."""
+        # Changes that were saved before the states were compacted are already
+        # part of them. The journal is only written after compacting states, so
+        # there is nothing to replay on top of an empty compaction.
+        compacted = max(
+            (item.get("sequence", 0) for item in stored_states), default=None
+        )
+        if compacted is None:
+            return
+
+        for record in journal:
+            if record.get("sequence", 0) <= compacted:
+                continue
+
+            if "removed" in record:
+                self.last_states.pop(record["removed"], None)
+            elif valid_entity_id(record["state"]["entity_id"]):
+                self.last_states[record["state"]["entity_id"]] = StoredState.from_dict(
+                    record
+                )
 
     @callback
     def async_get_stored_states(self) -> List[StoredState]:
@@ -155,17 +210,92 @@ class RestoreStateData:
         return stored_states
 
     async def async_dump_states(self) -> None:
-        """Save the current state machine to storage."""
+        """Save the current state machine to storage.
+
+        Only the states that changed since the last dump are appended to the
+        journal, all states are saved once the journal grows too large.
+        """
         _LOGGER.debug("Dumping states")
+        async with self._dump_lock:
+            stored_states = self.async_get_stored_states()
+            dumped_states = self._dumped_states
+            now = dt_util.utcnow()
+            sequence = self._sequence + 1
+
+            if (
+                dumped_states is None
+                or self._last_compacted is None
+                or now - self._last_compacted > STATE_COMPACT_INTERVAL
+            ):
+                await self._async_compact_states(stored_states, now, sequence)
+                return
+
+            records = [
+                dict(stored_state.as_dict(), sequence=sequence)
+                for stored_state in stored_states
+                if dumped_states.get(stored_state.state.entity_id)
+                is not stored_state.state
+            ]
+            entity_ids = {
+                stored_state.state.entity_id for stored_state in stored_states
+            }
+            records.extend(
+                {"removed": entity_id, "sequence": sequence}
+                for entity_id in dumped_states
+                if entity_id not in entity_ids
+            )
+
+            if not records:
+                return
+
+            if self._journal_size + len(records) >= len(stored_states):
+                await self._async_compact_states(stored_states, now, sequence)
+                return
+
+            try:
+                if self._journal_size == 0:
+                    await self.journal.async_save(records)
+                else:
+                    await self.journal.async_append(records)
+            except HomeAssistantError as exc:
+                _LOGGER.error("Error saving current states", exc_info=exc)
+                self._dumped_states = None
+                return
+
+            self._dumped_states = {
+                stored_state.state.entity_id: stored_state.state
+                for stored_state in stored_states
+            }
+            self._journal_size += len(records)
+            self._sequence = sequence
+
+    async def _async_compact_states(
+        self, stored_states: List[StoredState], now: datetime, sequence: int
+    ) -> None:
+        """Save all states to storage.
+
+        The journal is replaced on the next dump, records in it that were
+        saved before the states are ignored when loading.
+        """
         try:
             await self.store.async_save(
                 [
-                    stored_state.as_dict()
-                    for stored_state in self.async_get_stored_states()
+                    dict(stored_state.as_dict(), sequence=sequence)
+                    for stored_state in stored_states
                 ]
             )
         except HomeAssistantError as exc:
             _LOGGER.error("Error saving current states", exc_info=exc)
+            self._dumped_states = None
+            return
+
+        self._dumped_states = {
+            stored_state.state.entity_id: stored_state.state
+            for stored_state in stored_states
+        }
+        self._journal_size = 0
+        self._last_compacted = now
+        self._sequence = sequence
 
     @callback
     def async_setup_dump(self, *args: Any) -> None:
@@ -338,6 +338,8 @@ def async_set_service_schema(
 async def entity_service_call(hass, platforms, func, call, required_features=None):
     """Handle an entity service call.
 
+    Platforms is either a dictionary of the entities that can be targeted by
+    entity id or an iterable of the entity platforms of those entities.
     Calls all platforms simultaneously.
     """
     if call.context.user_id:
@@ -348,11 +350,16 @@ async def entity_service_call(hass, platforms, func, call, required_features=Non
     else:
         entity_perms = None
 
-    target_all_entities = call.data.get(ATTR_ENTITY_ID) == ENTITY_MATCH_ALL
+    if isinstance(platforms, dict):
+        registered_entities = platforms
+    else:
+        registered_entities = {
+            entity_id: entity
+            for platform in platforms
+            for entity_id, entity in platform.entities.items()
+        }
 
-    if not target_all_entities:
-        # A set of entities we're trying to target.
-        entity_ids = await async_extract_entity_ids(hass, call, True)
+    target_all_entities = call.data.get(ATTR_ENTITY_ID) == ENTITY_MATCH_ALL
 
     # If the service function is a string, we'll pass it the service call data
     if isinstance(func, str):
@@ -365,62 +372,41 @@ async def entity_service_call(hass, platforms, func, call, required_features=Non
     else:
         data = call
 
-    # Check the permissions
-
     # A list with entities to call the service on.
     entity_candidates = []
 
-    if entity_perms is None:
-        for platform in platforms:
-            if target_all_entities:
-                entity_candidates.extend(platform.entities.values())
-            else:
-                entity_candidates.extend(
-                    [
-                        entity
-                        for entity in platform.entities.values()
-                        if entity.entity_id in entity_ids
-                    ]
-                )
-
-    elif target_all_entities:
+    if target_all_entities:
         # If we target all entities, we will select all entities the user
         # is allowed to control.
-        for platform in platforms:
-            entity_candidates.extend(
-                [
-                    entity
-                    for entity in platform.entities.values()
-                    if entity_perms(entity.entity_id, POLICY_CONTROL)
-                ]
-            )
+        entity_candidates = [
+            entity
+            for entity in registered_entities.values()
+            if entity_perms is None or entity_perms(entity.entity_id, POLICY_CONTROL)
+        ]
 
     else:
-        for platform in platforms:
-            platform_entities = []
-            for entity in platform.entities.values():
-
-                if entity.entity_id not in entity_ids:
-                    continue
+        # A set of entities we're trying to target.
+        entity_ids = await async_extract_entity_ids(hass, call, True)
+        missing = set()
 
-                if not entity_perms(entity.entity_id, POLICY_CONTROL):
-                    raise Unauthorized(
-                        context=call.context,
-                        entity_id=entity.entity_id,
-                        permission=POLICY_CONTROL,
-                    )
+        # Look up the targets and only check the permissions on those.
+        for entity_id in sorted(entity_ids):
+            entity = registered_entities.get(entity_id)
 
-                platform_entities.append(entity)
+            if entity is None:
+                missing.add(entity_id)
+                continue
 
-            entity_candidates.extend(platform_entities)
+            if entity_perms is not None and not entity_perms(entity_id, POLICY_CONTROL):
+                raise Unauthorized(
+                    context=call.context, entity_id=entity_id, permission=POLICY_CONTROL
+                )
 
-    if not target_all_entities:
-        for entity in entity_candidates:
-            entity_ids.remove(entity.entity_id)
+            entity_candidates.append(entity)
 
-        if entity_ids:
+        if missing:
             _LOGGER.warning(
-                "Unable to find referenced entities %s", ", ".join(sorted(entity_ids))
+                "Unable to find referenced entities %s", ", ".join(sorted(missing))
             )
 
     entities = []
@@ -441,14 +427,36 @@ async def entity_service_call(hass, platforms, func, call, required_features=Non
     if not entities:
         return
 
-    done, pending = await asyncio.wait(
-        [
+    tasks = []
+    # Entities by platform for the platforms that handle the method at once
+    batches: Dict[Any, List["Entity"]] = {}
+
+    for entity in entities:
+        if (
+            isinstance(func, str)
+            and entity.platform is not None
+            and func in entity.platform.batch_service_handlers
+        ):
+            batches.setdefault(entity.platform, []).append(entity)
+            continue
+
+        tasks.append(
             entity.async_request_call(
                 _handle_entity_call(hass, entity, func, data, call.context)
             )
-            for entity in entities
-        ]
-    )
+        )
+
+    for platform, platform_entities in batches.items():
+        tasks.append(
+            _handle_batch_call(
+                platform.batch_service_handlers[func],
+                platform_entities,
+                data,
+                call.context,
+            )
+        )
+
+    done, pending = await asyncio.wait(tasks)
     assert not pending
     for future in done:
         future.result()  # pop exception if have
@@ -493,6 +501,14 @@ async def _handle_entity_call(hass, entity, func, data, context):
         await result
 
 
+async def _handle_batch_call(handler, entities, data, context):
+    """Handle calling the batch service handler of a platform."""
+    for entity in entities:
+        entity.async_set_context(context)
+
+    await handler(entities, **data)
+
+
 @bind_hass
 @ha.callback
 def async_register_admin_service(
@@ -1,15 +1,22 @@
 """Helper to help store data."""
 import asyncio
+from contextlib import AsyncExitStack
+from datetime import datetime, timedelta
+import json
 from json import JSONEncoder
 import logging
 import os
-from typing import Any, Callable, Dict, List, Optional, Type, Union
+from timeit import default_timer as timer
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
+
+import attr
 
 from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
 from homeassistant.core import CALLBACK_TYPE, CoreState, HomeAssistant, callback
-from homeassistant.helpers.event import async_call_later
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.event import async_track_point_in_utc_time
 from homeassistant.loader import bind_hass
-from homeassistant.util import json as json_util
+from homeassistant.util import dt as dt_util, json as json_util
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-warn-return-any
 # mypy: no-check-untyped-defs
@@ -17,6 +24,28 @@ from homeassistant.util import json as json_util
 STORAGE_DIR = ".storage"
 _LOGGER = logging.getLogger(__name__)
 
+DATA_WRITE_SCHEDULER = "storage_write_scheduler"
+DATA_WRITE_TIMINGS = "storage_write_timings"
+
+# Delayed saves due within this window are written together
+WRITE_BATCH_WINDOW = timedelta(seconds=2)
+
+
+@attr.s(slots=True)
+class WriteTiming:
+    """Time spent writing the data of a store."""
+
+    writes: int = attr.ib(default=0)
+    total: float = attr.ib(default=0.0)
+    last: float = attr.ib(default=0.0)
+    max: float = attr.ib(default=0.0)
+
+
+@callback
+def async_get_write_timings(hass: HomeAssistant) -> Dict[str, WriteTiming]:
+    """Return the time spent writing the data of each store key."""
+    return hass.data.setdefault(DATA_WRITE_TIMINGS, {})
+
 
 @bind_hass
 async def async_migrator(
@@ -67,12 +96,18 @@ class Store:
         private: bool = False,
         *,
         encoder: Optional[Type[JSONEncoder]] = None,
+        compact: bool = False,
     ):
-        """Initialize storage class."""
+        """Initialize storage class.
+
+        Pass compact=True for large stores that are not meant to be edited
+        by hand, their data is written as compact JSON.
+        """
         self.version = version
         self.key = key
         self.hass = hass
         self._private = private
+        self._compact = compact
         self._data: Optional[Dict[str, Any]] = None
         self._unsub_delay_listener: Optional[CALLBACK_TYPE] = None
         self._unsub_final_write_listener: Optional[CALLBACK_TYPE] = None
@@ -155,9 +190,9 @@ class Store:
             self._async_ensure_final_write_listener()
             return
 
-        self._unsub_delay_listener = async_call_later(
-            self.hass, delay, self._async_callback_delayed_write
-        )
+        self._unsub_delay_listener = _async_get_write_scheduler(
+            self.hass
+        ).async_schedule(self, delay)
         self._async_ensure_final_write_listener()
 
     @callback
@@ -182,16 +217,6 @@ class Store:
             self._unsub_delay_listener()
             self._unsub_delay_listener = None
 
-    async def _async_callback_delayed_write(self, _now):
-        """Handle a delayed write callback."""
-        # catch the case where a call is scheduled and then we stop Home Assistant
-        if self.hass.state == CoreState.stopping:
-            self._async_ensure_final_write_listener()
-            return
-        self._unsub_delay_listener = None
-        self._async_cleanup_final_write_listener()
-        await self._async_handle_write_data()
-
     async def _async_callback_final_write(self, _event):
         """Handle a write because Home Assistant is in final write state."""
         self._unsub_final_write_listener = None
@@ -202,23 +227,29 @@ class Store:
         """Handle writing the config."""
 
         async with self._write_lock:
-            if self._data is None:
+            data = self._async_pop_data()
+            if data is None:
                 # Another write already consumed the data
                 return
 
-            data = self._data
+            timings = await self.hass.async_add_executor_job(
+                _write_stores, [(self, data)]
+            )
+            _async_record_write_timings(self.hass, timings)
 
-            if "data_func" in data:
-                data["data"] = data.pop("data_func")()
+    @callback
+    def _async_pop_data(self) -> Optional[Dict]:
+        """Return the data to write, generating it if needed."""
+        data = self._data
+        if data is None:
+            return None
 
-            self._data = None
+        if "data_func" in data:
+            data["data"] = data["data_func"]()
+            del data["data_func"]
 
-            try:
-                await self.hass.async_add_executor_job(
-                    self._write_data, self.path, data
-                )
-            except (json_util.SerializationError, json_util.WriteError) as err:
-                _LOGGER.error("Error writing config for %s: %s", self.key, err)
+        self._data = None
+        return data
 
     def _write_data(self, path: str, data: Dict) -> None:
         """Write the data."""
@@ -226,7 +257,9 @@ class Store:
             os.makedirs(os.path.dirname(path))
 
         _LOGGER.debug("Writing data for %s", self.key)
-        json_util.save_json(path, data, self._private, encoder=self._encoder)
+        json_util.save_json(
+            path, data, self._private, encoder=self._encoder, compact=self._compact
+        )
 
     async def _async_migrate_func(self, old_version, old_data):
         """Migrate to the new version."""
@@ -238,3 +271,223 @@ class Store:
             await self.hass.async_add_executor_job(os.unlink, self.path)
         except FileNotFoundError:
             pass
+
+
+def _write_stores(writes: List[Tuple[Store, Dict]]) -> List[Tuple[str, float]]:
+    """Write the data of stores and return how long each write took."""
+    timings = []
+    for store, data in writes:
+        start = timer()
+        try:
+            store._write_data(store.path, data)  # pylint: disable=protected-access
+        except (json_util.SerializationError, json_util.WriteError) as err:
+            _LOGGER.error("Error writing config for %s: %s", store.key, err)
+            continue
+        timings.append((store.key, timer() - start))
+    return timings
+
+
+@callback
+def _async_record_write_timings(
+    hass: HomeAssistant, timings: List[Tuple[str, float]]
+) -> None:
+    """Add the time spent writing stores to the write timings."""
+    write_timings = async_get_write_timings(hass)
+    for key, duration in timings:
+        timing = write_timings.get(key)
+        if timing is None:
+            timing = write_timings[key] = WriteTiming()
+        timing.writes += 1
+        timing.total += duration
+        timing.last = duration
+        timing.max = max(timing.max, duration)
+        _LOGGER.debug("Wrote data for %s in %.3f seconds", key, duration)
+
+
+@callback
+def _async_get_write_scheduler(hass: HomeAssistant) -> "_WriteScheduler":
+    """Return the scheduler of the delayed saves."""
+    scheduler = hass.data.get(DATA_WRITE_SCHEDULER)
+    if scheduler is None:
+        scheduler = hass.data[DATA_WRITE_SCHEDULER] = _WriteScheduler(hass)
+    return scheduler
+
+
+class _WriteScheduler:
+    """Write the delayed saves of all stores in batched executor jobs."""
+
+    def __init__(self, hass: HomeAssistant):
+        """Initialize the write scheduler."""
+        self.hass = hass
+        self._pending: Dict[Store, datetime] = {}
+        self._unsub_timer: Optional[CALLBACK_TYPE] = None
+        self._timer_due: Optional[datetime] = None
+
+    @callback
+    def async_schedule(self, store: Store, delay: float) -> CALLBACK_TYPE:
+        """Schedule writing the data of a store after a delay."""
+        due = dt_util.utcnow() + timedelta(seconds=delay)
+        self._pending[store] = due
+        self._async_set_timer()
+
+        @callback
+        def async_cancel() -> None:
+            """Cancel the delayed write."""
+            if self._pending.get(store) is due:
+                del self._pending[store]
+
+        return async_cancel
+
+    @callback
+    def _async_set_timer(self) -> None:
+        """Set the timer to the first delayed write that is due."""
+        due = min(self._pending.values())
+        if self._unsub_timer is not None:
+            assert self._timer_due is not None
+            if self._timer_due <= due:
+                return
+            self._unsub_timer()
+
+        self._timer_due = due
+        self._unsub_timer = async_track_point_in_utc_time(
+            self.hass, self._async_write_due, due
+        )
+
+    async def _async_write_due(self, now: datetime) -> None:
+        """Write the stores that are due."""
+        self._unsub_timer = None
+        self._timer_due = None
+
+        stores = [
+            store
+            for store, due in self._pending.items()
+            if due <= now + WRITE_BATCH_WINDOW
+        ]
+        for store in stores:
+            del self._pending[store]
+            # pylint: disable=protected-access
+            store._unsub_delay_listener = None
+
+            # Catch the case where a write is scheduled and then we stop
+            if self.hass.state == CoreState.stopping:
+                store._async_ensure_final_write_listener()
+            else:
+                store._async_cleanup_final_write_listener()
+
+        if self._pending:
+            self._async_set_timer()
+
+        if stores and self.hass.state != CoreState.stopping:
+            await self._async_write_stores(stores)
+
+    async def _async_write_stores(self, stores: List[Store]) -> None:
+        """Write the data of the stores in a single executor job."""
+        # pylint: disable=protected-access
+        stores.sort(key=lambda store: store.key)
+        async with AsyncExitStack() as stack:
+            for store in stores:
+                await stack.enter_async_context(store._write_lock)
+
+            writes = []
+            for store in stores:
+                try:
+                    data = store._async_pop_data()
+                except Exception:  # pylint: disable=broad-except
+                    _LOGGER.exception("Error generating data for %s", store.key)
+                    continue
+                if data is not None:
+                    writes.append((store, data))
+
+            if not writes:
+                return
+
+            timings = await self.hass.async_add_executor_job(_write_stores, writes)
+            _async_record_write_timings(self.hass, timings)
+
+
+@bind_hass
+class Journal:
+    """Class to help storing a journal of records.
+
+    Records are stored one JSON document per line, so they can be appended
+    without rewriting the records that were stored before.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        key: str,
+        *,
+        encoder: Optional[Type[JSONEncoder]] = None,
+    ):
+        """Initialize journal class."""
+        self.key = key
+        self.hass = hass
+        self._write_lock = asyncio.Lock()
+        self._encoder = encoder
+
+    @property
+    def path(self):
+        """Return the config path."""
+        return self.hass.config.path(STORAGE_DIR, self.key)
+
+    async def async_load(self) -> List[Any]:
+        """Load the records."""
+        async with self._write_lock:
+            return await self.hass.async_add_executor_job(self._load_data, self.path)
+
+    async def async_save(self, records: List[Any]) -> None:
+        """Replace the journal with the records."""
+        async with self._write_lock:
+            await self.hass.async_add_executor_job(
+                self._write_data, self.path, records, "w"
+            )
+
+    async def async_append(self, records: List[Any]) -> None:
+        """Append the records to the journal."""
+        async with self._write_lock:
+            await self.hass.async_add_executor_job(
+                self._write_data, self.path, records, "a"
+            )
+
+    def _load_data(self, path: str) -> List[Any]:
+        """Load the records."""
+        records = []
+        try:
+            with open(path, encoding="utf-8") as fdesc:
+                for line in fdesc:
+                    try:
+                        records.append(json.loads(line))
+                    except ValueError:
+                        # The last write was interrupted
+                        _LOGGER.warning("Ignoring invalid record in %s", self.key)
+                        break
+        except FileNotFoundError:
+            pass
+        except OSError as error:
+            raise HomeAssistantError(error)
+        return records
+
+    def _write_data(self, path: str, records: List[Any], mode: str) -> None:
+        """Write the records."""
+        try:
+            data = "".join(
+                f"{json.dumps(record, cls=self._encoder)}\n" for record in records
+            )
+        except TypeError as error:
+            raise json_util.SerializationError(error)
+
+        _LOGGER.debug("Writing records for %s", self.key)
+        try:
+            if not os.path.isdir(os.path.dirname(path)):
+                os.makedirs(os.path.dirname(path))
+
+            if mode == "a":
+                with open(path, mode, encoding="utf-8") as fdesc:
+                    fdesc.write(data)
+                return
+        except OSError as error:
+            raise json_util.WriteError(error)
+
+        # Replace the journal atomically so an interrupted write keeps the old one
+        json_util.write_utf8_file(path, data)
@@ -1,5 +1,6 @@
 """Template helper methods for rendering strings with Home Assistant data."""
 import base64
+from collections import OrderedDict
 import collections.abc
 from datetime import datetime
 from functools import wraps
@@ -8,7 +9,7 @@ import logging
 import math
 import random
 import re
-from typing import Any, Dict, Iterable, List, Optional, Union
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Union
 
 import jinja2
 from jinja2 import contextfilter, contextfunction
@@ -48,7 +49,11 @@ _RE_GET_ENTITIES = re.compile(
     r"\((?:[\ \'\"]?))(?P<entity_id>[\w]+\.[\w]+)|(?P<variable>[\w]+))",
     re.I | re.M,
 )
-_RE_JINJA_DELIMITERS = re.compile(r"\{%|\{\{")
+_RE_JINJA_DELIMITERS = re.compile(r"\{%|\{\{|\{#")
+
+# Compiled templates are shared by the templates of an environment with the
+# same source
+MAX_CACHED_TEMPLATES = 1024
 
 
 @bind_hass
@@ -128,7 +133,7 @@ class RenderInfo:
         """Initialise."""
         self.template = template
         # Will be set sensibly once frozen.
-        self.filter_lifecycle = _true
+        self.filter_lifecycle: Callable[[str], bool] = _true
         self._result = None
         self._exception = None
         self._all_states = False
@@ -146,6 +151,21 @@ class RenderInfo:
             or entity_id in self._entities
         )
 
+    @property
+    def all_states(self) -> bool:
+        """Return if the template iterated or counted all states."""
+        return self._all_states
+
+    @property
+    def domains(self) -> FrozenSet[str]:
+        """Return the domains the template iterated or counted."""
+        return getattr(self, "_domains", frozenset())
+
+    @property
+    def entities(self) -> FrozenSet[str]:
+        """Return the entities the template accessed."""
+        return self._entities
+
     @property
     def result(self) -> str:
         """Results of the template computation."""
@@ -175,6 +195,7 @@ class Template:
             raise TypeError("Expected template to be a string")
 
         self.template: str = template
+        self._static = _RE_JINJA_DELIMITERS.search(template) is None
         self._compiled_code = None
         self._compiled = None
         self.hass = hass
@@ -188,13 +209,18 @@ class Template:
             ret = self.hass.data[_ENVIRONMENT] = TemplateEnvironment(self.hass)
         return ret
 
+    @property
+    def is_static(self) -> bool:
+        """Return if the template is a plain string without jinja code."""
+        return self._static
+
     def ensure_valid(self):
         """Return if template is valid."""
         if self._compiled_code is not None:
             return
 
         try:
-            self._compiled_code = self._env.compile(self.template)
+            self._compiled_code = self._env.cached_compile(self.template)
         except jinja2.exceptions.TemplateSyntaxError as err:
             raise TemplateError(err)
 
@@ -219,6 +245,9 @@ class Template:
 
         This method must be run in the event loop.
         """
+        if self._static:
+            return self.template.strip()
+
         compiled = self._compiled or self._ensure_compiled()
 
         if variables is not None:
@@ -268,6 +297,9 @@ class Template:
 
         This method must be run in the event loop.
         """
+        if self._static:
+            return self.template.strip()
+
         if self._compiled is None:
             self._ensure_compiled()
 
@@ -297,11 +329,7 @@ class Template:
 
         assert self.hass is not None, "hass variable not set on template"
 
-        env = self._env
-
-        self._compiled = jinja2.Template.from_code(
-            env, self._compiled_code, env.globals, None
-        )
+        self._compiled = self._env.cached_template(self.template)
 
         return self._compiled
 
@@ -322,6 +350,18 @@ class Template:
         return 'Template("' + self.template + '")'
 
 
+def _cache_get(cache: OrderedDict, source: str, factory: Callable[[str], Any]) -> Any:
+    """Return the cached value for a source, creating it if needed."""
+    value = cache.get(source)
+    if value is None:
+        value = cache[source] = factory(source)
+        if len(cache) > MAX_CACHED_TEMPLATES:
+            cache.popitem(last=False)
+    else:
+        cache.move_to_end(source)
+    return value
+
+
 class AllStates:
     """Class to expose all HA states as attributes."""
 
@@ -952,6 +992,9 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
         """Initialise template environment."""
         super().__init__()
         self.hass = hass
+        # Compiled code and templates by source, shared by equal templates
+        self._code_cache: OrderedDict = OrderedDict()
+        self._template_cache: OrderedDict = OrderedDict()
         self.filters["round"] = forgiving_round
         self.filters["multiply"] = multiply
         self.filters["log"] = logarithm
@@ -1027,6 +1070,20 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
         self.globals["state_attr"] = hassfunction(state_attr)
         self.globals["states"] = AllStates(hass)
 
+    def cached_compile(self, source: str) -> Any:
+        """Compile the source of a template to python code."""
+        return _cache_get(self._code_cache, source, self.compile)
+
+    def cached_template(self, source: str) -> jinja2.Template:
+        """Load the template of a source bound to this environment."""
+        return _cache_get(
+            self._template_cache,
+            source,
+            lambda source: jinja2.Template.from_code(
+                self, self.cached_compile(source), self.globals, None
+            ),
+        )
+
     def is_safe_callable(self, obj):
         """Test if callback is safe."""
         return isinstance(obj, AllStates) or super().is_safe_callable(obj)
@@ -170,6 +170,26 @@ class Integration:
 
         return None
 
+    @classmethod
+    def resolve_from_index(
+        cls, hass: "HomeAssistant", root_module: ModuleType, domain: str
+    ) -> "Optional[Integration]":
+        """Resolve a built-in integration from the generated manifest index."""
+        # pylint: disable=import-outside-toplevel
+        from homeassistant.generated.manifests import MANIFESTS
+
+        manifest = MANIFESTS.get(domain)
+
+        if manifest is None:
+            return None
+
+        return cls(
+            hass,
+            f"{root_module.__name__}.{domain}",
+            pathlib.Path(root_module.__file__).parent / domain,
+            dict(manifest),
+        )
+
     @classmethod
     def resolve_legacy(
         cls, hass: "HomeAssistant", domain: str
@@ -364,9 +384,14 @@ async def async_get_integration(hass: "HomeAssistant", domain: str) -> Integrati
 
     from homeassistant import components  # pylint: disable=import-outside-toplevel
 
-    integration = await hass.async_add_executor_job(
-        Integration.resolve_from_root, hass, components, domain
-    )
+    # Built-in integrations are looked up in the manifest index, integrations
+    # added since it was generated are read from disk.
+    integration = Integration.resolve_from_index(hass, components, domain)
+
+    if integration is None:
+        integration = await hass.async_add_executor_job(
+            Integration.resolve_from_root, hass, components, domain
+        )
 
     if integration is not None:
         cache[domain] = integration
@@ -47,7 +47,11 @@ async def run_benchmark(bench):
     """Run a benchmark."""
     hass = core.HomeAssistant()
     runtime = await bench(hass)
-    print(f"Benchmark {bench.__name__} done in {runtime}s")
+    if isinstance(runtime, dict):
+        for name, value in runtime.items():
+            print(f"Benchmark {bench.__name__} ({name}) done in {value}s")
+    else:
+        print(f"Benchmark {bench.__name__} done in {runtime}s")
     await hass.async_stop()
 
 
@@ -323,6 +327,38 @@ async def json_serialize_states(hass):
     return timer() - start
 
 
+@benchmark
+async def register_entities(hass):
+    """Register entities of devices with 4 sensors like a startup would."""
+    return {
+        f"{entities} entities": _register_entities(hass, entities)
+        for entities in (1000, 4000)
+    }
+
+
+def _register_entities(hass, entities):
+    """Register a number of entities in empty registries."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.helpers import device_registry, entity_registry
+
+    dev_reg = device_registry.DeviceRegistry(hass)
+    dev_reg.devices = device_registry.DeviceRegistryItems()
+    dev_reg.deleted_devices = device_registry.DeviceRegistryItems()
+    ent_reg = entity_registry.EntityRegistry(hass)
+    ent_reg.entities = entity_registry.EntityRegistryItems()
+
+    start = timer()
+    for device in range(entities // 4):
+        device_entry = dev_reg.async_get_or_create(
+            config_entry_id="benchmark", identifiers={("benchmark", device)}
+        )
+        for sensor in range(4):
+            ent_reg.async_get_or_create(
+                "sensor", "benchmark", f"{device}-{sensor}", device_id=device_entry.id,
+            )
+    return timer() - start
+
+
 def _create_state_changed_event_from_old_new(
     entity_id, event_time_fired, old_state, new_state
 ):
@@ -345,6 +381,7 @@ def _create_state_changed_event_from_old_new(
             "entity_id"
             "domain"
             "attributes"
+            "shared_attrs"
             "state_id",
             "old_state_id",
         ],
@@ -352,7 +389,8 @@ def _create_state_changed_event_from_old_new(
 
     row.event_type = EVENT_STATE_CHANGED
     row.event_data = "{}"
-    row.attributes = attributes_json
+    row.attributes = None
+    row.shared_attrs = attributes_json
     row.time_fired = event_time_fired
     row.state = new_state and new_state.get("state")
     row.entity_id = entity_id
@@ -1,9 +1,11 @@
 """All methods needed to bootstrap a Home Assistant instance."""
 import asyncio
+import contextlib
+from datetime import datetime
 import logging.handlers
 from timeit import default_timer as timer
 from types import ModuleType
-from typing import Awaitable, Callable, Optional, Set
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional, Set
 
 from homeassistant import config as conf_util, core, loader, requirements
 from homeassistant.config import async_notify_setup_error
@@ -20,6 +22,8 @@ DATA_SETUP_DONE = "setup_done"
 DATA_SETUP_STARTED = "setup_started"
 DATA_SETUP = "setup_tasks"
 DATA_DEPS_REQS = "deps_reqs_processed"
+DATA_SETUP_TIMELINE = "setup_timeline"
+DATA_SETUP_TIMELINE_DONE = "setup_timeline_done"
 
 SLOW_SETUP_WARNING = 10
 
@@ -38,6 +42,56 @@ def async_set_domains_to_be_loaded(hass: core.HomeAssistant, domains: Set[str])
     hass.data[DATA_SETUP_DONE] = {domain: asyncio.Event() for domain in domains}
 
 
+@contextlib.contextmanager
+def async_track_setup_time(
+    hass: core.HomeAssistant, name: str, phase: str
+) -> Iterator[None]:
+    """Add the time spent in a phase of setting up to the setup timeline.
+
+    Name is the domain of an integration or the domain.platform of a platform.
+    """
+    start_time = dt_util.utcnow()
+    start = timer()
+    try:
+        yield
+    finally:
+        _async_add_to_setup_timeline(hass, name, phase, start_time, timer() - start)
+
+
+@core.callback
+def _async_add_to_setup_timeline(
+    hass: core.HomeAssistant,
+    name: str,
+    phase: str,
+    start_time: datetime,
+    duration: float,
+) -> None:
+    """Add a phase of setting up to the setup timeline."""
+    if hass.data.get(DATA_SETUP_TIMELINE_DONE):
+        return
+    hass.data.setdefault(DATA_SETUP_TIMELINE, []).append(
+        {"name": name, "phase": phase, "start": start_time, "duration": duration}
+    )
+
+
+@core.callback
+def async_finish_setup_timeline(hass: core.HomeAssistant) -> None:
+    """Stop adding to the setup timeline once startup is done.
+
+    Integrations set up or reloaded later on are not added, so the timeline
+    only holds the startup and does not keep growing.
+    """
+    hass.data[DATA_SETUP_TIMELINE_DONE] = True
+
+
+@core.callback
+def async_get_setup_timeline(hass: core.HomeAssistant) -> List[Dict[str, Any]]:
+    """Return the phases of setting up integrations and platforms by start time."""
+    return sorted(
+        hass.data.get(DATA_SETUP_TIMELINE, []), key=lambda entry: entry["start"]
+    )
+
+
 def setup_component(hass: core.HomeAssistant, domain: str, config: ConfigType) -> bool:
     """Set up a component and all its dependencies."""
     return asyncio.run_coroutine_threadsafe(
@@ -134,7 +188,8 @@ async def _async_setup_component(
     # Process requirements as soon as possible, so we can import the component
     # without requiring imports to be in functions.
     try:
-        await async_process_deps_reqs(hass, config, integration)
+        with async_track_setup_time(hass, domain, "deps_reqs"):
+            await async_process_deps_reqs(hass, config, integration)
     except HomeAssistantError as err:
         log_error(str(err), integration.documentation)
         return False
@@ -142,7 +197,8 @@ async def _async_setup_component(
     # Some integrations fail on import because they call functions incorrectly.
     # So we do it before validating config to catch these errors.
     try:
-        component = integration.get_component()
+        with async_track_setup_time(hass, domain, "import"):
+            component = integration.get_component()
     except ImportError as err:
         log_error(f"Unable to import component: {err}", integration.documentation)
         return False
@@ -160,7 +216,7 @@ async def _async_setup_component(
 
     start = timer()
     _LOGGER.info("Setting up %s", domain)
-    hass.data.setdefault(DATA_SETUP_STARTED, {})[domain] = dt_util.utcnow()
+    hass.data.setdefault(DATA_SETUP_STARTED, {})[domain] = start_time = dt_util.utcnow()
 
     if hasattr(component, "PLATFORM_SCHEMA"):
         # Entity components have their own warning
@@ -209,6 +265,7 @@ async def _async_setup_component(
         end = timer()
         if warn_task:
             warn_task.cancel()
+        _async_add_to_setup_timeline(hass, domain, "setup", start_time, end - start)
     _LOGGER.info("Setup of domain %s took %.1f seconds", domain, end - start)
 
     if result is False:
@@ -227,12 +284,12 @@ async def _async_setup_component(
     await asyncio.sleep(0)
     await hass.config_entries.flow.async_wait_init_flow_finish(domain)
 
-    await asyncio.gather(
-        *[
-            entry.async_setup(hass, integration=integration)
-            for entry in hass.config_entries.async_entries(domain)
-        ]
-    )
+    entries = hass.config_entries.async_entries(domain)
+    if entries:
+        with async_track_setup_time(hass, domain, "config_entries"):
+            await asyncio.gather(
+                *[entry.async_setup(hass, integration=integration) for entry in entries]
+            )
 
     hass.config.components.add(domain)
     hass.data[DATA_SETUP_STARTED].pop(domain)
@@ -254,6 +311,7 @@ async def async_prepare_setup_platform(
     This method is a coroutine.
     """
     platform_path = PLATFORM_FORMAT.format(domain=domain, platform=platform_name)
+    timeline_name = f"{domain}.{platform_name}"
 
     def log_error(msg: str) -> None:
         """Log helper."""
@@ -269,13 +327,15 @@ async def async_prepare_setup_platform(
     # Process deps and reqs as soon as possible, so that requirements are
     # available when we import the platform.
     try:
-        await async_process_deps_reqs(hass, hass_config, integration)
+        with async_track_setup_time(hass, timeline_name, "deps_reqs"):
+            await async_process_deps_reqs(hass, hass_config, integration)
     except HomeAssistantError as err:
         log_error(str(err))
         return None
 
     try:
-        platform = integration.get_platform(domain)
+        with async_track_setup_time(hass, timeline_name, "import"):
+            platform = integration.get_platform(domain)
     except ImportError as exc:
         log_error(f"Platform not found ({exc}).")
         return None
@@ -48,18 +48,33 @@ def save_json(
     private: bool = False,
     *,
     encoder: Optional[Type[json.JSONEncoder]] = None,
+    compact: bool = False,
 ) -> None:
     """Save JSON data to a file.
 
+    Compact JSON is written without indentation or sorted keys, which can
+    be encoded by the C accelerated encoder.
+
     Returns True on success.
     """
     try:
-        json_data = json.dumps(data, sort_keys=True, indent=4, cls=encoder)
+        if compact:
+            json_data = json.dumps(data, separators=(",", ":"), cls=encoder)
+        else:
+            json_data = json.dumps(data, sort_keys=True, indent=4, cls=encoder)
     except TypeError:
         msg = f"Failed to serialize to JSON: {filename}. Bad data at {format_unserializable_data(find_paths_unserializable_data(data))}"
         _LOGGER.error(msg)
         raise SerializationError(msg)
 
+    write_utf8_file(filename, json_data, private)
+
+
+def write_utf8_file(filename: str, utf8_data: str, private: bool = False) -> None:
+    """Write a file atomically by replacing it with a written temporary file.
+
+    Raises WriteError if the file could not be written.
+    """
     tmp_filename = ""
     tmp_path = os.path.split(filename)[0]
     try:
@@ -67,13 +82,13 @@ def save_json(
         with tempfile.NamedTemporaryFile(
             mode="w", encoding="utf-8", dir=tmp_path, delete=False
         ) as fdesc:
-            fdesc.write(json_data)
+            fdesc.write(utf8_data)
             tmp_filename = fdesc.name
         if not private:
             os.chmod(tmp_filename, 0o644)
         os.replace(tmp_filename, filename)
     except OSError as error:
-        _LOGGER.exception("Saving JSON file failed: %s", filename)
+        _LOGGER.exception("Saving file failed: %s", filename)
         raise WriteError(error)
     finally:
         if os.path.exists(tmp_filename):
@@ -82,7 +97,7 @@ def save_json(
             except OSError as err:
                 # If we are cleaning up then something else went wrong, so
                 # we should suppress likely follow-on errors in the cleanup
-                _LOGGER.error("JSON replacement cleanup failed: %s", err)
+                _LOGGER.error("File replacement cleanup failed: %s", err)
 
 
 def format_unserializable_data(data: Dict[str, Any]) -> str:
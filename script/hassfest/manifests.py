@@ -0,0 +1,81 @@
+"""Generate manifest index file."""
+import json
+from typing import Any, Dict
+
+from .model import Config, Integration
+
+BASE = """
+\"\"\"Automatically generated by hassfest.
+
+To update, run python3 -m script.hassfest
+\"\"\"
+
+# fmt: off
+
+MANIFESTS = {}
+""".strip()
+
+
+def format_value(value: Any, indent: int = 0) -> str:
+    """Format a JSON value as a Python literal."""
+    if isinstance(value, dict):
+        if not value:
+            return "{}"
+        items = [
+            f"{' ' * (indent + 4)}{json.dumps(key)}: {format_value(val, indent + 4)},"
+            for key, val in value.items()
+        ]
+        return "{\n" + "\n".join(items) + f"\n{' ' * indent}}}"
+
+    if isinstance(value, list):
+        if not value:
+            return "[]"
+        items = [
+            f"{' ' * (indent + 4)}{format_value(val, indent + 4)}," for val in value
+        ]
+        return "[\n" + "\n".join(items) + f"\n{' ' * indent}]"
+
+    if isinstance(value, str):
+        return json.dumps(value)
+
+    return repr(value)
+
+
+def generate_and_validate(integrations: Dict[str, Integration]):
+    """Validate and generate manifest index data."""
+    manifests = {}
+
+    for domain in sorted(integrations):
+        integration = integrations[domain]
+
+        if not integration.manifest:
+            continue
+
+        manifests[domain] = integration.manifest
+
+    return BASE.format(format_value(manifests))
+
+
+def validate(integrations: Dict[str, Integration], config: Config):
+    """Validate manifest index file."""
+    manifests_path = config.root / "homeassistant/generated/manifests.py"
+    config.cache["manifests"] = content = generate_and_validate(integrations)
+
+    if config.specific_integrations:
+        return
+
+    with open(str(manifests_path)) as fp:
+        if fp.read().strip() != content:
+            config.add_error(
+                "manifests",
+                "File manifests.py is not up to date. Run python3 -m script.hassfest",
+                fixable=True,
+            )
+        return
+
+
+def generate(integrations: Dict[str, Integration], config: Config):
+    """Generate manifest index file."""
+    manifests_path = config.root / "homeassistant/generated/manifests.py"
+    with open(str(manifests_path), "w") as fp:
+        fp.write(f"{config.cache['manifests']}\n")
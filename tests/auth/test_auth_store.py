@@ -4,6 +4,7 @@ import asyncio
 from homeassistant.auth import auth_store
 
 from tests.async_mock import patch
+from tests.common import mock_device_registry, mock_registry
 
 
 async def test_loading_no_group_data_format(hass, hass_storage):
@@ -188,6 +189,36 @@ async def test_loading_all_access_group_data_format(hass, hass_storage):
     assert system_token.id == "system-token-id"
 
 
+async def test_refresh_token_lookups(hass, hass_storage):
+    """Test refresh tokens are found by id and token until they are removed."""
+    store = auth_store.AuthStore(hass)
+    user = await store.async_create_user("Test User")
+    token = await store.async_create_refresh_token(user, "http://localhost/")
+    token_2 = await store.async_create_refresh_token(user, "http://localhost/")
+
+    assert await store.async_get_refresh_token(token.id) is token
+    assert await store.async_get_refresh_token_by_token(token.token) is token
+    assert await store.async_get_refresh_token_by_token(token.token[:-1]) is None
+
+    await store.async_remove_refresh_token(token)
+    assert user.refresh_tokens == {token_2.id: token_2}
+    assert await store.async_get_refresh_token(token.id) is None
+    assert await store.async_get_refresh_token_by_token(token.token) is None
+
+    hass_storage[auth_store.STORAGE_KEY] = {
+        "version": 1,
+        "data": store._data_to_save(),
+    }
+    store_2 = auth_store.AuthStore(hass)
+    loaded = await store_2.async_get_refresh_token_by_token(token_2.token)
+    assert loaded.id == token_2.id
+    assert await store_2.async_get_refresh_token(token_2.id) is loaded
+
+    await store_2.async_remove_user(loaded.user)
+    assert await store_2.async_get_refresh_token(token_2.id) is None
+    assert await store_2.async_get_refresh_token_by_token(token_2.token) is None
+
+
 async def test_loading_empty_data(hass, hass_storage):
     """Test we correctly load with no existing data."""
     store = auth_store.AuthStore(hass)
@@ -242,3 +273,56 @@ async def test_loading_race_condition(hass):
         mock_dev_registry.assert_called_once_with(hass)
         mock_load.assert_called_once_with()
         assert results[0] == results[1]
+
+
+async def test_entity_checks_follow_registry_changes(hass, hass_storage):
+    """Test remembered entity checks are invalidated when the registries change."""
+    hass_storage[auth_store.STORAGE_KEY] = {
+        "version": 1,
+        "data": {
+            "credentials": [],
+            "users": [
+                {
+                    "id": "user-id",
+                    "is_active": True,
+                    "is_owner": False,
+                    "name": "Wall tablet",
+                    "system_generated": False,
+                    "group_ids": ["kitchen-group"],
+                }
+            ],
+            "groups": [
+                {
+                    "id": "kitchen-group",
+                    "name": "Kitchen",
+                    "policy": {"entities": {"area_ids": {"kitchen": True}}},
+                }
+            ],
+            "refresh_tokens": [],
+        },
+    }
+    ent_reg = mock_registry(hass)
+    dev_reg = mock_device_registry(hass)
+    device = dev_reg.async_get_or_create(
+        config_entry_id="1234", identifiers={("hue", "1")}
+    )
+    dev_reg.async_update_device(device.id, area_id="kitchen")
+    ent_reg.async_get_or_create("light", "hue", "1", device_id=device.id)
+
+    store = auth_store.AuthStore(hass)
+    user = await store.async_get_user("user-id")
+    assert user.permissions.check_entity("light.hue_1", "read")
+
+    # The change is seen before the registry updated event is delivered
+    dev_reg.async_update_device(device.id, area_id="bedroom")
+    assert not user.permissions.check_entity("light.hue_1", "read")
+
+    dev_reg.async_update_device(device.id, area_id="kitchen")
+    await hass.async_block_till_done()
+    assert user.permissions.check_entity("light.hue_1", "read")
+
+    ent_reg.async_update_entity("light.hue_1", new_entity_id="light.renamed")
+    ent_reg.async_get_or_create("light", "hue", "2")
+    await hass.async_block_till_done()
+    assert not user.permissions.check_entity("light.hue_2", "read")
+    assert user.permissions.check_entity("light.renamed", "read")
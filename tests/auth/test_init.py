@@ -474,6 +474,38 @@ async def test_remove_refresh_token(mock_hass):
     assert await manager.async_validate_access_token(access_token) is None
 
 
+async def test_verified_access_tokens_are_remembered(hass):
+    """Test verified access tokens are not decoded again while still valid."""
+    manager = await auth.auth_manager_from_config(hass, [], [])
+    user = MockUser().add_to_auth_manager(manager)
+    refresh_token = await manager.async_create_refresh_token(user, CLIENT_ID)
+    access_token = manager.async_create_access_token(refresh_token)
+
+    assert await manager.async_validate_access_token(access_token) is refresh_token
+
+    with patch(
+        "homeassistant.auth.jwt.decode", side_effect=jwt.InvalidTokenError
+    ) as mock_decode:
+        assert await manager.async_validate_access_token(access_token) is refresh_token
+
+        user.is_active = False
+        assert await manager.async_validate_access_token(access_token) is None
+
+    assert mock_decode.call_count == 1
+    user.is_active = True
+    assert await manager.async_validate_access_token(access_token) is refresh_token
+
+    with patch(
+        "homeassistant.util.dt.utcnow",
+        return_value=dt_util.utcnow() + auth_const.ACCESS_TOKEN_CACHE_EXPIRATION,
+    ), patch("homeassistant.auth.jwt.decode", side_effect=jwt.InvalidTokenError):
+        assert await manager.async_validate_access_token(access_token) is None
+
+    assert await manager.async_validate_access_token(access_token) is refresh_token
+    await manager.async_remove_refresh_token(refresh_token)
+    assert await manager.async_validate_access_token(access_token) is None
+
+
 async def test_create_access_token(mock_hass):
     """Test normal refresh_token's jwt_key keep same after used."""
     manager = await auth.auth_manager_from_config(mock_hass, [], [])
@@ -350,7 +350,7 @@ def mock_component(hass, component):
 def mock_registry(hass, mock_entries=None):
     """Mock the Entity Registry."""
     registry = entity_registry.EntityRegistry(hass)
-    registry.entities = mock_entries or OrderedDict()
+    registry.entities = entity_registry.EntityRegistryItems(mock_entries)
 
     hass.data[entity_registry.DATA_REGISTRY] = registry
     return registry
@@ -368,8 +368,8 @@ def mock_area_registry(hass, mock_entries=None):
 def mock_device_registry(hass, mock_entries=None, mock_deleted_entries=None):
     """Mock the Device Registry."""
     registry = device_registry.DeviceRegistry(hass)
-    registry.devices = mock_entries or OrderedDict()
-    registry.deleted_devices = mock_deleted_entries or OrderedDict()
+    registry.devices = device_registry.DeviceRegistryItems(mock_entries)
+    registry.deleted_devices = device_registry.DeviceRegistryItems(mock_deleted_entries)
 
     hass.data[device_registry.DATA_REGISTRY] = registry
     return registry
@@ -934,6 +934,19 @@ def mock_storage(data=None):
         """Remove data."""
         data.pop(store.key, None)
 
+    def mock_load_journal(journal, path):
+        """Mock version of loading a journal."""
+        return list(data.get(journal.key, []))
+
+    def mock_write_journal(journal, path, records, mode):
+        """Mock version of writing to a journal."""
+        _LOGGER.info("Writing records to %s: %s", journal.key, records)
+        records = json.loads(json.dumps(records, cls=journal._encoder))
+        if mode == "a":
+            data.setdefault(journal.key, []).extend(records)
+        else:
+            data[journal.key] = records
+
     with patch(
         "homeassistant.helpers.storage.Store._async_load",
         side_effect=mock_async_load,
@@ -946,6 +959,14 @@ def mock_storage(data=None):
         "homeassistant.helpers.storage.Store.async_remove",
         side_effect=mock_remove,
         autospec=True,
+    ), patch(
+        "homeassistant.helpers.storage.Journal._load_data",
+        side_effect=mock_load_journal,
+        autospec=True,
+    ), patch(
+        "homeassistant.helpers.storage.Journal._write_data",
+        side_effect=mock_write_journal,
+        autospec=True,
     ):
         yield data
 
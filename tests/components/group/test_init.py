@@ -490,3 +490,37 @@ async def test_service_group_set_group_remove_group(hass):
 
     group_state = hass.states.get("group.user_test_group")
     assert group_state is None
+
+
+async def test_expand_entity_ids_follows_member_changes(hass):
+    """Test expanded groups are cached until the members of a group change."""
+    hass.states.async_set("group.lights", "on", {"entity_id": ["light.a", "light.b"]})
+    hass.states.async_set(
+        "group.all", "on", {"entity_id": ["group.lights", "switch.a", "group.all"]}
+    )
+
+    assert group.expand_entity_ids(hass, ["group.all"]) == [
+        "light.a",
+        "light.b",
+        "switch.a",
+    ]
+
+    with patch.object(group, "_expand_group") as mock_expand:
+        hass.states.async_set(
+            "group.lights", "off", {"entity_id": ["light.a", "light.b"]}
+        )
+        assert group.expand_entity_ids(hass, ["group.all", "light.c"]) == [
+            "light.a",
+            "light.b",
+            "switch.a",
+            "light.c",
+        ]
+    assert not mock_expand.called
+
+    hass.states.async_set(
+        "group.lights", "off", {"entity_id": ["light.c", "group.all"]}
+    )
+    assert group.expand_entity_ids(hass, ["group.all"]) == ["light.c", "switch.a"]
+
+    hass.states.async_remove("group.lights")
+    assert group.expand_entity_ids(hass, ["group.all"]) == ["switch.a"]
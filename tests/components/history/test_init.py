@@ -267,6 +267,66 @@ class TestComponentHistory(unittest.TestCase):
 
         assert states == hist
 
+    def test_get_significant_states_aggregated(self):
+        """Test that numeric states are aggregated into buckets.
+
+        The thermostat states are reduced to a full state followed by
+        one data point per bucket, other entities are returned as is.
+        """
+        zero, four, states = self.record_states()
+        bucket_size = timedelta(seconds=2.5)
+        hist = history.get_significant_states(
+            self.hass, zero, four, filters=history.Filters(), bucket_size=bucket_size
+        )
+
+        states["thermostat.test"] = [
+            states["thermostat.test"][0],
+            {
+                "state": "21",
+                "last_changed": zero.isoformat(),
+                "min": 20.0,
+                "max": 21.0,
+                "mean": 20.5,
+            },
+            {
+                "state": "21",
+                "last_changed": (zero + bucket_size).isoformat(),
+                "min": 21.0,
+                "max": 21.0,
+                "mean": 21.0,
+            },
+        ]
+        states["thermostat.test2"] = [
+            states["thermostat.test2"][0],
+            {
+                "state": "20",
+                "last_changed": zero.isoformat(),
+                "min": 20.0,
+                "max": 20.0,
+                "mean": 20.0,
+            },
+        ]
+
+        assert states == hist
+
+    def test_get_significant_states_max_points(self):
+        """Test that max_points sets the bucket size from the period."""
+        zero, four, states = self.record_states()
+        hist = history.get_significant_states(
+            self.hass, zero, four, filters=history.Filters(), max_points=1
+        )
+
+        assert hist["thermostat.test"][1:] == [
+            {
+                "state": "21",
+                "last_changed": zero.isoformat(),
+                "min": 20.0,
+                "max": 21.0,
+                "mean": 20.666666666666668,
+            }
+        ]
+        assert hist["media_player.test"] == states["media_player.test"]
+
     def test_get_significant_states_with_initial(self):
         """Test that only significant states are returned.
 
@@ -824,3 +884,117 @@ async def test_fetch_period_api_with_include_order(hass, hass_client):
         params={"filter_entity_id": "non.existing,something.else"},
     )
     assert response.status == 200
+
+
+async def test_fetch_period_api_streams_states(hass, hass_client):
+    """Test the fetch period view streams the states of each entity."""
+    await hass.async_add_executor_job(
+        init_recorder_component, hass, {recorder.CONF_COMMIT_INTERVAL: 0}
+    )
+    await async_setup_component(hass, "history", {})
+    await hass.async_add_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+    start = dt_util.utcnow()
+
+    for state in ("10", "11", "12"):
+        hass.states.async_set("sensor.outside", state)
+        hass.states.async_set("light.kitchen", "on" if state != "11" else "off")
+    await hass.async_block_till_done()
+    await hass.async_add_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    client = await hass_client()
+    with patch.object(history, "STREAM_BATCH_SIZE", 1), patch(
+        "homeassistant.components.http.view.STREAM_CHUNK_SIZE", 1
+    ):
+        response = await client.get(
+            f"/api/history/period/{start.isoformat()}", params={"minimal_response": ""}
+        )
+    assert response.status == 200
+    response_json = await response.json()
+
+    assert [[state["state"] for state in states] for states in response_json] == [
+        ["on", "off", "on"],
+        ["10", "11", "12"],
+    ]
+    assert [states[0]["entity_id"] for states in response_json] == [
+        "light.kitchen",
+        "sensor.outside",
+    ]
+    assert [states[-1]["entity_id"] for states in response_json] == [
+        "light.kitchen",
+        "sensor.outside",
+    ]
+    assert "entity_id" not in response_json[1][1]
+
+
+async def test_fetch_period_api_aggregated(hass, hass_client):
+    """Test the fetch period view aggregates numeric states."""
+    await hass.async_add_executor_job(
+        init_recorder_component, hass, {recorder.CONF_COMMIT_INTERVAL: 0}
+    )
+    await async_setup_component(hass, "history", {})
+    await hass.async_add_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+    start = dt_util.utcnow()
+
+    for state in ("10", "unavailable", "11", "12"):
+        hass.states.async_set("sensor.outside", state)
+    await hass.async_block_till_done()
+    await hass.async_add_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    client = await hass_client()
+    response = await client.get(
+        f"/api/history/period/{start.isoformat()}", params={"max_points": "10"}
+    )
+    assert response.status == 200
+    response_json = await response.json()
+
+    assert len(response_json) == 1
+    states = response_json[0]
+    assert states[0]["entity_id"] == "sensor.outside"
+    assert states[0]["state"] == "10"
+    assert len(states) == 2
+    assert states[1]["state"] == "12"
+    assert states[1]["min"] == 10
+    assert states[1]["max"] == 12
+    assert states[1]["mean"] == 11
+
+
+async def test_fetch_period_api_invalid_aggregation(hass, hass_client):
+    """Test the fetch period view with invalid aggregation parameters."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "history", {})
+    client = await hass_client()
+
+    for params in ({"max_points": "0"}, {"bucket_size": "a"}):
+        response = await client.get("/api/history/period", params=params)
+        assert response.status == 400
+
+
+async def test_fetch_statistics_api(hass, hass_client):
+    """Test the statistics view for history."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "history", {})
+    await hass.async_add_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+    client = await hass_client()
+
+    start = dt_util.utcnow() - timedelta(days=1)
+    with patch(
+        "homeassistant.components.history.statistics_during_period",
+        return_value={"sensor.test": [{"start": start, "mean": 1.0}]},
+    ) as statistics_during_period:
+        response = await client.get(
+            f"/api/history/statistics/{start.isoformat()}",
+            params={"filter_entity_id": "sensor.test", "period": "day"},
+        )
+    assert response.status == 200
+    assert await response.json() == {
+        "sensor.test": [{"start": start.isoformat(), "mean": 1.0}]
+    }
+    assert statistics_during_period.call_args[0][1:] == (
+        start,
+        None,
+        ["sensor.test"],
+        "day",
+    )
+
+    response = await client.get("/api/history/statistics", params={"period": "week"})
+    assert response.status == 400
@@ -1,4 +1,5 @@
 """Tests for Home Assistant View."""
+from aiohttp import ClientError, web
 from aiohttp.web_exceptions import (
     HTTPBadRequest,
     HTTPInternalServerError,
@@ -13,7 +14,7 @@ from homeassistant.components.http.view import (
 )
 from homeassistant.exceptions import ServiceNotFound, Unauthorized
 
-from tests.async_mock import AsyncMock, Mock
+from tests.async_mock import AsyncMock, Mock, patch
 
 
 @pytest.fixture
@@ -69,3 +70,38 @@ async def test_not_running(mock_request_with_stopping):
         Mock(requires_auth=False), AsyncMock(side_effect=Unauthorized)
     )(mock_request_with_stopping)
     assert response.status == 503
+
+
+async def test_json_stream(hass, aiohttp_client):
+    """Test streaming a JSON list in chunks."""
+
+    def items(count, fail_at):
+        for idx in range(count):
+            if idx == fail_at:
+                raise ValueError("boom")
+            yield {"idx": idx}
+
+    async def handler(request):
+        return await HomeAssistantView.json_stream(
+            request, items, 3, int(request.query.get("fail_at", -1))
+        )
+
+    app = web.Application()
+    app["hass"] = hass
+    app.router.add_get("/", handler)
+    client = await aiohttp_client(app)
+
+    with patch("homeassistant.components.http.view.STREAM_CHUNK_SIZE", 1):
+        response = await client.get("/")
+        assert response.status == 200
+        assert await response.json() == [{"idx": 0}, {"idx": 1}, {"idx": 2}]
+
+        # Nothing was sent yet, the error results in an error status
+        response = await client.get("/", params={"fail_at": 0})
+        assert response.status == 500
+
+        # The response started already, the connection is aborted
+        response = await client.get("/", params={"fail_at": 2})
+        assert response.status == 200
+        with pytest.raises(ClientError):
+            await response.read()
@@ -13,7 +13,11 @@ import voluptuous as vol
 from homeassistant.components import logbook, recorder, sun
 from homeassistant.components.alexa.smart_home import EVENT_ALEXA_SMART_HOME
 from homeassistant.components.automation import EVENT_AUTOMATION_TRIGGERED
-from homeassistant.components.recorder.models import process_timestamp_to_utc_isoformat
+from homeassistant.components.recorder.models import (
+    States,
+    process_timestamp_to_utc_isoformat,
+)
+from homeassistant.components.recorder.util import session_scope
 from homeassistant.components.script import EVENT_SCRIPT_STARTED
 from homeassistant.const import (
     ATTR_ENTITY_ID,
@@ -93,6 +97,9 @@ class TestComponentLogbook(unittest.TestCase):
         # scheduled. This means that they may not have been processed yet.
         self.hass.block_till_done()
         self.hass.data[recorder.DATA_INSTANCE].block_till_done()
+        trigger_db_commit(self.hass)
+        self.hass.block_till_done()
+        self.hass.data[recorder.DATA_INSTANCE].block_till_done()
 
         events = list(
             logbook._get_events(
@@ -1366,6 +1373,7 @@ class TestComponentLogbook(unittest.TestCase):
                 "entity_id"
                 "domain"
                 "attributes"
+                "shared_attrs"
                 "state_id",
                 "old_state_id",
             ],
@@ -1373,7 +1381,8 @@ class TestComponentLogbook(unittest.TestCase):
 
         row.event_type = EVENT_STATE_CHANGED
         row.event_data = "{}"
-        row.attributes = attributes_json
+        row.attributes = None
+        row.shared_attrs = attributes_json
         row.time_fired = event_time_fired
         row.state = new_state and new_state.get("state")
         row.entity_id = entity_id
@@ -1395,6 +1404,81 @@ async def test_logbook_view(hass, hass_client):
     assert response.status == 200
 
 
+async def test_logbook_view_paginated(hass, hass_client):
+    """Test the logbook view returns pages linked by a cursor."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "logbook", {})
+    await hass.async_add_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    start = dt_util.utcnow() - timedelta(hours=3)
+    for idx in range(6):
+        # Every state change is in another batch of GROUP_BY_MINUTES
+        with patch(
+            "homeassistant.core.dt_util.utcnow",
+            return_value=start + timedelta(minutes=20 * idx),
+        ):
+            hass.states.async_set("switch.test", STATE_ON if idx % 2 else STATE_OFF)
+    await hass.async_add_job(partial(trigger_db_commit, hass))
+    await hass.async_block_till_done()
+    await hass.async_add_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    client = await hass_client()
+
+    url = f"/api/logbook/{(start - timedelta(hours=1)).isoformat()}?limit=2"
+    pages = []
+    while url is not None:
+        response = await client.get(url)
+        assert response.status == 200
+        pages.append([entry["message"] for entry in await response.json()])
+        link = response.links.get("next")
+        url = link["url"].path_qs if link else None
+
+    assert pages == [
+        ["turned on", "turned off"],
+        ["turned on", "turned off"],
+        ["turned on"],
+    ]
+
+    response = await client.get(f"/api/logbook/{start.isoformat()}?limit=0")
+    assert response.status == 400
+
+    response = await client.get(f"/api/logbook/{start.isoformat()}?cursor=invalid")
+    assert response.status == 400
+
+
+async def test_logbook_view_paginated_within_batch(hass, hass_client):
+    """Test pages are cut at the limit inside a batch of GROUP_BY_MINUTES."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "logbook", {})
+    await hass.async_add_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    start = dt_util.utcnow() - timedelta(hours=3)
+    with patch("homeassistant.core.dt_util.utcnow", return_value=start):
+        for state in (STATE_OFF, STATE_ON):
+            for idx in range(5):
+                hass.states.async_set(f"switch.test_{idx}", state)
+    await hass.async_add_job(partial(trigger_db_commit, hass))
+    await hass.async_block_till_done()
+    await hass.async_add_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    client = await hass_client()
+
+    url = f"/api/logbook/{(start - timedelta(hours=1)).isoformat()}?limit=2"
+    pages = []
+    while url is not None:
+        response = await client.get(url)
+        assert response.status == 200
+        pages.append([entry["entity_id"] for entry in await response.json()])
+        link = response.links.get("next")
+        url = link["url"].path_qs if link else None
+
+    assert pages == [
+        ["switch.test_0", "switch.test_1"],
+        ["switch.test_2", "switch.test_3"],
+        ["switch.test_4"],
+    ]
+
+
 async def test_logbook_view_period_entity(hass, hass_client):
     """Test the logbook view with period and entity."""
     await hass.async_add_executor_job(init_recorder_component, hass)
@@ -1509,6 +1593,10 @@ async def test_logbook_describe_event(hass, hass_client):
             hass.data[recorder.DATA_INSTANCE].block_till_done
         )
 
+    await hass.async_add_job(partial(trigger_db_commit, hass))
+    await hass.async_block_till_done()
+    await hass.async_add_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
     client = await hass_client()
     response = await client.get("/api/logbook")
     results = await response.json()
@@ -1577,6 +1665,10 @@ async def test_exclude_described_event(hass, hass_client):
             hass.data[recorder.DATA_INSTANCE].block_till_done
         )
 
+    await hass.async_add_job(partial(trigger_db_commit, hass))
+    await hass.async_block_till_done()
+    await hass.async_add_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
     client = await hass_client()
     response = await client.get("/api/logbook")
     results = await response.json()
@@ -1758,6 +1850,56 @@ async def test_filter_continuous_sensor_values(hass, hass_client):
     assert response_json[1]["entity_id"] == entity_id_third
 
 
+async def test_filter_continuous_sensor_values_legacy_rows(hass, hass_client):
+    """Test remove continuous sensor events recorded before the has_unit flag."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "logbook", {})
+    await hass.async_add_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    entity_id_test = "switch.test"
+    hass.states.async_set(entity_id_test, STATE_OFF)
+    hass.states.async_set(entity_id_test, STATE_ON)
+    entity_id_second = "sensor.bla"
+    hass.states.async_set(entity_id_second, STATE_OFF, {"unit_of_measurement": "foo"})
+    hass.states.async_set(entity_id_second, STATE_ON, {"unit_of_measurement": "foo"})
+    entity_id_third = "sensor.no_unit"
+    hass.states.async_set(entity_id_third, STATE_OFF, {"friendly_name": "No unit"})
+    hass.states.async_set(entity_id_third, STATE_ON, {"friendly_name": "No unit"})
+
+    await hass.async_add_job(partial(trigger_db_commit, hass))
+    await hass.async_block_till_done()
+    await hass.async_add_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    def _clear_has_unit():
+        """Make the rows look like they were recorded with schema v11."""
+        with session_scope(hass=hass) as session:
+            assert (
+                session.query(States)
+                .filter(States.domain == "sensor")
+                .filter(States.attributes.is_(None))
+                .filter(States.attributes_id.isnot(None))
+                .count()
+                == 4
+            )
+            session.query(States).update({States.has_unit: None})
+
+    await hass.async_add_executor_job(_clear_has_unit)
+
+    client = await hass_client()
+
+    # Today time 00:00:00
+    start = dt_util.utcnow().date()
+    start_date = datetime(start.year, start.month, start.day)
+
+    response = await client.get(f"/api/logbook/{start_date.isoformat()}")
+    assert response.status == 200
+    response_json = await response.json()
+
+    assert len(response_json) == 2
+    assert response_json[0]["entity_id"] == entity_id_test
+    assert response_json[1]["entity_id"] == entity_id_third
+
+
 async def test_exclude_new_entities(hass, hass_client):
     """Test if events are excluded on first update."""
     await hass.async_add_executor_job(init_recorder_component, hass)
@@ -575,6 +575,52 @@ async def test_subscribe_special_characters(hass, mqtt_mock, calls, record_calls
     assert calls[0][0].payload == payload
 
 
+async def test_subscribe_same_topic_wildcards_unsubscribe(
+    hass, mqtt_mock, calls, record_calls
+):
+    """Test removing one subscription keeps other matching filters."""
+    unsub_wildcard = await mqtt.async_subscribe(hass, "test-topic/+", record_calls)
+    await mqtt.async_subscribe(hass, "test-topic/#", record_calls)
+    unsub_exact = await mqtt.async_subscribe(hass, "test-topic/bier", record_calls)
+
+    async_fire_mqtt_message(hass, "test-topic/bier", "test-payload")
+    await hass.async_block_till_done()
+    assert len(calls) == 3
+    assert {call[0].subscribed_topic for call in calls} == {
+        "test-topic/+",
+        "test-topic/#",
+        "test-topic/bier",
+    }
+
+    unsub_wildcard()
+    unsub_exact()
+    calls.clear()
+
+    async_fire_mqtt_message(hass, "test-topic/bier", "test-payload")
+    await hass.async_block_till_done()
+    assert len(calls) == 1
+    assert calls[0][0].subscribed_topic == "test-topic/#"
+
+
+async def test_unsubscribe_during_message_handling(hass, mqtt_mock, calls):
+    """Test a subscription can be removed from its own callback."""
+    unsubs = []
+
+    @callback
+    def unsub_callback(msg):
+        calls.append(msg)
+        for unsub in unsubs:
+            unsub()
+
+    unsubs.append(await mqtt.async_subscribe(hass, "test-topic", unsub_callback))
+
+    async_fire_mqtt_message(hass, "test-topic", "test-payload")
+    await hass.async_block_till_done()
+    async_fire_mqtt_message(hass, "test-topic", "test-payload")
+    await hass.async_block_till_done()
+    assert len(calls) == 1
+
+
 async def test_retained_message_on_subscribe_received(
     hass, mqtt_client_mock, mqtt_mock
 ):
@@ -14,7 +14,12 @@ from homeassistant.components.recorder import (
     run_information_with_session,
 )
 from homeassistant.components.recorder.const import DATA_INSTANCE
-from homeassistant.components.recorder.models import Events, RecorderRuns, States
+from homeassistant.components.recorder.models import (
+    Events,
+    RecorderRuns,
+    StateAttributes,
+    States,
+)
 from homeassistant.components.recorder.util import session_scope
 from homeassistant.const import MATCH_ALL, STATE_LOCKED, STATE_UNLOCKED
 from homeassistant.core import ATTR_NOW, EVENT_TIME_CHANGED, Context, callback
@@ -127,6 +132,7 @@ def _add_entities(hass, entity_ids):
 
 
 def _add_events(hass, events):
+    wait_recording_done(hass)
     with session_scope(hass=hass) as session:
         session.query(Events).delete(synchronize_session=False)
     for event_type in events:
@@ -434,3 +440,46 @@ def test_run_information(hass_recorder):
 
 class CannotSerializeMe:
     """A class that the JSONEncoder cannot serialize."""
+
+
+def test_saving_batches_until_commit(hass_recorder):
+    """Test states are written in one batch per commit."""
+    hass = hass_recorder()
+    instance = hass.data[DATA_INSTANCE]
+
+    for idx in range(5):
+        hass.states.set("test.one", f"state{idx}", {})
+    wait_recording_done(hass)
+
+    assert instance.queue_depth == 0
+    assert instance.total_commits > 0
+    assert instance.last_commit_duration is not None
+
+    with session_scope(hass=hass) as session:
+        states = list(session.query(States))
+        assert len(states) == 5
+        assert states[0].old_state_id is None
+        for prev, cur in zip(states, states[1:]):
+            assert cur.old_state_id == prev.state_id
+            assert cur.event_id is not None
+
+
+def test_saving_state_shares_attributes(hass_recorder):
+    """Test states with the same attributes share the stored attributes."""
+    hass = hass_recorder()
+
+    hass.states.set("test.one", "on", {"unit": "W"})
+    hass.states.set("test.two", "on", {"unit": "W"})
+    wait_recording_done(hass)
+    hass.states.set("test.one", "off", {"unit": "W"})
+    hass.states.set("test.two", "off", {"unit": "kW"})
+    wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        states = list(session.query(States))
+        assert len(states) == 4
+        assert all(state.attributes is None for state in states)
+        assert len({state.attributes_id for state in states[:3]}) == 1
+        assert states[3].attributes_id != states[0].attributes_id
+        assert session.query(StateAttributes).count() == 2
+        assert states[3].to_native().attributes == {"unit": "kW"}
@@ -1,5 +1,6 @@
 """The tests for the Recorder component."""
 from datetime import datetime
+import json
 import unittest
 
 import pytest
@@ -11,7 +12,9 @@ from homeassistant.components.recorder.models import (
     Base,
     Events,
     RecorderRuns,
+    StateAttributes,
     States,
+    decode_attributes,
     process_timestamp,
     process_timestamp_to_utc_isoformat,
 )
@@ -71,7 +74,21 @@ class TestStates(unittest.TestCase):
         # We don't restore context unless we need it by joining the
         # events table on the event_id for state_changed events
         state.context = ha.Context(id=None)
-        assert state == States.from_event(event).to_native()
+        db_state = States.from_event(event)
+        db_state.state_attributes = StateAttributes(
+            shared_attrs=StateAttributes.shared_attrs_from_event(event)
+        )
+        assert state == db_state.to_native()
+
+    def test_from_event_has_unit(self):
+        """Test the states with a unit of measurement are flagged."""
+        for attributes, has_unit in (({"unit_of_measurement": "W"}, True), ({}, False)):
+            state = ha.State("sensor.power", "18", attributes)
+            event = ha.Event(
+                EVENT_STATE_CHANGED,
+                {"entity_id": "sensor.power", "old_state": None, "new_state": state},
+            )
+            assert States.from_event(event).has_unit is has_unit
 
     def test_from_event_to_delete_state(self):
         """Test converting deleting state event to db state."""
@@ -90,6 +107,35 @@ class TestStates(unittest.TestCase):
         assert db_state.state == ""
         assert db_state.last_changed == event.time_fired
         assert db_state.last_updated == event.time_fired
+        assert db_state.has_unit is False
+        assert StateAttributes.shared_attrs_from_event(event) == "{}"
+
+
+class TestStateAttributes(unittest.TestCase):
+    """Test StateAttributes model."""
+
+    # pylint: disable=no-self-use
+
+    def test_shared_attrs_from_event(self):
+        """Test the attributes of equal states are stored the same."""
+        events = [
+            ha.Event(
+                EVENT_STATE_CHANGED,
+                {
+                    "entity_id": entity_id,
+                    "old_state": None,
+                    "new_state": ha.State(entity_id, "18", {"unit": "°C"}),
+                },
+            )
+            for entity_id in ("sensor.one", "sensor.two")
+        ]
+        shared_attrs = [StateAttributes.shared_attrs_from_event(ev) for ev in events]
+
+        assert shared_attrs[0] == shared_attrs[1]
+        assert json.loads(shared_attrs[0]) == {"unit": "°C"}
+        assert StateAttributes.hash_shared_attrs(
+            shared_attrs[0]
+        ) == StateAttributes.hash_shared_attrs(shared_attrs[1])
 
 
 class TestRecorderRuns(unittest.TestCase):
@@ -241,3 +287,13 @@ async def test_process_timestamp_to_utc_isoformat():
         == "2016-07-09T21:31:00+00:00"
     )
     assert process_timestamp_to_utc_isoformat(None) is None
+
+
+def test_decode_attributes_read_only():
+    """Test decoded attributes are shared but can not be modified."""
+    attributes = decode_attributes('{"unit": "°C"}')
+
+    assert attributes == {"unit": "°C"}
+    assert decode_attributes('{"unit": "°C"}') is attributes
+    with pytest.raises(TypeError):
+        attributes["unit"] = "°F"
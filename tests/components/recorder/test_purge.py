@@ -5,7 +5,12 @@ import unittest
 
 from homeassistant.components import recorder
 from homeassistant.components.recorder.const import DATA_INSTANCE
-from homeassistant.components.recorder.models import Events, RecorderRuns, States
+from homeassistant.components.recorder.models import (
+    Events,
+    RecorderRuns,
+    StateAttributes,
+    States,
+)
 from homeassistant.components.recorder.purge import purge_old_data
 from homeassistant.components.recorder.util import session_scope
 from homeassistant.util import dt as dt_util
@@ -164,6 +169,44 @@ class TestRecorderPurge(unittest.TestCase):
             assert finished
             assert events.count() == 2
 
+    def test_purge_old_state_attributes(self):
+        """Test deleting the attributes only referenced by old states."""
+        now = datetime.now()
+        eleven_days_ago = now - timedelta(days=11)
+
+        self.hass.block_till_done()
+        self.hass.data[DATA_INSTANCE].block_till_done()
+
+        with recorder.session_scope(hass=self.hass) as session:
+            old_attributes = StateAttributes(shared_attrs='{"old": 1}')
+            shared_attributes = StateAttributes(shared_attrs='{"shared": 1}')
+            for timestamp, state_attributes in (
+                (eleven_days_ago, old_attributes),
+                (eleven_days_ago, shared_attributes),
+                (now, shared_attributes),
+            ):
+                session.add(
+                    States(
+                        entity_id="test.recorder2",
+                        domain="sensor",
+                        state="on",
+                        state_attributes=state_attributes,
+                        last_changed=timestamp,
+                        last_updated=timestamp,
+                        created=timestamp,
+                    )
+                )
+
+        with session_scope(hass=self.hass) as session:
+            attributes = session.query(StateAttributes)
+            assert attributes.count() == 2
+
+            while not purge_old_data(self.hass.data[DATA_INSTANCE], 4, repack=False):
+                pass
+
+            assert session.query(States).count() == 1
+            assert [attrs.shared_attrs for attrs in attributes] == ['{"shared": 1}']
+
     def test_purge_method(self):
         """Test purge method."""
         service_data = {"keep_days": 4}
@@ -224,6 +267,6 @@ class TestRecorderPurge(unittest.TestCase):
                 self.hass.block_till_done()
                 self.hass.data[DATA_INSTANCE].block_till_done()
                 assert (
-                    mock_logger.debug.mock_calls[5][1][0]
+                    mock_logger.debug.mock_calls[6][1][0]
                     == "Vacuuming SQL DB to free space"
                 )
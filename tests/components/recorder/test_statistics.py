@@ -0,0 +1,157 @@
+"""The tests for the recorder statistics."""
+from datetime import timedelta
+
+import pytest
+from sqlalchemy.exc import SQLAlchemyError
+
+from homeassistant.components.recorder import StatisticsTask
+from homeassistant.components.recorder.const import DATA_INSTANCE
+from homeassistant.components.recorder.models import States, StatisticsRuns
+from homeassistant.components.recorder.purge import purge_old_data
+from homeassistant.components.recorder.statistics import (
+    PERIOD_DAY,
+    PERIOD_HOUR,
+    statistics_during_period,
+)
+from homeassistant.components.recorder.util import session_scope
+import homeassistant.util.dt as dt_util
+
+from .common import wait_recording_done
+
+from tests.async_mock import patch
+from tests.common import get_test_home_assistant, init_recorder_component
+
+
+@pytest.fixture
+def hass_recorder():
+    """Home Assistant fixture with in-memory recorder."""
+    hass = get_test_home_assistant()
+
+    def setup_recorder(config=None):
+        """Set up with params."""
+        init_recorder_component(hass, config)
+        hass.start()
+        hass.block_till_done()
+        hass.data[DATA_INSTANCE].block_till_done()
+        return hass
+
+    yield setup_recorder
+    hass.stop()
+
+
+def _add_states(hass, day_start):
+    """Add states of the last two hours of a day."""
+    with session_scope(hass=hass) as session:
+        for entity_id, state, offset in (
+            ("sensor.temperature", "10", timedelta(hours=22, minutes=10)),
+            ("sensor.temperature", "20", timedelta(hours=22, minutes=40)),
+            ("sensor.temperature", "unavailable", timedelta(hours=23)),
+            ("sensor.temperature", "30", timedelta(hours=23, minutes=5)),
+            ("sensor.mode", "10", timedelta(hours=22, minutes=10)),
+            ("sensor.mode", "eco", timedelta(hours=22, minutes=20)),
+        ):
+            session.add(
+                States(
+                    entity_id=entity_id,
+                    domain="sensor",
+                    state=state,
+                    attributes="{}",
+                    last_changed=day_start + offset,
+                    last_updated=day_start + offset,
+                )
+            )
+
+
+def _compile_statistics(hass):
+    """Compile the statistics of all past hours in the recorder thread."""
+    instance = hass.data[DATA_INSTANCE]
+    instance.queue.put(StatisticsTask())
+    instance.block_till_done()
+
+
+def test_compile_hourly_and_daily_statistics(hass_recorder):
+    """Test statistics are compiled for numeric entities."""
+    hass = hass_recorder()
+    day_start = (dt_util.utcnow() - timedelta(days=2)).replace(
+        hour=0, minute=0, second=0, microsecond=0
+    )
+    _add_states(hass, day_start)
+
+    _compile_statistics(hass)
+
+    assert statistics_during_period(hass, day_start) == {
+        "sensor.temperature": [
+            {
+                "start": day_start + timedelta(hours=22),
+                "min": 10.0,
+                "max": 20.0,
+                "mean": 15.0,
+                "sum": 30.0,
+            },
+            {
+                "start": day_start + timedelta(hours=23),
+                "min": 30.0,
+                "max": 30.0,
+                "mean": 30.0,
+                "sum": 30.0,
+            },
+        ]
+    }
+    assert statistics_during_period(
+        hass, day_start, entity_ids=["sensor.temperature"], period=PERIOD_DAY
+    ) == {
+        "sensor.temperature": [
+            {"start": day_start, "min": 10.0, "max": 30.0, "mean": 20.0, "sum": 60.0}
+        ]
+    }
+    assert statistics_during_period(
+        hass, day_start, day_start + timedelta(hours=23), period=PERIOD_HOUR
+    )["sensor.temperature"][-1]["start"] == day_start + timedelta(hours=22)
+
+    # Every hour is compiled once
+    with session_scope(hass=hass) as session:
+        runs = session.query(StatisticsRuns).count()
+    _compile_statistics(hass)
+    with session_scope(hass=hass) as session:
+        assert session.query(StatisticsRuns).count() == runs
+    assert len(statistics_during_period(hass, day_start)["sensor.temperature"]) == 2
+
+
+def test_statistics_kept_on_purge(hass_recorder):
+    """Test statistics are kept when the states are purged."""
+    hass = hass_recorder()
+    day_start = (dt_util.utcnow() - timedelta(days=2)).replace(
+        hour=0, minute=0, second=0, microsecond=0
+    )
+    _add_states(hass, day_start)
+    _compile_statistics(hass)
+
+    while not purge_old_data(hass.data[DATA_INSTANCE], 1, repack=False):
+        pass
+
+    with session_scope(hass=hass) as session:
+        assert session.query(States).count() == 0
+    assert len(statistics_during_period(hass, day_start)["sensor.temperature"]) == 2
+
+
+def test_pending_states_kept_on_statistics_error(hass_recorder):
+    """Test pending states are written when compiling statistics fails."""
+    hass = hass_recorder()
+    day_start = (dt_util.utcnow() - timedelta(days=2)).replace(
+        hour=0, minute=0, second=0, microsecond=0
+    )
+    _add_states(hass, day_start)
+
+    hass.states.set("sensor.pending", "5")
+    hass.block_till_done()
+    hass.data[DATA_INSTANCE].block_till_done()
+
+    with patch(
+        "homeassistant.components.recorder.statistics._compile_hourly_statistics",
+        side_effect=SQLAlchemyError,
+    ):
+        _compile_statistics(hass)
+
+    wait_recording_done(hass)
+    with session_scope(hass=hass) as session:
+        assert session.query(States).filter_by(entity_id="sensor.pending").count() == 1
@@ -6,7 +6,11 @@ import unittest
 import pytest
 
 from homeassistant.components import recorder
-from homeassistant.components.statistics.sensor import StatisticsSensor
+from homeassistant.components.statistics.sensor import (
+    SampleAccumulator,
+    StatesLoader,
+    StatisticsSensor,
+)
 from homeassistant.const import ATTR_UNIT_OF_MEASUREMENT, STATE_UNKNOWN, TEMP_CELSIUS
 from homeassistant.setup import setup_component
 from homeassistant.util import dt as dt_util
@@ -362,6 +366,51 @@ class TestStatisticsSensor(unittest.TestCase):
         state = self.hass.states.get("sensor.test")
         assert str(self.mean) == state.state
 
+    def test_initialize_multiple_from_database(self):
+        """Test the states of several sensors are loaded in one batch."""
+        init_recorder_component(self.hass)
+        self.hass.block_till_done()
+        self.hass.data[recorder.DATA_INSTANCE].block_till_done()
+        for value in self.values:
+            self.hass.states.set("sensor.test_monitored", value)
+            self.hass.states.set("sensor.other_monitored", value * 2)
+            self.hass.block_till_done()
+        wait_recording_done(self.hass)
+
+        assert setup_component(
+            self.hass,
+            "sensor",
+            {
+                "sensor": [
+                    {
+                        "platform": "statistics",
+                        "name": "test",
+                        "entity_id": "sensor.test_monitored",
+                        "sampling_size": 100,
+                    },
+                    {
+                        "platform": "statistics",
+                        "name": "other",
+                        "entity_id": "sensor.other_monitored",
+                        "sampling_size": 3,
+                    },
+                ]
+            },
+        )
+        self.hass.block_till_done()
+
+        with patch.object(
+            StatesLoader, "_load", autospec=True, side_effect=StatesLoader._load
+        ) as load:
+            self.hass.start()
+            self.hass.block_till_done()
+
+        assert load.call_count == 1
+        assert self.hass.states.get("sensor.test").state == str(self.mean)
+        assert self.hass.states.get("sensor.other").state == str(
+            round(statistics.mean(self.values[-3:]) * 2, 2)
+        )
+
     def test_initialize_from_database_with_maxage(self):
         """Test initializing the statistics from the database."""
         mock_data = {
@@ -434,3 +483,30 @@ class TestStatisticsSensor(unittest.TestCase):
         assert mock_data["return_time"] == state.attributes.get("max_age") + timedelta(
             hours=1
         )
+
+
+def test_sample_accumulator():
+    """Test the running statistics follow a sliding window of samples."""
+    values = [17, 20, 15.2, 5, 3.8, 9.2, 6.7, 14, 6, 6, -3.5]
+    accumulator = SampleAccumulator()
+
+    for index, value in enumerate(values):
+        accumulator.add(value)
+        if index >= 4:
+            accumulator.remove(values[index - 4])
+        window = values[max(index - 3, 0) : index + 1]
+
+        assert accumulator.count == len(window)
+        assert accumulator.mean == pytest.approx(statistics.mean(window))
+        assert accumulator.median == pytest.approx(statistics.median(window))
+        assert accumulator.total == pytest.approx(sum(window))
+        assert accumulator.min == min(window)
+        assert accumulator.max == max(window)
+        if len(window) > 1:
+            assert accumulator.variance == pytest.approx(statistics.variance(window))
+            assert accumulator.stdev == pytest.approx(statistics.stdev(window))
+
+    for value in values[-4:]:
+        accumulator.remove(value)
+    assert accumulator.count == 0
+    assert accumulator.mean == 0
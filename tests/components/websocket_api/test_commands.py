@@ -1,7 +1,7 @@
 """Tests for WebSocket API commands."""
 from async_timeout import timeout
 
-from homeassistant.components.websocket_api import const
+from homeassistant.components.websocket_api import const, messages
 from homeassistant.components.websocket_api.auth import (
     TYPE_AUTH,
     TYPE_AUTH_OK,
@@ -13,6 +13,7 @@ from homeassistant.exceptions import HomeAssistantError
 from homeassistant.loader import async_get_integration
 from homeassistant.setup import async_setup_component
 
+from tests.async_mock import patch
 from tests.common import async_mock_service
 
 
@@ -186,6 +187,36 @@ async def test_subscribe_unsubscribe_events(hass, websocket_client):
     assert sum(hass.bus.async_listeners().values()) == init_count
 
 
+async def test_subscribe_events_serialized_once(hass, websocket_client):
+    """Test subscriptions to the same event share the serialization."""
+    for iden in (5, 6):
+        await websocket_client.send_json(
+            {"id": iden, "type": "subscribe_events", "event_type": "test_event"}
+        )
+        msg = await websocket_client.receive_json()
+        assert msg["success"]
+
+    with patch(
+        "homeassistant.components.websocket_api.const.JSON_DUMP",
+        side_effect=const.JSON_DUMP,
+    ) as mock_dump:
+        hass.bus.async_fire("test_event", {"hello": "world"})
+
+        with timeout(3):
+            msgs = [
+                await websocket_client.receive_json(),
+                await websocket_client.receive_json(),
+            ]
+
+    assert len(mock_dump.mock_calls) == 1
+    assert len(hass.data[messages.DATA_EVENT_MESSAGE_CACHE]) == 1
+    assert sorted(msg["id"] for msg in msgs) == [5, 6]
+    for msg in msgs:
+        assert msg["type"] == "event"
+        assert msg["event"]["event_type"] == "test_event"
+        assert msg["event"]["data"] == {"hello": "world"}
+
+
 async def test_get_states(hass, websocket_client):
     """Test get_states command."""
     hass.states.async_set("greeting.hello", "world")
@@ -515,3 +546,17 @@ async def test_manifest_get(hass, websocket_client):
     assert msg["type"] == const.TYPE_RESULT
     assert not msg["success"]
     assert msg["error"]["code"] == "not_found"
+
+
+async def test_setup_timeline(hass, websocket_client):
+    """Test getting the setup timeline."""
+    await websocket_client.send_json({"id": 5, "type": "setup/timeline"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 5
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+    assert {(entry["name"], entry["phase"]) for entry in msg["result"]} >= {
+        ("http", "setup"),
+        ("websocket_api", "setup"),
+    }
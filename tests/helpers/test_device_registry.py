@@ -563,6 +563,41 @@ async def test_update(registry):
     assert updated_entry.via_device_id == "98765B"
 
 
+async def test_indexes_follow_updates(registry):
+    """Test the lookups by identifier, connection, area and config entry."""
+    entry = registry.async_get_or_create(
+        config_entry_id="1234",
+        connections={(device_registry.CONNECTION_NETWORK_MAC, "12:34:56:AB:CD:EF")},
+        identifiers={("hue", "456")},
+    )
+
+    assert registry.async_get_device({("hue", "456")}, set()) == entry
+    assert (
+        registry.async_get_device(
+            set(), {(device_registry.CONNECTION_NETWORK_MAC, "12:34:56:ab:cd:ef")}
+        )
+        == entry
+    )
+
+    entry = registry.async_update_device(
+        entry.id, area_id="12345A", new_identifiers={("hue", "654")}
+    )
+    assert registry.async_get_device({("hue", "456")}, set()) is None
+    assert registry.async_get_device({("hue", "654")}, set()) == entry
+    assert device_registry.async_entries_for_area(registry, "12345A") == [entry]
+
+    registry.async_remove_device(entry.id)
+    assert registry.async_get_device({("hue", "654")}, set()) is None
+    assert device_registry.async_entries_for_area(registry, "12345A") == []
+    assert device_registry.async_entries_for_config_entry(registry, "1234") == []
+    assert (
+        registry.async_get_or_create(
+            config_entry_id="1234", identifiers={("hue", "654")}
+        ).id
+        == entry.id
+    )
+
+
 async def test_update_remove_config_entries(hass, registry, update_events):
     """Make sure we do not get duplicate entries."""
     entry = registry.async_get_or_create(
@@ -11,7 +11,7 @@ from homeassistant.core import Context
 from homeassistant.helpers import entity, entity_registry
 
 from tests.async_mock import MagicMock, PropertyMock, patch
-from tests.common import get_test_home_assistant, mock_registry
+from tests.common import MockEntityPlatform, get_test_home_assistant, mock_registry
 
 
 def test_generate_entity_id_requires_hass_or_ids():
@@ -690,3 +690,46 @@ async def test_warn_slow_write_state_custom_component(hass, caplog):
         "(<class 'custom_components.bla.sensor.test_warn_slow_write_state_custom_component.<locals>.CustomComponentEntity'>) "
         "took 10.000 seconds. Please report it to the custom component author."
     ) in caplog.text
+
+
+async def test_skip_writing_unchanged_state(hass):
+    """Test we skip building the state when nothing changed."""
+    platform = MockEntityPlatform(hass)
+    ent = entity.Entity()
+    ent.hass = hass
+    ent.entity_id = "hello.world"
+    ent.platform = platform
+    attrs = {"hello": "world"}
+
+    with patch.object(
+        entity.Entity, "state_attributes", PropertyMock(return_value=attrs)
+    ):
+        ent.async_write_ha_state()
+        state = hass.states.get("hello.world")
+        ent.async_write_ha_state()
+        assert hass.states.get("hello.world") is state
+        assert platform.emitted_state_writes == 1
+        assert platform.suppressed_state_writes == 1
+
+        # Attributes changed in place are written
+        attrs["hello"] = "beer"
+        ent.async_write_ha_state()
+        assert hass.states.get("hello.world").attributes["hello"] == "beer"
+        assert platform.emitted_state_writes == 2
+
+        # State written by someone else is overwritten
+        hass.states.async_set("hello.world", "other")
+        ent.async_write_ha_state()
+        assert hass.states.get("hello.world").state == "unknown"
+        assert platform.emitted_state_writes == 3
+
+        # Forced updates are always written
+        with patch.object(
+            entity.Entity, "force_update", PropertyMock(return_value=True)
+        ):
+            state = hass.states.get("hello.world")
+            ent.async_write_ha_state()
+            assert hass.states.get("hello.world") is not state
+            assert platform.emitted_state_writes == 4
+
+    assert platform.suppressed_state_writes == 1
@@ -19,6 +19,7 @@ from tests.async_mock import AsyncMock, Mock, patch
 from tests.common import (
     MockConfigEntry,
     MockEntity,
+    MockEntityPlatform,
     MockModule,
     MockPlatform,
     async_fire_time_changed,
@@ -385,6 +386,23 @@ async def test_update_entity(hass):
     assert entity.async_update_ha_state.mock_calls[-1][1][0] is True
 
 
+async def test_get_entity_index(hass):
+    """Test the entities of the platforms are indexed by the component."""
+    component = EntityComponent(_LOGGER, DOMAIN, hass)
+    entity = MockEntity(name="indexed")
+    await component.async_add_entities([entity])
+    assert component.get_entity("test_domain.indexed") is entity
+
+    # Platforms of the domain not set up by the component are not indexed
+    platform = MockEntityPlatform(hass, platform_name="other")
+    await platform.async_add_entities([MockEntity(name="unowned")])
+    assert component.get_entity("test_domain.unowned") is None
+
+    await component.async_remove_entity("test_domain.indexed")
+    assert component.get_entity("test_domain.indexed") is None
+    assert hass.states.get("test_domain.indexed") is None
+
+
 async def test_set_service_race(hass):
     """Test race condition on setting service."""
     exception = False
@@ -285,6 +285,44 @@ def test_async_get_entity_id(registry):
     assert registry.async_get_entity_id("light", "hue", "123") is None
 
 
+async def test_indexes_follow_updates(registry):
+    """Test the lookups by unique id, device and config entry follow changes."""
+    mock_config = MockConfigEntry(domain="light", entry_id="mock-id-1")
+    entry = registry.async_get_or_create(
+        "light", "hue", "1234", config_entry=mock_config, device_id="device-1"
+    )
+    entry2 = registry.async_get_or_create(
+        "light", "hue", "5678", config_entry=mock_config, device_id="device-1"
+    )
+
+    assert entity_registry.async_entries_for_device(registry, "device-1") == [
+        entry,
+        entry2,
+    ]
+
+    entry = registry.async_update_entity(
+        entry.entity_id, new_entity_id="light.renamed", new_unique_id="4321"
+    )
+    assert registry.async_get_entity_id("light", "hue", "1234") is None
+    assert registry.async_get_entity_id("light", "hue", "4321") == "light.renamed"
+    assert entity_registry.async_entries_for_config_entry(registry, "mock-id-1") == [
+        entry2,
+        entry,
+    ]
+
+    registry.async_get_or_create("light", "hue", "5678", device_id="device-2")
+    entry2 = registry.async_get(entry2.entity_id)
+    assert entity_registry.async_entries_for_device(registry, "device-1") == [entry]
+    assert entity_registry.async_entries_for_device(registry, "device-2") == [entry2]
+
+    registry.async_remove(entry.entity_id)
+    assert registry.async_get_entity_id("light", "hue", "4321") is None
+    assert entity_registry.async_entries_for_device(registry, "device-1") == []
+    assert entity_registry.async_entries_for_config_entry(registry, "mock-id-1") == [
+        entry2
+    ]
+
+
 async def test_updating_config_entry_id(hass, registry, update_events):
     """Test that we update config entry id in registry."""
     mock_config_1 = MockConfigEntry(domain="light", entry_id="mock-id-1")
@@ -248,3 +248,17 @@ def test_filter_schema_include_exclude():
     }
     filt = INCLUDE_EXCLUDE_FILTER_SCHEMA(conf)
     assert filt.config == conf
+
+
+def test_filter_results_are_memoized():
+    """Test the filter result is computed once per entity_id."""
+    testfilter = generate_filter(
+        [], ["switch.kitchen"], [], [], ["sensor.kitchen_*", "binary_sensor.*_door"]
+    )
+
+    assert testfilter("sensor.kitchen_temperature")
+    assert testfilter("binary_sensor.front_door")
+    assert not testfilter("sensor.bedroom_temperature")
+    assert testfilter("sensor.kitchen_temperature")
+    assert testfilter.cache_info().hits == 1
+    assert testfilter.cache_info().misses == 3
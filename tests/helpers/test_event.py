@@ -1,15 +1,19 @@
 """Test event helpers."""
 # pylint: disable=protected-access
 from datetime import datetime, timedelta
+import time
 
 from astral import Astral
 import pytest
 
 from homeassistant.components import sun
-from homeassistant.const import MATCH_ALL
+from homeassistant.const import EVENT_TIME_CHANGED, MATCH_ALL
 import homeassistant.core as ha
 from homeassistant.core import callback
+from homeassistant.exceptions import TemplateError
 from homeassistant.helpers.event import (
+    CLOCK_JUMP_TOLERANCE,
+    _async_get_time_pattern_clock,
     async_call_later,
     async_track_point_in_time,
     async_track_point_in_utc_time,
@@ -19,6 +23,7 @@ from homeassistant.helpers.event import (
     async_track_sunrise,
     async_track_sunset,
     async_track_template,
+    async_track_template_result,
     async_track_time_change,
     async_track_time_interval,
     async_track_utc_time_change,
@@ -906,6 +911,90 @@ async def test_periodic_task_duplicate_time(hass):
     unsub()
 
 
+async def test_periodic_task_clock_jump_forward(hass):
+    """Test periodic tasks run once when the clock jumps past their time."""
+    specific_runs = []
+
+    unsub = async_track_utc_time_change(
+        hass, lambda x: specific_runs.append(x), hour="/2", minute=0, second=0
+    )
+
+    async_fire_time_changed(hass, datetime(2014, 5, 24, 21, 59, 0))
+    await hass.async_block_till_done()
+    assert len(specific_runs) == 0
+
+    async_fire_time_changed(hass, datetime(2014, 5, 27, 1, 0, 0))
+    await hass.async_block_till_done()
+    assert specific_runs == [datetime(2014, 5, 27, 1, 0, 0, tzinfo=dt_util.UTC)]
+
+    async_fire_time_changed(hass, datetime(2014, 5, 27, 1, 30, 0))
+    await hass.async_block_till_done()
+    assert len(specific_runs) == 1
+
+    async_fire_time_changed(hass, datetime(2014, 5, 27, 2, 0, 0))
+    await hass.async_block_till_done()
+    assert len(specific_runs) == 2
+
+    unsub()
+
+
+async def test_periodic_task_action_raises(hass, caplog):
+    """Test periodic tasks keep running after their action raised."""
+    specific_runs = []
+
+    @callback
+    def failing_action(now):
+        specific_runs.append(now)
+        raise ValueError("boom")
+
+    unsub = async_track_utc_time_change(hass, failing_action, minute=0, second=0)
+
+    async_fire_time_changed(hass, datetime(2014, 5, 24, 22, 0, 0))
+    await hass.async_block_till_done()
+    assert len(specific_runs) == 1
+    assert "boom" in caplog.text
+
+    async_fire_time_changed(hass, datetime(2014, 5, 24, 23, 0, 0))
+    await hass.async_block_till_done()
+    assert len(specific_runs) == 2
+
+    unsub()
+
+
+async def test_periodic_task_shares_time_listener(hass):
+    """Test periodic tasks share a single time changed listener."""
+    listeners = hass.bus.async_listeners().get(EVENT_TIME_CHANGED, 0)
+
+    unsub_hour = async_track_utc_time_change(hass, lambda x: None, minute=0, second=0)
+    unsub_minute = async_track_utc_time_change(hass, lambda x: None, second=0)
+    assert hass.bus.async_listeners()[EVENT_TIME_CHANGED] == listeners + 1
+
+    unsub_hour()
+    assert hass.bus.async_listeners()[EVENT_TIME_CHANGED] == listeners + 1
+
+    unsub_minute()
+    assert hass.bus.async_listeners().get(EVENT_TIME_CHANGED, 0) == listeners
+
+
+async def test_periodic_task_time_changed_handled_late(hass):
+    """Test a time changed event handled late is not taken for a clock jump."""
+    clock = _async_get_time_pattern_clock(hass)
+    jumps = []
+    unsub = clock.async_add_listener(jumps.append)
+
+    hass.bus.async_fire(EVENT_TIME_CHANGED, {"now": dt_util.utcnow()})
+    # Keep the loop busy so the event is handled late
+    time.sleep(CLOCK_JUMP_TOLERANCE * 2)
+    await hass.async_block_till_done()
+
+    assert jumps == []
+    assert abs(clock.async_now() - dt_util.utcnow()) < timedelta(
+        seconds=CLOCK_JUMP_TOLERANCE
+    )
+
+    unsub()
+
+
 async def test_periodic_task_entering_dst(hass):
     """Test periodic task behavior when entering dst."""
     timezone = dt_util.get_time_zone("Europe/Vienna")
@@ -1011,3 +1100,100 @@ async def test_async_call_later(hass):
     assert p_action is action
     assert p_point == now + timedelta(seconds=3)
     assert remove is mock()
+
+
+async def test_track_template_result(hass):
+    """Test tracking template results on the states the template accessed."""
+    specific_runs = []
+    wildcard_runs = []
+
+    template_condition = Template("{{states.sensor.test.state}}", hass)
+    template_count = Template("{{ states.sensor | count }}", hass)
+
+    hass.states.async_set("sensor.test", "5")
+
+    def specific_run_callback(event, last_result, result):
+        specific_runs.append((last_result, result))
+
+    async_track_template_result(hass, template_condition, specific_run_callback)
+
+    @ha.callback
+    def wildcard_run_callback(event, last_result, result):
+        wildcard_runs.append(result)
+
+    unsub = async_track_template_result(hass, template_count, wildcard_run_callback)
+
+    hass.states.async_set("sensor.test", "6")
+    await hass.async_block_till_done()
+
+    assert specific_runs == [("5", "6")]
+    assert wildcard_runs == []
+
+    hass.states.async_set("light.test", "on")
+    hass.states.async_set("sensor.other", "1")
+    await hass.async_block_till_done()
+
+    assert specific_runs == [("5", "6")]
+    assert wildcard_runs == ["2"]
+
+    unsub()
+    hass.states.async_remove("sensor.other")
+    await hass.async_block_till_done()
+
+    assert wildcard_runs == ["2"]
+
+
+async def test_track_template_result_rearms_listeners(hass):
+    """Test the listeners follow the entities the last render accessed."""
+    runs = []
+
+    template = Template(
+        "{% if is_state('input_boolean.switch', 'on') %}"
+        "{{ states('sensor.one') }}{% else %}{{ states('sensor.two') }}{% endif %}",
+        hass,
+    )
+
+    hass.states.async_set("input_boolean.switch", "on")
+    hass.states.async_set("sensor.one", "1")
+    hass.states.async_set("sensor.two", "2")
+
+    @ha.callback
+    def run_callback(event, last_result, result):
+        runs.append(result)
+
+    async_track_template_result(hass, template, run_callback)
+
+    hass.states.async_set("sensor.two", "22")
+    await hass.async_block_till_done()
+    assert runs == []
+
+    hass.states.async_set("input_boolean.switch", "off")
+    await hass.async_block_till_done()
+    assert runs == ["22"]
+
+    hass.states.async_set("sensor.one", "11")
+    await hass.async_block_till_done()
+    assert runs == ["22"]
+
+    hass.states.async_set("sensor.two", "222")
+    await hass.async_block_till_done()
+    assert runs == ["22", "222"]
+
+
+async def test_track_template_result_error(hass):
+    """Test a template failing to render is tracked on all state changes."""
+    runs = []
+
+    template = Template("{{ states.sensor.test.state | float / 0 }}", hass)
+
+    @ha.callback
+    def run_callback(event, last_result, result):
+        runs.append(result)
+
+    async_track_template_result(hass, template, run_callback)
+
+    hass.states.async_set("light.test", "on")
+    await hass.async_block_till_done()
+
+    assert len(runs) == 1
+    assert isinstance(runs[0], TemplateError)
@@ -1,5 +1,5 @@
 """The tests for the Restore component."""
-from datetime import datetime
+from datetime import datetime, timedelta
 
 from homeassistant.const import EVENT_HOMEASSISTANT_START
 from homeassistant.core import CoreState, State
@@ -7,6 +7,7 @@ from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.restore_state import (
     DATA_RESTORE_STATE_TASK,
+    JOURNAL_KEY,
     STORAGE_KEY,
     RestoreEntity,
     RestoreStateData,
@@ -156,17 +157,20 @@ async def test_dump_data(hass):
 
     with patch(
         "homeassistant.helpers.restore_state.Store.async_save"
-    ) as mock_write_data, patch.object(hass.states, "async_all", return_value=states):
+    ) as mock_write_data, patch(
+        "homeassistant.helpers.restore_state.Journal.async_save"
+    ) as mock_write_journal, patch.object(
+        hass.states, "async_all", return_value=states
+    ):
         await data.async_dump_states()
 
-    assert mock_write_data.called
-    args = mock_write_data.mock_calls[0][1]
-    written_states = args[0]
-    assert len(written_states) == 2
-    assert written_states[0]["state"]["entity_id"] == "input_boolean.b3"
-    assert written_states[0]["state"]["state"] == "off"
-    assert written_states[1]["state"]["entity_id"] == "input_boolean.b5"
-    assert written_states[1]["state"]["state"] == "off"
+    # Only the change is written
+    assert not mock_write_data.called
+    assert mock_write_journal.called
+    args = mock_write_journal.mock_calls[0][1]
+    records = args[0]
+    assert len(records) == 1
+    assert records[0]["removed"] == "input_boolean.b1"
 
 
 async def test_dump_error(hass):
@@ -268,3 +272,123 @@ async def test_restoring_invalid_entity_id(hass, hass_storage):
 
     state = await entity.async_get_last_state()
     assert state is None
+
+
+async def test_dump_changed_states(hass, hass_storage):
+    """Test that only changed states are saved between compactions."""
+    entities = []
+    for object_id in ("b0", "b1", "b2"):
+        entity = RestoreEntity()
+        entity.hass = hass
+        entity.entity_id = f"input_boolean.{object_id}"
+        await entity.async_internal_added_to_hass()
+        hass.states.async_set(entity.entity_id, "off")
+        entities.append(entity)
+
+    data = await RestoreStateData.async_get_instance(hass)
+    await hass.async_block_till_done()
+    await data.async_dump_states()
+    assert len(hass_storage[STORAGE_KEY]["data"]) == 3
+    assert JOURNAL_KEY not in hass_storage
+
+    # Nothing changed
+    await data.async_dump_states()
+    assert JOURNAL_KEY not in hass_storage
+
+    hass.states.async_set("input_boolean.b1", "on")
+    await data.async_dump_states()
+    records = hass_storage[JOURNAL_KEY]
+    assert len(records) == 1
+    assert records[0]["state"]["entity_id"] == "input_boolean.b1"
+    assert records[0]["state"]["state"] == "on"
+
+    # The state of a removed entity is kept
+    await entities[2].async_remove()
+    await data.async_dump_states()
+    assert len(hass_storage[JOURNAL_KEY]) == 2
+    assert hass_storage[JOURNAL_KEY][1]["state"]["entity_id"] == "input_boolean.b2"
+
+    # The journal would hold as many records as there are states
+    hass.states.async_set("input_boolean.b0", "on")
+    await data.async_dump_states()
+    assert len(hass_storage[JOURNAL_KEY]) == 2
+    assert [item["state"]["state"] for item in hass_storage[STORAGE_KEY]["data"]] == [
+        "on",
+        "on",
+        "off",
+    ]
+
+    # The journal is replaced after compacting
+    hass.states.async_set("input_boolean.b0", "off")
+    await data.async_dump_states()
+    assert len(hass_storage[JOURNAL_KEY]) == 1
+
+    # All states are saved again once a day
+    hass.states.async_set("input_boolean.b0", "on")
+    with patch(
+        "homeassistant.helpers.restore_state.dt_util.utcnow",
+        return_value=dt_util.utcnow() + timedelta(days=2),
+    ):
+        await data.async_dump_states()
+    assert len(hass_storage[JOURNAL_KEY]) == 1
+    assert hass_storage[STORAGE_KEY]["data"][0]["state"]["state"] == "on"
+
+
+async def test_replay_journal(hass, hass_storage):
+    """Test that the journal is replayed on top of the saved states."""
+    # The clock was set back after compacting, so wall clock times of the
+    # records do not tell which ones were saved after compacting.
+    now = dt_util.utcnow().isoformat()
+    earlier = (dt_util.utcnow() - timedelta(hours=1)).isoformat()
+
+    def _stored_state(entity_id, state, last_seen, sequence):
+        return {
+            "state": State(entity_id, state).as_dict(),
+            "last_seen": last_seen,
+            "sequence": sequence,
+        }
+
+    hass_storage[STORAGE_KEY] = {
+        "version": 1,
+        "key": STORAGE_KEY,
+        "data": [
+            _stored_state("input_boolean.b0", "off", now, 5),
+            _stored_state("input_boolean.b1", "off", now, 5),
+            _stored_state("input_boolean.b2", "off", now, 5),
+        ],
+    }
+    hass_storage[JOURNAL_KEY] = [
+        # Saved before the states were compacted
+        _stored_state("input_boolean.b0", "on", now, 4),
+        _stored_state("input_boolean.b1", "on", earlier, 6),
+        _stored_state("input_boolean.b3", "on", earlier, 6),
+        {"removed": "input_boolean.b2", "sequence": 7},
+    ]
+
+    data = await RestoreStateData.async_get_instance(hass)
+
+    assert {
+        entity_id: stored_state.state.state
+        for entity_id, stored_state in data.last_states.items()
+    } == {"input_boolean.b0": "off", "input_boolean.b1": "on", "input_boolean.b3": "on"}
+
+    # Dumps are numbered after the saved records
+    await hass.async_block_till_done()
+    await data.async_dump_states()
+    assert {item["sequence"] for item in hass_storage[STORAGE_KEY]["data"]} == {8}
+
+
+async def test_replay_journal_without_states(hass, hass_storage):
+    """Test that a journal left over from before an empty compaction is ignored."""
+    hass_storage[STORAGE_KEY] = {"version": 1, "key": STORAGE_KEY, "data": []}
+    hass_storage[JOURNAL_KEY] = [
+        {
+            "state": State("input_boolean.b0", "on").as_dict(),
+            "last_seen": dt_util.utcnow().isoformat(),
+            "sequence": 3,
+        }
+    ]
+
+    data = await RestoreStateData.async_get_instance(hass)
+
+    assert data.last_states == {}
@@ -412,6 +412,36 @@ async def test_call_with_sync_attr(hass, mock_entities):
     assert mock_method.mock_calls[0][2] == {}
 
 
+async def test_call_with_batch_handler(hass, mock_entities):
+    """Test platforms with a batch handler are called once for their entities."""
+    batch_handler = AsyncMock(return_value=None)
+    platform = Mock(batch_service_handlers={"turn_on": batch_handler})
+    mock_entities["light.kitchen"].platform = platform
+    mock_entities["light.bedroom"].platform = platform
+    mock_method = mock_entities["light.living_room"].turn_on = Mock(return_value=None)
+
+    await service.entity_service_call(
+        hass,
+        mock_entities,
+        "turn_on",
+        ha.ServiceCall(
+            "test_domain",
+            "test_service",
+            {
+                "entity_id": ["light.kitchen", "light.living_room", "light.bedroom"],
+                "brightness": 100,
+            },
+        ),
+    )
+
+    assert mock_method.call_count == 1
+    assert batch_handler.call_count == 1
+    assert batch_handler.mock_calls[0][1] == (
+        [mock_entities["light.bedroom"], mock_entities["light.kitchen"]],
+    )
+    assert batch_handler.mock_calls[0][2] == {"brightness": 100}
+
+
 async def test_call_context_user_not_exist(hass):
     """Check we don't allow deleted users to do things."""
     with pytest.raises(exceptions.UnknownUser) as err:
@@ -236,3 +236,90 @@ async def test_migrator_transforming_config(hass, store, hass_storage):
         "version": MOCK_VERSION,
         "data": data,
     }
+
+
+async def test_journal_file(loop, tmpdir):
+    """Test we append records to the journal file and read them back."""
+    hass = Mock()
+    hass.config.path = lambda *path: tmpdir.join(*path).strpath
+    journal = storage.Journal(hass, MOCK_KEY)
+
+    journal._write_data(journal.path, [MOCK_DATA], "w")
+    journal._write_data(journal.path, [MOCK_DATA2], "a")
+    assert journal._load_data(journal.path) == [MOCK_DATA, MOCK_DATA2]
+
+    # An interrupted write is ignored
+    with open(journal.path, "a") as fdesc:
+        fdesc.write('{"hello": ')
+    assert journal._load_data(journal.path) == [MOCK_DATA, MOCK_DATA2]
+
+    journal._write_data(journal.path, [MOCK_DATA2], "w")
+    assert journal._load_data(journal.path) == [MOCK_DATA2]
+
+    with pytest.raises(storage.json_util.SerializationError):
+        journal._write_data(journal.path, [object()], "a")
+
+
+async def test_delayed_saves_written_together(hass, hass_storage):
+    """Test delayed saves that are due together are written in one job."""
+    store = storage.Store(hass, MOCK_VERSION, MOCK_KEY)
+    store2 = storage.Store(hass, MOCK_VERSION, "storage-test-2")
+    store3 = storage.Store(hass, MOCK_VERSION, "storage-test-3")
+    store.async_delay_save(lambda: MOCK_DATA, 1)
+    store2.async_delay_save(lambda: MOCK_DATA2, 2)
+    store3.async_delay_save(lambda: MOCK_DATA2, 10)
+
+    with patch.object(
+        hass, "async_add_executor_job", wraps=hass.async_add_executor_job
+    ) as mock_executor:
+        async_fire_time_changed(hass, dt.utcnow() + timedelta(seconds=1))
+        await hass.async_block_till_done()
+
+    assert len(mock_executor.mock_calls) == 1
+    assert hass_storage[store.key]["data"] == MOCK_DATA
+    assert hass_storage[store2.key]["data"] == MOCK_DATA2
+    assert store3.key not in hass_storage
+
+    async_fire_time_changed(hass, dt.utcnow() + timedelta(seconds=10))
+    await hass.async_block_till_done()
+    assert hass_storage[store3.key]["data"] == MOCK_DATA2
+
+    timings = storage.async_get_write_timings(hass)
+    assert timings[store.key].writes == 1
+    assert timings[store3.key].writes == 1
+    assert timings[store3.key].total >= timings[store3.key].last
+
+
+async def test_delayed_save_cancelled_by_save(hass, hass_storage):
+    """Test a save cancels the pending delayed save of a store."""
+    store = storage.Store(hass, MOCK_VERSION, MOCK_KEY)
+    store.async_delay_save(lambda: MOCK_DATA, 1)
+    await store.async_save(MOCK_DATA2)
+    hass_storage.clear()
+
+    async_fire_time_changed(hass, dt.utcnow() + timedelta(seconds=1))
+    await hass.async_block_till_done()
+    assert store.key not in hass_storage
+
+
+async def test_delayed_saves_data_func_raises(hass, hass_storage, caplog):
+    """Test a failing data function does not lose the data of other stores."""
+    store = storage.Store(hass, MOCK_VERSION, MOCK_KEY)
+    store2 = storage.Store(hass, MOCK_VERSION, "storage-test-2")
+    store3 = storage.Store(hass, MOCK_VERSION, "storage-test-3")
+
+    def broken_data_func():
+        raise ValueError("Boom")
+
+    store.async_delay_save(lambda: MOCK_DATA, 1)
+    # Keys are written in order, so the broken store sits in the middle
+    store2.async_delay_save(broken_data_func, 1)
+    store3.async_delay_save(lambda: MOCK_DATA2, 1)
+
+    async_fire_time_changed(hass, dt.utcnow() + timedelta(seconds=1))
+    await hass.async_block_till_done()
+
+    assert hass_storage[store.key]["data"] == MOCK_DATA
+    assert store2.key not in hass_storage
+    assert hass_storage[store3.key]["data"] == MOCK_DATA2
+    assert "Error generating data for storage-test-2" in caplog.text
@@ -20,7 +20,7 @@ from homeassistant.helpers import template
 import homeassistant.util.dt as dt_util
 from homeassistant.util.unit_system import UnitSystem
 
-from tests.async_mock import patch
+from tests.async_mock import Mock, patch
 
 
 def _set_up_units(hass):
@@ -737,6 +737,39 @@ def test_render_with_possible_json_value_non_string_value(hass):
     assert tpl.async_render_with_possible_json_value(value) == expected
 
 
+def test_render_with_possible_json_value_static(hass):
+    """Render with possible JSON value of a static template."""
+    tpl = template.Template(" static value ", hass)
+    with patch.object(template.TemplateEnvironment, "cached_template") as mock_compile:
+        assert tpl.async_render_with_possible_json_value('{"hello": "world"}') == (
+            "static value"
+        )
+        assert tpl.async_render() == "static value"
+    assert not mock_compile.called
+
+
+def test_compiled_templates_are_shared(hass):
+    """Test templates with the same source share their compiled template."""
+    tpl = template.Template("{{ 1 + 1 }}", hass)
+    same_tpl = template.Template("{{ 1 + 1 }}", hass)
+
+    assert tpl.async_render() == "2"
+    assert same_tpl.async_render() == "2"
+    assert tpl._compiled is same_tpl._compiled
+
+
+def test_compiled_templates_kept_per_instance(hass):
+    """Test compiled templates are not shared between instances."""
+    tpl = template.Template("{{ 1 + 1 }}", hass)
+    assert tpl.async_render() == "2"
+
+    other_hass = Mock(data={})
+    other_tpl = template.Template("{{ 1 + 1 }}", other_hass)
+    assert other_tpl._env is not tpl._env
+    other_tpl.ensure_valid()
+    assert other_tpl._compiled_code is not tpl._compiled_code
+
+
 def test_if_state_exists(hass):
     """Test if state exists works."""
     hass.states.async_set("test.object", "available")
@@ -480,6 +480,52 @@ class TestEventBus(unittest.TestCase):
         assert len(coroutine_calls) == 1
 
 
+async def test_event_filter(hass):
+    """Test listeners are only scheduled when their event filter matches."""
+    calls = []
+
+    @ha.callback
+    def listener(event):
+        calls.append(event)
+
+    @ha.callback
+    def event_filter(event):
+        return event.data.get("entity_id") == "light.kitchen"
+
+    unsub = hass.bus.async_listen("test_filter", listener, event_filter=event_filter)
+    assert hass.bus.async_listeners()["test_filter"] == 1
+
+    hass.bus.async_fire("test_filter", {"entity_id": "light.bedroom"})
+    hass.bus.async_fire("test_filter", {"entity_id": "light.kitchen"})
+    await hass.async_block_till_done()
+    assert len(calls) == 1
+    assert calls[0].data["entity_id"] == "light.kitchen"
+
+    unsub()
+    assert "test_filter" not in hass.bus.async_listeners()
+
+
+async def test_event_filter_raises(hass, caplog):
+    """Test a raising event filter does not stop the other listeners."""
+    calls = []
+
+    @ha.callback
+    def listener(event):
+        calls.append(event)
+
+    @ha.callback
+    def event_filter(event):
+        raise ValueError("bad filter")
+
+    hass.bus.async_listen("test_filter", listener, event_filter=event_filter)
+    hass.bus.async_listen("test_filter", listener)
+
+    hass.bus.async_fire("test_filter")
+    await hass.async_block_till_done()
+    assert len(calls) == 1
+    assert "Error in event filter" in caplog.text
+
+
 def test_state_init():
     """Test state.init."""
     with pytest.raises(InvalidEntityFormatError):
@@ -3,6 +3,7 @@ import pytest
 
 from homeassistant.components import http, hue
 from homeassistant.components.hue import light as hue_light
+from homeassistant.generated.manifests import MANIFESTS
 import homeassistant.loader as loader
 
 from tests.async_mock import ANY, patch
@@ -142,6 +143,23 @@ async def test_get_integration(hass):
     assert hue_light == integration.get_platform("light")
 
 
+async def test_get_integration_from_index(hass):
+    """Test resolving a built-in integration without reading its manifest."""
+    await loader.async_get_custom_components(hass)
+
+    with patch.object(
+        loader.Integration, "resolve_from_root", side_effect=AssertionError
+    ):
+        integration = await loader.async_get_integration(hass, "hue")
+
+    assert integration.is_built_in
+    assert integration.file_path == loader.pathlib.Path(hue.__file__).parent
+    assert integration.manifest["domain"] == "hue"
+    assert integration.manifest["is_built_in"]
+    # The index is not changed by the integration
+    assert "is_built_in" not in MANIFESTS["hue"]
+
+
 async def test_get_integration_legacy(hass):
     """Test resolving integration."""
     integration = await loader.async_get_integration(hass, "test_embedded")
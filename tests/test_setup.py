@@ -587,3 +587,55 @@ async def test_parallel_entry_setup(hass):
     await setup.async_setup_component(hass, "comp", {})
 
     assert calls == [1, 2, 1, 2]
+
+
+async def test_setup_timeline(hass):
+    """Test the phases of setting up are added to the setup timeline."""
+    MockConfigEntry(domain="comp", data={"value": 1}).add_to_hass(hass)
+
+    async def mock_async_setup_entry(hass, entry):
+        """Mock setting up an entry."""
+        return True
+
+    mock_integration(
+        hass, MockModule("comp", async_setup_entry=mock_async_setup_entry,),
+    )
+    mock_entity_platform(hass, "config_flow.comp", None)
+    mock_entity_platform(hass, "switch.comp", MockPlatform())
+
+    assert await setup.async_setup_component(hass, "comp", {})
+    assert await setup.async_setup_component(
+        hass, "switch", {"switch": {"platform": "comp"}}
+    )
+    await hass.async_block_till_done()
+
+    timeline = setup.async_get_setup_timeline(hass)
+    phases = [(entry["name"], entry["phase"]) for entry in timeline]
+    for phase in (
+        ("comp", "deps_reqs"),
+        ("comp", "import"),
+        ("comp", "setup"),
+        ("comp", "config_entries"),
+        ("switch", "setup"),
+        ("switch.comp", "import"),
+        ("switch.comp", "platform"),
+    ):
+        assert phase in phases
+    assert all(entry["duration"] >= 0 for entry in timeline)
+    assert [entry["start"] for entry in timeline] == sorted(
+        entry["start"] for entry in timeline
+    )
+
+
+async def test_setup_timeline_finished(hass):
+    """Test integrations set up after startup are not added to the timeline."""
+    mock_integration(hass, MockModule("comp"))
+    mock_integration(hass, MockModule("comp2"))
+
+    assert await setup.async_setup_component(hass, "comp", {})
+    setup.async_finish_setup_timeline(hass)
+    assert await setup.async_setup_component(hass, "comp2", {})
+
+    names = {entry["name"] for entry in setup.async_get_setup_timeline(hass)}
+    assert "comp" in names
+    assert "comp2" not in names
@@ -54,6 +54,16 @@ def test_save_and_load():
     assert data == TEST_JSON_A
 
 
+def test_save_compact():
+    """Test saving compact JSON and loading back."""
+    fname = _path_for("test_compact")
+    save_json(fname, TEST_JSON_A, compact=True)
+    with open(fname) as fdesc:
+        assert fdesc.read() == '{"a":1,"B":"two"}'
+    data = load_json(fname)
+    assert data == TEST_JSON_A
+
+
 # Skipped on Windows
 @unittest.skipIf(
     sys.platform.startswith("win"), "private permissions not supported on Windows"